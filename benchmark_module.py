@@ -0,0 +1,250 @@
+# benchmark_module.py
+#
+# Times every main-menu report (options 7-14) and the search_module queries
+# against a local SQLite stand-in loaded with generated data, so performance
+# regressions show up before they reach the Oracle instance.
+#
+#   python benchmark_module.py --scales 0.5 1 2 --iterations 20 --output bench.json
+#   python benchmark_module.py --baseline bench.json --tolerance 1.5
+
+import argparse
+import calendar
+import json
+import math
+import re
+import sqlite3
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime
+
+import datagen_module
+import loader_module
+import script_module
+import search_module
+import sql_commands
+
+# Julian day number of 0001-01-01 minus one ordinal (SQLite julianday() convention)
+JULIAN_OFFSET = 1721424.5
+
+# Oracle date format elements understood by the stand-in TO_DATE
+DATE_FORMATS = [("YYYY", "%Y"), ("MM", "%m"), ("DD", "%d"), ("HH24", "%H"), ("MI", "%M"), ("SS", "%S")]
+
+DEFAULT_SCALES = [1]
+DEFAULT_ITERATIONS = 10
+
+# Representative search_module filters: (case name, query builder, filters)
+SEARCH_CASES = [
+    ("search_books:title", search_module.build_books_query, {"title": "shadow"}),
+    ("search_books:author", search_module.build_books_query, {"author": "smith"}),
+    ("search_books:genre", search_module.build_books_query, {"genre": "fiction"}),
+    ("search_books:published_after", search_module.build_books_query,
+     {"pub_date_operator": ">=", "pub_date_value": "2000-01-01"}),
+    ("search_books:isbn", search_module.build_books_query, {"isbn": datagen_module.isbn(1)}),
+    ("search_authors:nationality", search_module.build_authors_query, {"nationality": "british"}),
+    ("search_borrowers:limit", search_module.build_borrowers_query,
+     {"borrowing_limit_operator": ">=", "borrowing_limit_value": 5}),
+    ("search_users:city", search_module.build_users_query, {"city": "spring"}),
+    ("search_users:id", search_module.build_users_query, {"user_id": 1}),
+    ("search_administrators:role", search_module.build_administrators_query, {"role": "manager"}),
+    ("search_genres:title", search_module.build_genres_query, {"title": "fic"}),
+]
+
+
+def to_julian(value):
+    if isinstance(value, datetime):
+        return value.toordinal() + JULIAN_OFFSET + (value.hour * 3600 + value.minute * 60 + value.second) / 86400
+    if isinstance(value, date):
+        return value.toordinal() + JULIAN_OFFSET
+    return value
+
+
+def from_julian(value):
+    return date.fromordinal(int(math.floor(value - JULIAN_OFFSET)))
+
+
+def _to_date(text, fmt="YYYY-MM-DD"):
+    if text is None:
+        return None
+    pattern = fmt.upper()
+    for oracle, python in DATE_FORMATS:
+        pattern = pattern.replace(oracle, python)
+    return to_julian(datetime.strptime(text, pattern))
+
+
+def _add_months(value, months):
+    if value is None:
+        return None
+    day = from_julian(value)
+    month = day.month - 1 + int(months)
+    year = day.year + month // 12
+    month = month % 12 + 1
+    moved = date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+    return to_julian(moved) + (value - JULIAN_OFFSET) % 1
+
+
+def _trunc(value):
+    return None if value is None else math.floor(value)
+
+
+def to_sqlite(sql):
+    """
+    Rewrites the Oracle-only syntax used by the menu queries into SQLite.
+    """
+    sql = re.sub(r"FETCH\s+FIRST\s+(\d+|:\w+)\s+ROWS\s+ONLY", r"LIMIT \1", sql, flags=re.IGNORECASE)
+    sql = re.sub(r"LISTAGG\(([^()]*),\s*('[^']*')\)\s*WITHIN\s+GROUP\s*\(ORDER\s+BY[^()]*\)",
+                 r"GROUP_CONCAT(\1, \2)", sql, flags=re.IGNORECASE)
+    sql = re.sub(r"\bMINUS\b", "EXCEPT", sql, flags=re.IGNORECASE)
+    sql = re.sub(r"\bSYSDATE\b(?!\s*\()", "SYSDATE()", sql, flags=re.IGNORECASE)
+    return sql
+
+
+def standin_connection(as_of):
+    """
+    Opens an in-memory SQLite database with the library schema and the
+    Oracle functions the menu queries use. Dates are stored as Julian day
+    numbers so date arithmetic (SYSDATE - Due_Date) behaves as in Oracle.
+    """
+    connection = sqlite3.connect(":memory:")
+    now = to_julian(datetime.combine(as_of, datetime.min.time()))
+    connection.create_function("SYSDATE", 0, lambda: now, deterministic=True)
+    connection.create_function("TRUNC", 1, _trunc, deterministic=True)
+    connection.create_function("ADD_MONTHS", 2, _add_months, deterministic=True)
+    connection.create_function("TO_DATE", 2, _to_date, deterministic=True)
+    for stmt in script_module.read_statements("schema_creation.sql"):
+        connection.execute(stmt)
+    return connection
+
+
+def scaled(factor):
+    sizes = dict(datagen_module.DEFAULT_SCALE)
+    for name in ("users", "authors", "books", "loans"):
+        sizes[name] = max(1, int(round(sizes[name] * factor)))
+    return sizes
+
+
+def load(connection, factor, seed, as_of):
+    report = {}
+    for table, columns, rows in datagen_module.generate(seed=seed, as_of=as_of, **scaled(factor)):
+        julian_rows = (tuple(to_julian(v) for v in row) for row in rows)
+        loader_module.load_rows(connection, table, columns, julian_rows, report=report)
+    return {table: stats["rows"] for table, stats in report.items()}
+
+
+def cases():
+    """
+    Yields (name, kind, sql, params) for every benchmarked query.
+    """
+    for name, query in sql_commands.REPORT_QUERIES.items():
+        yield name, "report", query, {}
+    for name, build, filters in SEARCH_CASES:
+        query, params = build(**filters)
+        yield name, "search", query, params
+
+
+def percentile(values, fraction):
+    # Nearest-rank percentile of an already sorted list
+    return values[max(0, min(len(values) - 1, math.ceil(fraction * len(values)) - 1))]
+
+
+def measure(connection, sql, params, iterations):
+    sql = to_sqlite(sql)
+    connection.execute(sql, params).fetchall()  # Warm-up
+    timings = []
+    rows = 0
+    for _ in range(iterations):
+        started = time.perf_counter()
+        rows = len(connection.execute(sql, params).fetchall())
+        timings.append((time.perf_counter() - started) * 1000)
+    # Peak memory of one execution, fetch included (Python-side allocations)
+    tracemalloc.start()
+    connection.execute(sql, params).fetchall()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    timings.sort()
+    return {
+        "p50_ms": round(percentile(timings, 0.50), 3),
+        "p95_ms": round(percentile(timings, 0.95), 3),
+        "mean_ms": round(sum(timings) / len(timings), 3),
+        "rows": rows,
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def run(scales=DEFAULT_SCALES, iterations=DEFAULT_ITERATIONS, seed=42, as_of=None):
+    """
+    Runs every case at every scale factor and returns the results as a
+    JSON-serializable dict.
+    """
+    as_of = as_of or date.today()
+    results = []
+    for factor in scales:
+        connection = standin_connection(as_of)
+        started = time.perf_counter()
+        loaded = load(connection, factor, seed, as_of)
+        load_seconds = time.perf_counter() - started
+        measured = []
+        for name, kind, sql, params in cases():
+            entry = {"name": name, "kind": kind}
+            entry.update(measure(connection, sql, params, iterations))
+            measured.append(entry)
+        connection.close()
+        results.append({"scale": factor, "rows_loaded": loaded,
+                        "load_seconds": round(load_seconds, 3), "cases": measured})
+    return {
+        "engine": f"sqlite {sqlite3.sqlite_version}",
+        "as_of": as_of.isoformat(),
+        "seed": seed,
+        "iterations": iterations,
+        "results": results,
+    }
+
+
+def regressions(current, baseline, tolerance):
+    """
+    Returns one message per case whose p95 exceeds the baseline's p95 for the
+    same scale by more than `tolerance` times.
+    """
+    previous = {(r["scale"], c["name"]): c for r in baseline["results"] for c in r["cases"]}
+    found = []
+    for result in current["results"]:
+        for case in result["cases"]:
+            old = previous.get((result["scale"], case["name"]))
+            if old and old["p95_ms"] > 0 and case["p95_ms"] > old["p95_ms"] * tolerance:
+                found.append(f"scale {result['scale']} {case['name']}: p95 {old['p95_ms']}ms -> {case['p95_ms']}ms")
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the library reports and searches on a SQLite stand-in.")
+    parser.add_argument("--scales", type=float, nargs="+", default=DEFAULT_SCALES,
+                        help="Scale factors relative to datagen_module.DEFAULT_SCALE")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--as-of", type=date.fromisoformat, default=None,
+                        help="Date used as SYSDATE (YYYY-MM-DD, default today)")
+    parser.add_argument("--output", help="Write the JSON results to this file instead of stdout")
+    parser.add_argument("--baseline", help="Earlier JSON results to compare p95 latency against")
+    parser.add_argument("--tolerance", type=float, default=1.5,
+                        help="Allowed p95 slowdown factor before a case counts as a regression")
+    args = parser.parse_args(argv)
+
+    results = run(args.scales, max(1, args.iterations), args.seed, args.as_of)
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            found = regressions(results, json.load(file), args.tolerance)
+        for message in found:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        return 1 if found else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
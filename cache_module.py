@@ -0,0 +1,157 @@
+# cache_module.py
+
+import threading
+import time
+from collections import OrderedDict
+from rich.console import Console
+from rich.table import Table
+from rich import box
+
+import executor_module
+
+# Initialize Rich Console
+console = Console()
+
+# Report result cache limits
+CACHE_SIZE = 64             # Results kept (least recently used are evicted first)
+CACHE_TTL = 300             # Seconds a result stays valid (bounds drift of SYSDATE-based reports)
+MAX_CACHED_ROWS = 5000      # Larger results are streamed and never cached
+
+# Tables each main-menu report reads. A commit that writes any of them drops
+# the report's cached results.
+REPORT_TABLES = {
+    "find_top_borrowed_authors": {"AUTHORS", "BOOKAUTHOR", "LOANS"},
+    "list_overdue_loans": {"LOANS", "BORROWERS", "USERS"},
+    "find_genres_with_most_books": {"GENRES", "BOOKGENRE"},
+    "list_admins_managing_most_books": {"ADMINISTRATORS", "USERS", "BOOKS"},
+    "show_total_fines": {"ADMINISTRATORS", "USERS", "LOANS"},
+    "find_authors_no_borrowed_books": {"AUTHORS", "BOOKAUTHOR", "LOANS"},
+    "list_unique_genres": {"GENRES"},
+    "show_books_not_borrowed_last_year": {"BOOKS", "LOANS"},
+}
+
+
+class ResultCache:
+    """
+    In-process LRU cache of query results keyed by query text and binds.
+    Entries expire after `ttl` seconds and remember the tables they were
+    read from, so a write can drop exactly the entries it made stale.
+    """
+
+    def __init__(self, size=CACHE_SIZE, ttl=CACHE_TTL):
+        self.size = size
+        self.ttl = ttl
+        self._entries = OrderedDict()   # key -> (columns, rows, tables, expires at)
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0, "invalidations": 0}
+
+    @staticmethod
+    def key(query, params=None):
+        return query, tuple(sorted((params or {}).items()))
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            if time.monotonic() >= entry[3]:
+                del self._entries[key]
+                self.stats["expired"] += 1
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[0], entry[1]
+
+    def put(self, key, columns, rows, tables):
+        if self.size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (columns, rows, frozenset(t.upper() for t in tables), time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def invalidate(self, tables):
+        """
+        Drops every entry that read one of `tables`. Returns how many were dropped.
+        """
+        tables = {t.upper() for t in tables}
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if entry[2] & tables]
+            for key in stale:
+                del self._entries[key]
+            self.stats["invalidations"] += len(stale)
+        return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self.stats["invalidations"] += len(self._entries)
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Shared by every menu of this process
+report_cache = ResultCache()
+
+
+def run_report(connection, report, query, params=None):
+    """
+    Displays a report, serving it from the cache when an unexpired result for
+    the same query and binds exists. Results up to MAX_CACHED_ROWS rows are
+    cached against the report's tables; larger ones stream as usual.
+    """
+    key = ResultCache.key(query, params)
+    cached = report_cache.get(key)
+    if cached is not None:
+        columns, rows = cached
+        executor_module.render(columns, executor_module.RowSource(rows))
+        return
+    columns, cursor = executor_module.open_cursor(connection, query, params)
+    rows = cursor.fetchmany(MAX_CACHED_ROWS + 1)
+    if len(rows) <= MAX_CACHED_ROWS:
+        report_cache.put(key, columns, rows, REPORT_TABLES.get(report, ()))
+        executor_module.render(columns, executor_module.RowSource(rows))
+    else:
+        executor_module.render(columns, executor_module.RowSource(rows, cursor))
+
+
+def commit(connection, *tables):
+    """
+    Commits and then drops the cached reports that read any of `tables`.
+    """
+    connection.commit()
+    report_cache.invalidate(tables)
+
+
+def invalidate(*tables):
+    """
+    Drops the cached reports that read any of `tables`, for changes committed
+    outside cache_module.commit.
+    """
+    report_cache.invalidate(tables)
+
+
+def invalidate_all():
+    """
+    Drops every cached report, for bulk operations (scripts, loads, resets,
+    materialized view refreshes) that change data outside the write paths.
+    """
+    report_cache.clear()
+
+
+def show_cache_stats():
+    table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
+    for col in ["Cached Results", "Hits", "Misses", "Expired", "Evictions", "Invalidations", "Hit Ratio"]:
+        table.add_column(col)
+    stats = report_cache.stats
+    lookups = stats["hits"] + stats["misses"]
+    ratio = f"{stats['hits'] / lookups:.1%}" if lookups else "-"
+    table.add_row(f"{len(report_cache)}/{report_cache.size}", str(stats["hits"]), str(stats["misses"]),
+                  str(stats["expired"]), str(stats["evictions"]), str(stats["invalidations"]), ratio)
+    console.print(table)
+    console.print(f"Results expire after {report_cache.ttl}s; results over {MAX_CACHED_ROWS} rows are not cached.")
@@ -0,0 +1,158 @@
+# catalog_module.py
+
+import executor_module
+
+# Every foreign key owned by the current schema: (child table, parent table)
+FOREIGN_KEYS_QUERY = """
+SELECT C.Table_Name, P.Table_Name
+FROM User_Constraints C
+JOIN All_Constraints P ON P.Owner = C.R_Owner AND P.Constraint_Name = C.R_Constraint_Name
+WHERE C.Constraint_Type = 'R'
+"""
+
+# Enabled-or-not foreign keys with the table they live on and the table they reference
+FOREIGN_KEY_CONSTRAINTS_QUERY = """
+SELECT C.Table_Name, C.Constraint_Name, P.Table_Name, C.Status
+FROM User_Constraints C
+JOIN All_Constraints P ON P.Owner = C.R_Owner AND P.Constraint_Name = C.R_Constraint_Name
+WHERE C.Constraint_Type = 'R'
+"""
+
+# Every table owned by the current schema
+TABLES_QUERY = "SELECT Table_Name FROM User_Tables"
+
+# Columns of every index owned by the current schema, in index column order
+INDEX_COLUMNS_QUERY = """
+SELECT Table_Name, Index_Name, Column_Name
+FROM User_Ind_Columns
+ORDER BY Table_Name, Index_Name, Column_Position
+"""
+
+# Columns of every primary key, unique and foreign key constraint, with the
+# table a foreign key references
+CONSTRAINT_COLUMNS_QUERY = """
+SELECT C.Constraint_Name, C.Constraint_Type, C.Table_Name, P.Table_Name, CC.Column_Name
+FROM User_Constraints C
+JOIN User_Cons_Columns CC ON CC.Constraint_Name = C.Constraint_Name
+LEFT JOIN All_Constraints P ON P.Owner = C.R_Owner AND P.Constraint_Name = C.R_Constraint_Name
+WHERE C.Constraint_Type IN ('P', 'U', 'R')
+ORDER BY C.Constraint_Name, CC.Position
+"""
+
+# Every foreign key with its column, the table it references and its delete rule
+DELETE_RULES_QUERY = """
+SELECT C.Constraint_Name, C.Table_Name, CC.Column_Name, P.Table_Name, C.Delete_Rule
+FROM User_Constraints C
+JOIN User_Cons_Columns CC ON CC.Constraint_Name = C.Constraint_Name
+JOIN All_Constraints P ON P.Owner = C.R_Owner AND P.Constraint_Name = C.R_Constraint_Name
+WHERE C.Constraint_Type = 'R'
+"""
+
+
+def foreign_keys(connection):
+    """
+    Returns {child table: set of parent tables} for the current schema's
+    foreign keys. Self-references are left out since they do not affect
+    load order.
+    """
+    parents = {}
+    for child, parent in executor_module.fetch_all(connection, FOREIGN_KEYS_QUERY):
+        parents.setdefault(child.upper(), set())
+        if parent.upper() != child.upper():
+            parents[child.upper()].add(parent.upper())
+    return parents
+
+
+def foreign_key_constraints(connection, tables):
+    """
+    Returns (table, constraint name, status) for every foreign key that
+    references one of `tables`, i.e. the constraints that block a TRUNCATE
+    of those tables.
+    """
+    wanted = {t.upper() for t in tables}
+    return [(child, name, status)
+            for child, name, parent, status in executor_module.fetch_all(connection, FOREIGN_KEY_CONSTRAINTS_QUERY)
+            if parent.upper() in wanted]
+
+
+def user_tables(connection):
+    return [row[0].upper() for row in executor_module.fetch_all(connection, TABLES_QUERY)]
+
+
+def index_columns(connection):
+    """
+    Returns {table: {index name: [columns in index order]}} for the current
+    schema. Function-based index columns appear under their generated
+    SYS_NC names.
+    """
+    indexes = {}
+    for table, index, column in executor_module.fetch_all(connection, INDEX_COLUMNS_QUERY):
+        indexes.setdefault(table.upper(), {}).setdefault(index.upper(), []).append(column.upper())
+    return indexes
+
+
+def constraint_columns(connection):
+    """
+    Returns {constraint name: (type, table, referenced table, [columns])}
+    for the current schema's key constraints. The referenced table is None
+    except for foreign keys.
+    """
+    constraints = {}
+    for name, kind, table, parent, column in executor_module.fetch_all(connection, CONSTRAINT_COLUMNS_QUERY):
+        entry = constraints.setdefault(name.upper(), (kind, table.upper(), parent.upper() if parent else None, []))
+        entry[3].append(column.upper())
+    return constraints
+
+
+def delete_rules(connection):
+    """
+    Returns {(child table, column, parent table): (constraint name, delete
+    rule)} for the current schema's single-column foreign keys.
+    """
+    rules = {}
+    for name, child, column, parent, rule in executor_module.fetch_all(connection, DELETE_RULES_QUERY):
+        rules[(child.upper(), column.upper(), parent.upper())] = (name, rule)
+    return rules
+
+
+def dependency_tiers(tables, parents):
+    """
+    Groups `tables` into tiers so that every table comes after the tables it
+    references. Tables in the same tier do not depend on each other and can
+    be loaded at the same time. Tables caught in a foreign key cycle are put
+    together in a final tier.
+    """
+    tables = [t.upper() for t in tables]
+    wanted = set(tables)
+    remaining = {t: {p for p in parents.get(t, ()) if p in wanted} for t in tables}
+    tiers = []
+    while remaining:
+        ready = [t for t in tables if t in remaining and not remaining[t]]
+        if not ready:
+            # Cycle: nothing left can go first
+            tiers.append([t for t in tables if t in remaining])
+            break
+        tiers.append(ready)
+        for t in ready:
+            del remaining[t]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+    return tiers
+
+
+def load_tiers(connection, tables=None):
+    """
+    Returns the dependency tiers for `tables` (default: every user table),
+    parents first, as read from the schema's foreign key constraints.
+    """
+    if tables is None:
+        tables = user_tables(connection)
+    return dependency_tiers(tables, foreign_keys(connection))
+
+
+def child_first_order(connection, tables=None):
+    """
+    Returns `tables` ordered so that referencing tables come before the
+    tables they reference, the order in which their rows can be removed.
+    """
+    return [t for tier in reversed(load_tiers(connection, tables)) for t in tier]
@@ -0,0 +1,459 @@
+# circulation_module.py
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import cx_Oracle
+from rich.console import Console
+from rich.table import Table
+from rich import box
+
+import cache_module
+import executor_module
+import id_module
+import pool_module
+
+# Initialize Rich Console
+console = Console()
+
+# Fine charged per day a loan is returned late (the rate the synthetic data uses)
+FINE_PER_DAY = 0.25
+
+# Loans closed per array UPDATE and commit in bulk returns
+RETURN_BATCH_SIZE = 500
+
+# Checkout stress test defaults
+STRESS_ISBN = "STRESS-CHECKOUT"
+STRESS_COPIES = 5
+STRESS_ATTEMPTS = 200
+STRESS_WORKERS = 16
+STRESS_RETURN_RATE = 0.5    # Share of successful checkouts returned again during the run
+
+# Takes a copy only if one is left; the row lock it takes is held to commit
+TAKE_COPY_QUERY = """
+UPDATE Books
+SET Copies_Available = Copies_Available - 1
+WHERE ISBN = :isbn AND Copies_Available > 0
+"""
+
+# Gives back the copies held by the open loans with Loans.{column} = :key,
+# for deletes that remove loans without returning them
+RELEASE_COPIES_QUERY = """
+UPDATE Books B
+SET Copies_Available = Copies_Available + (SELECT COUNT(*) FROM Loans L
+                                           WHERE L.ISBN = B.ISBN AND L.Return_Status = 'N' AND L.{column} = :key)
+WHERE ISBN IN (SELECT ISBN FROM Loans WHERE Return_Status = 'N' AND {column} = :key)
+"""
+
+RETURN_COPY_QUERY = "UPDATE Books SET Copies_Available = Copies_Available + 1 WHERE ISBN = :isbn"
+
+# A whole checkout in one round trip. Locks the borrower row (serializing
+# checkouts for one borrower without blocking anyone else's), counts their
+# open loans through the IX_Loans_Open_Borrower_ID index, takes a copy only
+# if one is left and inserts the loan. A loan number left empty is drawn
+# from Loans_Seq. Sets :reason when the checkout is refused, leaving the
+# rollback to the caller, and :new_id to the loan number otherwise.
+CHECKOUT_BLOCK = """
+DECLARE
+    v_limit Borrowers.Borrowing_Limit%TYPE;
+    v_open NUMBER;
+BEGIN
+    :reason := NULL;
+    BEGIN
+        SELECT Borrowing_Limit INTO v_limit FROM Borrowers WHERE Borrower_ID = :borrower_id FOR UPDATE;
+    EXCEPTION
+        WHEN NO_DATA_FOUND THEN
+            :reason := 'no_borrower';
+            RETURN;
+    END;
+    SELECT COUNT(*) INTO v_open
+    FROM Loans
+    WHERE CASE WHEN Return_Status = 'N' THEN Borrower_ID END = :borrower_id;
+    IF v_limit IS NOT NULL AND v_open >= v_limit THEN
+        :reason := 'limit';
+        RETURN;
+    END IF;
+    UPDATE Books
+    SET Copies_Available = Copies_Available - 1
+    WHERE ISBN = :isbn AND Copies_Available > 0;
+    IF SQL%ROWCOUNT = 0 THEN
+        SELECT CASE COUNT(*) WHEN 0 THEN 'no_book' ELSE 'unavailable' END INTO :reason
+        FROM Books
+        WHERE ISBN = :isbn;
+        RETURN;
+    END IF;
+    INSERT INTO Loans (Loan_Number, Borrower_ID, ISBN, Loan_Date, Due_Date, Return_Status, Admin_ID)
+    VALUES (NVL(:loan_number, Loans_Seq.NEXTVAL), :borrower_id, :isbn,
+            NVL(TO_DATE(:loan_date, 'YYYY-MM-DD'), TRUNC(SYSDATE)), TO_DATE(:due_date, 'YYYY-MM-DD'), 'N', :admin_id)
+    RETURNING Loan_Number INTO :new_id;
+END;
+"""
+
+# Messages of the checkout refusals CHECKOUT_BLOCK reports
+CHECKOUT_REFUSALS = {
+    "no_borrower": "Borrower ID {borrower_id} does not exist.",
+    "limit": "Borrower ID {borrower_id} has reached their borrowing limit.",
+    "no_book": "ISBN {isbn} does not exist.",
+    "unavailable": "No copies of ISBN {isbn} are available.",
+}
+
+CLOSE_LOAN_QUERY = """
+UPDATE Loans
+SET Return_Status = 'Y',
+    Return_Date = NVL(TO_DATE(:return_date, 'YYYY-MM-DD'), TRUNC(SYSDATE))
+WHERE Loan_Number = :loan_number AND Return_Status = 'N'
+RETURNING ISBN INTO :isbn
+"""
+
+# Closes one open loan per array row, identified by loan number or, for a
+# scanned book, the open loan of that ISBN that is due first. Later rows of
+# the same array see the loans closed by earlier ones, so an ISBN scanned
+# twice closes two loans.
+BULK_RETURN_QUERIES = {
+    "loan": """
+        UPDATE Loans
+        SET Return_Status = 'Y',
+            Return_Date = TRUNC(SYSDATE),
+            Fine_Amount = NVL(Fine_Amount, 0) + ROUND(GREATEST(TRUNC(SYSDATE) - TRUNC(Due_Date), 0) * {rate}, 2)
+        WHERE Loan_Number = :1 AND Return_Status = 'N'
+        RETURNING ISBN, ROUND(GREATEST(TRUNC(SYSDATE) - TRUNC(Due_Date), 0) * {rate}, 2) INTO :2, :3
+    """,
+    "isbn": """
+        UPDATE Loans
+        SET Return_Status = 'Y',
+            Return_Date = TRUNC(SYSDATE),
+            Fine_Amount = NVL(Fine_Amount, 0) + ROUND(GREATEST(TRUNC(SYSDATE) - TRUNC(Due_Date), 0) * {rate}, 2)
+        WHERE Loan_Number = (SELECT MIN(Loan_Number) KEEP (DENSE_RANK FIRST ORDER BY Due_Date)
+                             FROM Loans
+                             WHERE ISBN = :1 AND Return_Status = 'N')
+        RETURNING ISBN, ROUND(GREATEST(TRUNC(SYSDATE) - TRUNC(Due_Date), 0) * {rate}, 2) INTO :2, :3
+    """,
+}
+
+RETURN_COPIES_QUERY = "UPDATE Books SET Copies_Available = Copies_Available + :1 WHERE ISBN = :2"
+
+
+class CirculationRefused(ValueError):
+    """
+    Raised when a checkout or return is refused. `reason` is one of
+    "no_borrower", "limit", "no_book", "unavailable" or "not_open".
+    """
+
+    def __init__(self, reason, message):
+        super().__init__(message)
+        self.reason = reason
+
+
+def checkout(connection, loan_number, borrower_id, isbn, admin_id, due_date, loan_date=None):
+    """
+    Lends a copy of `isbn` in one short transaction and two round trips
+    (CHECKOUT_BLOCK and the commit): the borrower row is locked, the open
+    loans are counted against Borrowing_Limit, a copy is taken with a
+    conditional UPDATE (so Copies_Available never goes below zero, however
+    many desks check out at once) and the loan is inserted. Only the
+    borrower and book rows are locked, always in that order.
+    A `loan_number` of None takes the next number from Loans_Seq.
+    Returns the loan number. Raises CirculationRefused, after rolling back,
+    when the checkout is not allowed.
+    """
+    # Syncing the sequence may run DDL, which commits, so it goes first
+    id_module.ensure(connection, "LOANS")
+    cursor = connection.cursor()
+    try:
+        reason = cursor.var(cx_Oracle.STRING)
+        new_id = cursor.var(cx_Oracle.NUMBER)
+        cursor.execute(CHECKOUT_BLOCK, loan_number=loan_number, borrower_id=borrower_id, isbn=isbn,
+                       loan_date=loan_date, due_date=due_date, admin_id=admin_id, reason=reason, new_id=new_id)
+        if reason.getvalue() is not None:
+            raise CirculationRefused(reason.getvalue(),
+                                     CHECKOUT_REFUSALS[reason.getvalue()].format(borrower_id=borrower_id, isbn=isbn))
+        cache_module.commit(connection, "LOANS", "BOOKS")
+        if loan_number:
+            # Loans_Seq may not be past a typed loan number yet
+            id_module.forget_table("LOANS")
+        return int(new_id.getvalue())
+    except (CirculationRefused, cx_Oracle.DatabaseError):
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def release_copies(connection, column, keys):
+    """
+    Adds the copies of the open loans whose `column` ("Loan_Number",
+    "Borrower_ID" or "ISBN") is one of `keys` back to Copies_Available, with
+    one array UPDATE. Call in the transaction that deletes those loans,
+    before the DELETE, so Copies_Available keeps matching the open loans.
+    Does not commit.
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.executemany(RELEASE_COPIES_QUERY.format(column=column), [{"key": key} for key in keys])
+    finally:
+        cursor.close()
+
+
+def return_loan(connection, loan_number, return_date=None):
+    """
+    Closes an open loan and gives its copy back in one transaction. Returns
+    the ISBN. Raises CirculationRefused when the loan is not open.
+    """
+    cursor = connection.cursor()
+    try:
+        isbn = cursor.var(cx_Oracle.STRING)
+        cursor.execute(CLOSE_LOAN_QUERY, loan_number=loan_number, return_date=return_date, isbn=isbn)
+        if cursor.rowcount == 0:
+            raise CirculationRefused("not_open", f"Loan Number {loan_number} does not exist or is already returned.")
+        value = isbn.getvalue()
+        value = value[0] if isinstance(value, list) else value
+        cursor.execute(RETURN_COPY_QUERY, isbn=value)
+        cache_module.commit(connection, "LOANS", "BOOKS")
+        return value
+    except (CirculationRefused, cx_Oracle.DatabaseError):
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def scanned_codes(lines, stop_at_blank=True):
+    """
+    Yields the codes of a scanner or file stream: one or more per line,
+    separated by spaces or commas. With stop_at_blank an empty line ends
+    the stream, so a scanner session at the terminal ends with Enter on its
+    own; files skip blank lines instead.
+    """
+    for line in lines:
+        codes = line.replace(",", " ").split()
+        if not codes and stop_at_blank:
+            return
+        yield from codes
+
+
+def _return_batch(connection, kind, codes, report):
+    cursor = connection.cursor()
+    try:
+        isbns = cursor.var(cx_Oracle.STRING, arraysize=len(codes))
+        fines = cursor.var(cx_Oracle.NUMBER, arraysize=len(codes))
+        cursor.setinputsizes(None, isbns, fines)
+        cursor.executemany(BULK_RETURN_QUERIES[kind].format(rate=FINE_PER_DAY),
+                           [(code,) for code in codes], arraydmlrowcounts=True)
+        copies = {}
+        for position, (code, count) in enumerate(zip(codes, cursor.getarraydmlrowcounts())):
+            if count == 0:
+                report["not_open"].append(code)
+                continue
+            isbn = isbns.getvalue(position)[0]
+            copies[isbn] = copies.get(isbn, 0) + 1
+            report["fines"] += float(fines.getvalue(position)[0] or 0)
+            report["returned"] += 1
+        if copies:
+            cursor.executemany(RETURN_COPIES_QUERY, [(count, isbn) for isbn, count in copies.items()])
+        cache_module.commit(connection, "LOANS", "BOOKS")
+        report["batches"] += 1
+    except cx_Oracle.DatabaseError:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def bulk_return(connection, codes, kind="loan", batch_size=RETURN_BATCH_SIZE, progress=None):
+    """
+    Returns the loans behind a stream of loan numbers (kind "loan") or
+    scanned ISBNs (kind "isbn"): each batch of `batch_size` codes closes its
+    loans with one array UPDATE that sets Return_Date, Return_Status and the
+    late fine, gives the copies back with one array UPDATE of Books and
+    commits, so a batch costs three round trips. `progress`, if given, is
+    called with the report after every batch.
+    Returns {"returned", "not_open" (codes with no open loan), "fines"
+    (charged by these returns), "batches", "seconds"}.
+    """
+    report = {"returned": 0, "not_open": [], "fines": 0.0, "batches": 0, "seconds": 0.0}
+    started = time.perf_counter()
+    batch = []
+    for code in codes:
+        if kind == "loan":
+            if not code.isdigit():
+                report["not_open"].append(code)
+                continue
+            code = int(code)
+        batch.append(code)
+        if len(batch) >= batch_size:
+            _return_batch(connection, kind, batch, report)
+            batch = []
+            report["seconds"] = time.perf_counter() - started
+            if progress is not None:
+                progress(report)
+    if batch:
+        _return_batch(connection, kind, batch, report)
+    report["seconds"] = time.perf_counter() - started
+    return report
+
+
+def show_return_report(report):
+    table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
+    for col in ["Returned", "No Open Loan", "Fines Charged", "Batches", "Seconds", "Returns/s"]:
+        table.add_column(col)
+    rate = report["returned"] / report["seconds"] if report["seconds"] else 0
+    table.add_row(str(report["returned"]), str(len(report["not_open"])), f"{report['fines']:.2f}",
+                  str(report["batches"]), f"{report['seconds']:.2f}", f"{rate:.0f}")
+    console.print(table)
+    if report["not_open"]:
+        console.print(f"[yellow]No open loan for: {', '.join(str(c) for c in report['not_open'])}[/yellow]")
+
+
+def _stress_attempt(pool, loan_number, borrower_id, admin_id, due_date, seed, outcomes, lock):
+    # Runs on a worker thread with its own pooled session
+    chooser = random.Random(seed)
+    with pool.session() as session:
+        try:
+            checkout(session, loan_number, borrower_id, STRESS_ISBN, admin_id, due_date)
+            outcome = "checked out"
+            if chooser.random() < STRESS_RETURN_RATE:
+                return_loan(session, loan_number)
+                outcome = "checked out and returned"
+        except CirculationRefused as e:
+            outcome = f"refused: {e.reason}"
+        except cx_Oracle.DatabaseError as e:
+            error, = e.args
+            outcome = f"error: ORA-{error.code:05d}"
+    with lock:
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+
+def stress_checkout(connection, copies=STRESS_COPIES, attempts=STRESS_ATTEMPTS, workers=STRESS_WORKERS, seed=42):
+    """
+    Races `attempts` checkouts (about half of them returned again straight
+    away) of a scratch book with `copies` copies across `workers` sessions,
+    then checks that the book was never oversold: Copies_Available is not
+    negative and equals `copies` minus the loans still open. The scratch
+    book and its loans are removed afterwards.
+    Returns (outcome counts, checks [(check, passed, detail)], seconds).
+    Raises ValueError when the test cannot run.
+    """
+    if not isinstance(connection, pool_module.PooledConnection):
+        raise ValueError("The stress test needs a pooled connection.")
+    admin_id = executor_module.fetch_one(connection, "SELECT MIN(Admin_ID) FROM Administrators")[0]
+    borrowers = [row[0] for row in executor_module.fetch_all(connection, "SELECT Borrower_ID FROM Borrowers")]
+    if admin_id is None or not borrowers:
+        raise ValueError("The stress test needs at least one administrator and one borrower.")
+
+    _remove_scratch_book(connection)
+    executor_module.execute(connection, """
+        INSERT INTO Books (ISBN, Title, Copies_Available, Admin_ID)
+        VALUES (:isbn, 'Checkout stress test', :copies, :admin_id)
+    """, isbn=STRESS_ISBN, copies=copies, admin_id=admin_id)
+    cache_module.commit(connection, "BOOKS")
+    # One round trip reserves a loan number for every attempt
+    loan_numbers = id_module.reserve(connection, "LOANS", attempts)
+    due_date = time.strftime("%Y-%m-%d", time.localtime(time.time() + 14 * 86400))
+    # The workers need the pool's sessions, including the one held here
+    pool_module.release_session(connection)
+
+    chooser = random.Random(seed)
+    outcomes = {}
+    lock = threading.Lock()
+    pool = connection.pool.clone(workers)
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_stress_attempt, pool, loan_numbers[i], chooser.choice(borrowers),
+                                       admin_id, due_date, chooser.random(), outcomes, lock)
+                       for i in range(attempts)]
+            for future in futures:
+                future.result()
+    finally:
+        pool.close()
+    seconds = time.perf_counter() - started
+
+    try:
+        available = executor_module.fetch_one(connection, "SELECT Copies_Available FROM Books WHERE ISBN = :isbn",
+                                              isbn=STRESS_ISBN)[0]
+        recorded, still_open = executor_module.fetch_one(connection, """
+            SELECT COUNT(*), COUNT(CASE WHEN Return_Status = 'N' THEN 1 END) FROM Loans WHERE ISBN = :isbn
+        """, isbn=STRESS_ISBN)
+        lent = sum(count for outcome, count in outcomes.items() if outcome.startswith("checked out"))
+        returned = outcomes.get("checked out and returned", 0)
+        checks = [
+            ("Copies_Available never below zero", available >= 0, f"{available} left"),
+            ("Open loans within the copies", still_open <= copies, f"{still_open} open of {copies}"),
+            ("Copies_Available matches open loans", available + still_open == copies,
+             f"{available} + {still_open} = {available + still_open}"),
+            ("One loan per successful checkout", recorded == lent and still_open == lent - returned,
+             f"{recorded} loans for {lent} checkouts, {returned} returned"),
+        ]
+    finally:
+        _remove_scratch_book(connection)
+        cache_module.commit(connection, "LOANS", "BOOKS")
+    return outcomes, checks, seconds
+
+
+def _remove_scratch_book(connection):
+    executor_module.execute(connection, "DELETE FROM Loans WHERE ISBN = :isbn", isbn=STRESS_ISBN)
+    executor_module.execute(connection, "DELETE FROM Books WHERE ISBN = :isbn", isbn=STRESS_ISBN)
+
+
+def show_stress_report(outcomes, checks, seconds):
+    table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
+    for col in ["Outcome", "Attempts"]:
+        table.add_column(col)
+    for outcome, count in sorted(outcomes.items()):
+        table.add_row(outcome, str(count))
+    console.print(table)
+    table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
+    for col in ["Check", "Result", "Detail"]:
+        table.add_column(col)
+    for check, passed, detail in checks:
+        table.add_row(check, "[green]pass[/green]" if passed else "[red]FAIL[/red]", detail)
+    console.print(table)
+    console.print(f"{sum(outcomes.values())} attempts in {seconds:.2f}s.")
+
+
+def main(argv=None):
+    """
+    Runs the checkout stress test against a test schema and exits non-zero
+    when a check fails, so the no-oversell guarantee can be checked in CI:
+
+        LIBRARY_DB_PASSWORD=... python circulation_module.py --user test --dsn host:1521/service
+    """
+    parser = argparse.ArgumentParser(description="Race concurrent checkouts of a scratch book and check it is never oversold.")
+    parser.add_argument("--user", required=True)
+    parser.add_argument("--dsn", required=True, help="Oracle connect string, e.g. host:1521/service")
+    parser.add_argument("--password", default=os.environ.get("LIBRARY_DB_PASSWORD"),
+                        help="Defaults to the LIBRARY_DB_PASSWORD environment variable")
+    parser.add_argument("--copies", type=int, default=STRESS_COPIES)
+    parser.add_argument("--attempts", type=int, default=STRESS_ATTEMPTS)
+    parser.add_argument("--workers", type=int, default=STRESS_WORKERS)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+    if args.password is None:
+        parser.error("no password given (--password or LIBRARY_DB_PASSWORD)")
+
+    def connect():
+        return cx_Oracle.connect(user=args.user, password=args.password, dsn=args.dsn, threaded=True)
+
+    connection = pool_module.PooledConnection(pool_module.SessionPool(connect))
+    try:
+        outcomes, checks, seconds = stress_checkout(connection, max(1, args.copies), max(1, args.attempts),
+                                                    max(1, args.workers), args.seed)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        return 2
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        console.print(f"[red]Stress test failed: {error.message}[/red]")
+        return 2
+    finally:
+        connection.close()
+    show_stress_report(outcomes, checks, seconds)
+    return 0 if all(passed for check, passed, detail in checks) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
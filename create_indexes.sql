@@ -0,0 +1,40 @@
+-- create_indexes.sql
+-- Indexes on the foreign key and filter columns used by the reports, the
+-- search menu and the delete paths. Oracle indexes primary and unique keys
+-- automatically but not foreign keys, so without these every join from a
+-- parent to its children, and every parent delete (which checks the child
+-- table for referencing rows), reads the whole child table.
+
+-- ========================
+-- Foreign Key Indexes
+-- ========================
+
+CREATE INDEX IX_Loans_Borrower_ID ON Loans (Borrower_ID);
+
+CREATE INDEX IX_Loans_ISBN ON Loans (ISBN);
+
+CREATE INDEX IX_Loans_Admin_ID ON Loans (Admin_ID);
+
+CREATE INDEX IX_Books_Admin_ID ON Books (Admin_ID);
+
+-- The ISBN column makes joins from Authors/Genres to Books index-only
+CREATE INDEX IX_BookAuthor_Author_ID ON BookAuthor (Author_ID, ISBN);
+
+CREATE INDEX IX_BookGenre_Genre_ID ON BookGenre (Genre_ID, ISBN);
+
+-- ========================
+-- Filter Column Indexes
+-- ========================
+
+-- Open loans only. A B-tree index stores no entry when every indexed
+-- expression is NULL, so these hold just the unreturned loans and stay as
+-- small as the live set however long the loan history grows. Queries use
+-- them only when they repeat the exact CASE expression.
+CREATE INDEX IX_Loans_Open_Due_Date ON Loans (CASE WHEN Return_Status = 'N' THEN Due_Date END);
+
+CREATE INDEX IX_Loans_Open_Borrower_ID ON Loans (CASE WHEN Return_Status = 'N' THEN Borrower_ID END);
+
+-- Books not borrowed in the last year: answered from the index alone
+CREATE INDEX IX_Loans_Loan_Date ON Loans (Loan_Date, ISBN);
+
+CREATE INDEX IX_Books_Publication_Date ON Books (Publication_Date);
@@ -0,0 +1,107 @@
+-- create_materialized_views.sql
+-- Materialized versions of the reporting views, kept current by fast refresh.
+-- Fast refresh reads the changes recorded in the materialized view logs, so
+-- each refresh touches only the rows changed since the last one instead of
+-- re-running the joins over Loans. Only MV_OpenLoans refreshes on commit,
+-- since the overdue report must not list returned loans; an ON COMMIT view
+-- adds its refresh to every commit that touches its tables. The aggregate
+-- views refresh on demand (Tools > Materialized View Status & Refresh), and their reports
+-- say when they are stale.
+
+-- ========================
+-- Materialized View Logs
+-- ========================
+
+CREATE MATERIALIZED VIEW LOG ON Loans
+    WITH ROWID, SEQUENCE (Loan_Number, Borrower_ID, ISBN, Due_Date, Return_Status)
+    INCLUDING NEW VALUES;
+
+CREATE MATERIALIZED VIEW LOG ON Authors
+    WITH ROWID, SEQUENCE (Author_ID, Name)
+    INCLUDING NEW VALUES;
+
+CREATE MATERIALIZED VIEW LOG ON BookAuthor
+    WITH ROWID, SEQUENCE (ISBN, Author_ID)
+    INCLUDING NEW VALUES;
+
+CREATE MATERIALIZED VIEW LOG ON Genres
+    WITH ROWID, SEQUENCE (Genre_ID, Title)
+    INCLUDING NEW VALUES;
+
+CREATE MATERIALIZED VIEW LOG ON BookGenre
+    WITH ROWID, SEQUENCE (ISBN, Genre_ID)
+    INCLUDING NEW VALUES;
+
+CREATE MATERIALIZED VIEW LOG ON Borrowers
+    WITH ROWID, SEQUENCE (Borrower_ID, User_ID)
+    INCLUDING NEW VALUES;
+
+CREATE MATERIALIZED VIEW LOG ON Users
+    WITH ROWID, SEQUENCE (User_ID, First_Name, Last_Name)
+    INCLUDING NEW VALUES;
+
+-- ========================
+-- Materialized Views
+-- ========================
+
+-- Loan counts per author (ViewTopBorrowedAuthors).
+-- Fast-refreshable aggregate joins need COUNT(*) and the pre-ANSI join syntax.
+CREATE MATERIALIZED VIEW MV_TopBorrowedAuthors
+    BUILD IMMEDIATE
+    REFRESH FAST ON DEMAND
+AS
+SELECT
+    A.Author_ID,
+    A.Name AS Author_Name,
+    COUNT(*) AS Row_Count,
+    COUNT(L.Loan_Number) AS Borrow_Count
+FROM
+    Authors A, BookAuthor BA, Loans L
+WHERE
+    A.Author_ID = BA.Author_ID
+    AND BA.ISBN = L.ISBN
+GROUP BY
+    A.Author_ID, A.Name;
+
+-- Book counts per genre (ViewGenreBookCount).
+-- HAVING is not fast-refreshable, so every genre is kept and the report filters.
+CREATE MATERIALIZED VIEW MV_GenreBookCount
+    BUILD IMMEDIATE
+    REFRESH FAST ON DEMAND
+AS
+SELECT
+    G.Genre_ID,
+    G.Title AS Genre_Title,
+    COUNT(*) AS Row_Count,
+    COUNT(BG.ISBN) AS Number_of_Books
+FROM
+    Genres G, BookGenre BG
+WHERE
+    G.Genre_ID = BG.Genre_ID
+GROUP BY
+    G.Genre_ID, G.Title;
+
+-- Unreturned loans with the borrower's name (ViewOverdueLoans).
+-- SYSDATE cannot appear in a materialized view, so the report applies
+-- Due_Date < SYSDATE and computes Days_Overdue when it reads this view.
+-- Refreshed on commit so a returned loan disappears immediately.
+CREATE MATERIALIZED VIEW MV_OpenLoans
+    BUILD IMMEDIATE
+    REFRESH FAST ON COMMIT
+AS
+SELECT
+    L.ROWID AS Loan_RID,
+    BR.ROWID AS Borrower_RID,
+    U.ROWID AS User_RID,
+    BR.Borrower_ID,
+    U.First_Name,
+    U.Last_Name,
+    L.Loan_Number,
+    L.Due_Date,
+    L.Return_Status
+FROM
+    Loans L, Borrowers BR, Users U
+WHERE
+    L.Borrower_ID = BR.Borrower_ID
+    AND BR.User_ID = U.User_ID
+    AND L.Return_Status = 'N';
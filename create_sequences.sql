@@ -0,0 +1,19 @@
+-- create_sequences.sql
+-- Key generators for the tables whose primary key is a plain number. The
+-- menus insert NVL(:id, <sequence>.NEXTVAL) and read the key back with
+-- RETURNING ... INTO, so a new row needs no "is this ID taken?" query and
+-- two desks can never pick the same ID. CACHE keeps NEXTVAL off the data
+-- dictionary; the client moves a sequence past keys loaded by scripts
+-- before first use (id_module.ensure).
+
+CREATE SEQUENCE Users_Seq START WITH 1 INCREMENT BY 1 CACHE 100;
+
+CREATE SEQUENCE Borrowers_Seq START WITH 1 INCREMENT BY 1 CACHE 100;
+
+CREATE SEQUENCE Administrators_Seq START WITH 1 INCREMENT BY 1 CACHE 100;
+
+CREATE SEQUENCE Authors_Seq START WITH 1 INCREMENT BY 1 CACHE 100;
+
+CREATE SEQUENCE Genres_Seq START WITH 1 INCREMENT BY 1 CACHE 100;
+
+CREATE SEQUENCE Loans_Seq START WITH 1 INCREMENT BY 1 CACHE 1000;
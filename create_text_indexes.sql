@@ -0,0 +1,18 @@
+-- create_text_indexes.sql
+-- Oracle Text CONTEXT indexes for the book and author searches. A CONTEXT
+-- index maps each word to the rows containing it, so a word search reads
+-- only the matching rows instead of scanning every title with LIKE '%...%',
+-- and CONTAINS ... SCORE ranks the matches by relevance. The indexes are
+-- synchronized by text_module after each add, update or delete.
+
+CREATE INDEX TX_Books_Title ON Books (Title)
+    INDEXTYPE IS CTXSYS.CONTEXT PARAMETERS ('SYNC (MANUAL)');
+
+CREATE INDEX TX_Books_Publisher ON Books (Publisher)
+    INDEXTYPE IS CTXSYS.CONTEXT PARAMETERS ('SYNC (MANUAL)');
+
+CREATE INDEX TX_Authors_Name ON Authors (Name)
+    INDEXTYPE IS CTXSYS.CONTEXT PARAMETERS ('SYNC (MANUAL)');
+
+CREATE INDEX TX_Genres_Title ON Genres (Title)
+    INDEXTYPE IS CTXSYS.CONTEXT PARAMETERS ('SYNC (MANUAL)');
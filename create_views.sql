@@ -29,8 +29,7 @@ JOIN
 JOIN
     Users U ON BR.User_ID = U.User_ID
 WHERE
-    L.Return_Status = 'N'
-    AND L.Due_Date < SYSDATE;
+    CASE WHEN L.Return_Status = 'N' THEN L.Due_Date END < SYSDATE;
 
 CREATE OR REPLACE VIEW ViewGenreBookCount AS
 SELECT
@@ -0,0 +1,287 @@
+# datagen_module.py
+
+import csv
+import os
+import random
+from bisect import bisect
+from datetime import date, timedelta
+
+import loader_module
+
+# Default scale: enough rows for the reports to do real work
+DEFAULT_SCALE = {
+    "users": 1000,
+    "authors": 200,
+    "genres": 20,
+    "books": 2000,
+    "loans": 20000,
+}
+
+ADMIN_RATIO = 0.01          # Share of users that are also administrators
+OVERDUE_RATIO = 0.08        # Share of past-due loans never returned
+LATE_RETURN_RATIO = 0.15    # Share of returned loans brought back after the due date
+ZIPF_EXPONENT = 1.1         # Skew of book (and author) popularity
+LOAN_DAYS = 14              # Loan period
+HISTORY_DAYS = 730          # Loans are spread over this many days before the as-of date
+FINE_PER_DAY = 0.25
+
+# Multi-author and multi-genre books: (count, weight)
+AUTHORS_PER_BOOK = [(1, 80), (2, 15), (3, 5)]
+GENRES_PER_BOOK = [(1, 60), (2, 30), (3, 10)]
+
+# Column lists in load order (parents before children)
+TABLE_COLUMNS = {
+    "Users": ["User_ID", "First_Name", "Last_Name", "Phone_Number", "Email", "Username",
+              "Password", "Street", "City", "State", "ZIP_Code"],
+    "Administrators": ["Admin_ID", "User_ID", "Role", "Permissions", "Last_Login"],
+    "Borrowers": ["Borrower_ID", "User_ID", "Borrowing_Limit", "Amount_Payable"],
+    "Authors": ["Author_ID", "Name", "Biography", "Date_of_Birth", "Nationality", "Languages"],
+    "Genres": ["Genre_ID", "Title", "Description"],
+    "Books": ["ISBN", "Title", "Publication_Date", "Pages", "Copies_Available", "Publisher", "Admin_ID"],
+    "BookAuthor": ["ISBN", "Author_ID"],
+    "BookGenre": ["ISBN", "Genre_ID"],
+    "Loans": ["Loan_Number", "Borrower_ID", "ISBN", "Loan_Date", "Due_Date", "Return_Date",
+              "Fine_Amount", "Return_Status", "Admin_ID"],
+}
+
+FIRST_NAMES = ["John", "Jane", "Alice", "Bob", "Sara", "Liam", "Olivia", "Noah", "Emma", "Ava",
+               "Lucas", "Mia", "Ethan", "Zoe", "Omar", "Priya", "Chen", "Fatima", "Mateo", "Yuki"]
+LAST_NAMES = ["Doe", "Smith", "Johnson", "Brown", "Connor", "Garcia", "Nguyen", "Patel", "Kim", "Silva",
+              "Rossi", "Muller", "Dubois", "Tanaka", "Okafor", "Cohen", "Singh", "Lopez", "Ivanov", "Walsh"]
+CITIES = [("Springfield", "IL"), ("Lincoln", "NE"), ("Madison", "WI"), ("Columbus", "OH"),
+          ("Los Angeles", "CA"), ("Austin", "TX"), ("Denver", "CO"), ("Portland", "OR")]
+STREETS = ["Elm St", "Oak Ave", "Pine Rd", "Maple St", "Cedar Ln", "Birch Blvd", "Lake Dr"]
+NATIONALITIES = [("British", "English"), ("American", "English"), ("French", "French"),
+                 ("Swedish", "Swedish"), ("Japanese", "Japanese"), ("Nigerian", "English")]
+GENRE_NAMES = ["Fiction", "Science Fiction", "Mystery", "Fantasy", "Romance", "Thriller", "Horror",
+               "Biography", "History", "Poetry", "Drama", "Adventure", "Philosophy", "Science",
+               "Travel", "Children", "Young Adult", "Classics", "Humor", "Self-Help"]
+TITLE_WORDS = ["Shadow", "River", "Empire", "Garden", "Silent", "Winter", "Crown", "Glass", "Storm",
+               "Memory", "Iron", "Hidden", "Golden", "Last", "Broken", "Night", "Ocean", "Fire"]
+PUBLISHERS = ["Bloomsbury", "Penguin", "Gnome Press", "Crown Publishing Group", "Chilton Books",
+              "Secker and Warburg", "Norstedts Forlag", "HarperCollins", "Tor Books"]
+
+
+def isbn(index):
+    return f"978-{index:010d}"
+
+
+def _cumulative(weights):
+    total = 0
+    cum = []
+    for weight in weights:
+        total += weight
+        cum.append(total)
+    return cum
+
+
+class _Zipf:
+    """
+    Draws 1..n with probability proportional to 1 / rank ** s. Ranks are
+    shuffled so the most popular ids are spread over the whole id range.
+    """
+
+    def __init__(self, rng, n, s):
+        self.rng = rng
+        self.cum = _cumulative(1.0 / rank ** s for rank in range(1, n + 1))
+        self.ids = list(range(1, n + 1))
+        rng.shuffle(self.ids)
+
+    def draw(self):
+        return self.ids[bisect(self.cum, self.rng.random() * self.cum[-1])]
+
+
+def _pick_count(rng, choices):
+    counts = [c for c, _ in choices]
+    return rng.choices(counts, weights=[w for _, w in choices])[0]
+
+
+def _users(rng, scale):
+    for user_id in range(1, scale["users"] + 1):
+        first = rng.choice(FIRST_NAMES)
+        last = rng.choice(LAST_NAMES)
+        city, state = rng.choice(CITIES)
+        yield (user_id, first, last, f"{rng.randint(200, 999)}-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+               f"{first}.{last}{user_id}@example.com".lower(), f"{first}{last}{user_id}".lower(),
+               f"pass{rng.randint(100000, 999999)}", f"{rng.randint(1, 9999)} {rng.choice(STREETS)}",
+               city, state, f"{rng.randint(10000, 99999)}")
+
+
+def _administrators(rng, scale, as_of):
+    for admin_id in range(1, _admin_count(scale) + 1):
+        role = "Library Manager" if admin_id == 1 else "Assistant Manager"
+        yield (admin_id, admin_id, role, "ALL" if admin_id == 1 else "READ, WRITE",
+               as_of - timedelta(days=rng.randint(0, 30)))
+
+
+def _borrowers(rng, scale):
+    # Every user can borrow; Borrower_ID matches User_ID as in the sample data
+    for user_id in range(1, scale["users"] + 1):
+        yield (user_id, user_id, rng.choice([3, 5, 5, 5, 10]), 0)
+
+
+def _authors(rng, scale):
+    for author_id in range(1, scale["authors"] + 1):
+        nationality, language = rng.choice(NATIONALITIES)
+        born = date(1850, 1, 1) + timedelta(days=rng.randint(0, 150 * 365))
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        yield (author_id, name, f"{nationality} author.", born, nationality, language)
+
+
+def _genres(rng, scale):
+    for genre_id in range(1, scale["genres"] + 1):
+        base = GENRE_NAMES[(genre_id - 1) % len(GENRE_NAMES)]
+        title = base if genre_id <= len(GENRE_NAMES) else f"{base} {(genre_id - 1) // len(GENRE_NAMES) + 1}"
+        yield (genre_id, title, f"Books about {title.lower()}.")
+
+
+def _books(rng, scale, open_loans):
+    # Copies out on open loans are not available, as after a checkout
+    admins = _admin_count(scale)
+    for index in range(1, scale["books"] + 1):
+        title = f"The {rng.choice(TITLE_WORDS)} {rng.choice(TITLE_WORDS)}"
+        published = date(1900, 1, 1) + timedelta(days=rng.randint(0, 124 * 365))
+        pages, copies = rng.randint(80, 900), rng.randint(1, 10)
+        yield (isbn(index), title, published, pages, copies - open_loans.get(isbn(index), 0),
+               rng.choice(PUBLISHERS), rng.randint(1, admins))
+
+
+def _book_authors(rng, scale, s):
+    # Prolific authors write many books: authors are Zipf-distributed too
+    authors = _Zipf(rng, scale["authors"], s)
+    for index in range(1, scale["books"] + 1):
+        chosen = set()
+        for _ in range(min(_pick_count(rng, AUTHORS_PER_BOOK), scale["authors"])):
+            author_id = authors.draw()
+            while author_id in chosen:
+                author_id = rng.randint(1, scale["authors"])
+            chosen.add(author_id)
+            yield (isbn(index), author_id)
+
+
+def _book_genres(rng, scale):
+    for index in range(1, scale["books"] + 1):
+        for genre_id in rng.sample(range(1, scale["genres"] + 1),
+                                   min(_pick_count(rng, GENRES_PER_BOOK), scale["genres"])):
+            yield (isbn(index), genre_id)
+
+
+def _loans(rng, scale, as_of, s, overdue_ratio, copies, limits):
+    # A loan that would leave more open loans than a book has copies, or than
+    # the borrower's Borrowing_Limit, is recorded as returned on its due date
+    books = _Zipf(rng, scale["books"], s)
+    admins = _admin_count(scale)
+    open_by_book = {}
+    open_by_borrower = {}
+    for loan_number in range(1, scale["loans"] + 1):
+        loan_date = as_of - timedelta(days=rng.randint(0, HISTORY_DAYS))
+        due_date = loan_date + timedelta(days=LOAN_DAYS)
+        return_date = None
+        fine = 0
+        if due_date < as_of and rng.random() >= overdue_ratio:
+            # Returned: most on time, some late with a fine
+            if rng.random() < LATE_RETURN_RATIO:
+                return_date = min(due_date + timedelta(days=rng.randint(1, 30)), as_of)
+                fine = round((return_date - due_date).days * FINE_PER_DAY, 2)
+            else:
+                return_date = loan_date + timedelta(days=rng.randint(1, LOAN_DAYS))
+        elif due_date >= as_of and rng.random() < 0.3:
+            # Still inside the loan period but already returned
+            return_date = min(loan_date + timedelta(days=rng.randint(0, LOAN_DAYS)), as_of)
+        borrower_id, book = rng.randint(1, scale["users"]), isbn(books.draw())
+        if return_date is None:
+            if open_by_book.get(book, 0) < copies[book] and open_by_borrower.get(borrower_id, 0) < limits[borrower_id]:
+                open_by_book[book] = open_by_book.get(book, 0) + 1
+                open_by_borrower[borrower_id] = open_by_borrower.get(borrower_id, 0) + 1
+            else:
+                return_date = min(due_date, as_of)
+        yield (loan_number, borrower_id, book, loan_date, due_date,
+               return_date, fine, "Y" if return_date else "N", rng.randint(1, admins))
+
+
+def _open_loans(loans):
+    # {ISBN: loans not yet returned}, from a replay of the Loans stream
+    counts = {}
+    for row in loans:
+        if row[7] == "N":
+            counts[row[2]] = counts.get(row[2], 0) + 1
+    return counts
+
+
+def _admin_count(scale):
+    return max(1, min(scale["users"], int(scale["users"] * ADMIN_RATIO)))
+
+
+def generate(seed=42, as_of=None, zipf=ZIPF_EXPONENT, overdue_ratio=OVERDUE_RATIO, **scale):
+    """
+    Yields (table, columns, rows) for every library table in foreign key
+    order. `rows` is a generator, so nothing is held in memory beyond the
+    popularity tables and per-book copies, per-borrower limits and open loan
+    counts; consume each table's rows before the next table. No book has
+    more open loans than copies and no borrower more than their
+    Borrowing_Limit, and Copies_Available excludes the copies out on open
+    loans, as checkout would leave them.
+
+    Keyword arguments override DEFAULT_SCALE (users, authors, genres, books,
+    loans). The same seed and as-of date always produce the same data; dates
+    are placed relative to `as_of` (default today) so that SYSDATE-based
+    reports see current and overdue loans.
+    """
+    sizes = dict(DEFAULT_SCALE)
+    sizes.update({k: v for k, v in scale.items() if v is not None})
+    unknown = set(sizes) - set(DEFAULT_SCALE)
+    if unknown:
+        raise ValueError(f"Unknown scale parameter(s): {', '.join(sorted(unknown))}")
+    if any(sizes[k] < 1 for k in ("users", "authors", "genres", "books")):
+        raise ValueError("users, authors, genres and books must be at least 1")
+    as_of = as_of or date.today()
+
+    # One independent stream per table: changing one table's size leaves the others unchanged
+    def rng(table):
+        return random.Random(f"{seed}:{table}")
+
+    yield "Users", TABLE_COLUMNS["Users"], _users(rng("Users"), sizes)
+    yield "Administrators", TABLE_COLUMNS["Administrators"], _administrators(rng("Administrators"), sizes, as_of)
+    yield "Borrowers", TABLE_COLUMNS["Borrowers"], _borrowers(rng("Borrowers"), sizes)
+    yield "Authors", TABLE_COLUMNS["Authors"], _authors(rng("Authors"), sizes)
+    yield "Genres", TABLE_COLUMNS["Genres"], _genres(rng("Genres"), sizes)
+    # Open loans are capped by each book's copies and each borrower's limit,
+    # read from replays of those streams. Books come before Loans, so the
+    # open loans they subtract are counted from a first pass over the Loans stream.
+    copies = {row[0]: row[4] for row in _books(rng("Books"), sizes, {})}
+    limits = {row[0]: row[2] for row in _borrowers(rng("Borrowers"), sizes)}
+    open_loans = _open_loans(_loans(rng("Loans"), sizes, as_of, zipf, overdue_ratio, copies, limits))
+    yield "Books", TABLE_COLUMNS["Books"], _books(rng("Books"), sizes, open_loans)
+    yield "BookAuthor", TABLE_COLUMNS["BookAuthor"], _book_authors(rng("BookAuthor"), sizes, zipf)
+    yield "BookGenre", TABLE_COLUMNS["BookGenre"], _book_genres(rng("BookGenre"), sizes)
+    yield "Loans", TABLE_COLUMNS["Loans"], _loans(rng("Loans"), sizes, as_of, zipf, overdue_ratio, copies, limits)
+
+
+def write_csv(directory, **options):
+    """
+    Streams generated data into one CSV file per table (header row first,
+    dates as YYYY-MM-DD, NULL as an empty field). Returns {table: rows}.
+    """
+    os.makedirs(directory, exist_ok=True)
+    counts = {}
+    for table, columns, rows in generate(**options):
+        with open(os.path.join(directory, f"{table}.csv"), "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(columns)
+            count = 0
+            for row in rows:
+                writer.writerow(["" if v is None else v.isoformat() if isinstance(v, date) else v for v in row])
+                count += 1
+        counts[table] = count
+    return counts
+
+
+def load(connection, batch_size=loader_module.BATCH_SIZE, **options):
+    """
+    Streams generated data straight into the array-bound insert path, table
+    by table in foreign key order. Returns the loader's per-table report.
+    """
+    report = {}
+    for table, columns, rows in generate(**options):
+        loader_module.load_rows(connection, table, columns, rows, batch_size, report)
+    return report
@@ -0,0 +1,12 @@
+-- delete_indexes.sql
+
+DROP INDEX IX_Loans_Borrower_ID;
+DROP INDEX IX_Loans_ISBN;
+DROP INDEX IX_Loans_Admin_ID;
+DROP INDEX IX_Books_Admin_ID;
+DROP INDEX IX_BookAuthor_Author_ID;
+DROP INDEX IX_BookGenre_Genre_ID;
+DROP INDEX IX_Loans_Open_Due_Date;
+DROP INDEX IX_Loans_Open_Borrower_ID;
+DROP INDEX IX_Loans_Loan_Date;
+DROP INDEX IX_Books_Publication_Date;
@@ -0,0 +1,13 @@
+-- delete_materialized_views.sql
+
+DROP MATERIALIZED VIEW MV_TopBorrowedAuthors;
+DROP MATERIALIZED VIEW MV_GenreBookCount;
+DROP MATERIALIZED VIEW MV_OpenLoans;
+
+DROP MATERIALIZED VIEW LOG ON Loans;
+DROP MATERIALIZED VIEW LOG ON Authors;
+DROP MATERIALIZED VIEW LOG ON BookAuthor;
+DROP MATERIALIZED VIEW LOG ON Genres;
+DROP MATERIALIZED VIEW LOG ON BookGenre;
+DROP MATERIALIZED VIEW LOG ON Borrowers;
+DROP MATERIALIZED VIEW LOG ON Users;
@@ -0,0 +1,164 @@
+# delete_module.py
+
+import time
+import cx_Oracle
+from rich.console import Console
+from rich.table import Table
+from rich import box
+
+import cache_module
+import catalog_module
+import circulation_module
+import validation_module
+
+# Initialize Rich Console
+console = Console()
+
+# Keys deleted per transaction
+DELETE_BATCH_SIZE = 500
+
+# Batch deletes: name -> (table, key column, key type, [(child table, child column)]).
+# Children are deleted first, in this order, before the parent rows.
+CASCADES = {
+    "books": ("Books", "ISBN", str, [("Loans", "ISBN"), ("BookAuthor", "ISBN"), ("BookGenre", "ISBN")]),
+    "authors": ("Authors", "Author_ID", int, [("BookAuthor", "Author_ID")]),
+    "borrowers": ("Borrowers", "Borrower_ID", int, [("Loans", "Borrower_ID")]),
+}
+
+
+def parse_keys(name, codes):
+    """
+    Converts a stream of keys (see circulation_module.scanned_codes) to the
+    key type of the `name` batch delete, dropping repeats. Raises ValueError
+    for a key that is not a number where one is expected.
+    """
+    key_type = CASCADES[name][2]
+    return list(dict.fromkeys(key_type(code) for code in codes))
+
+
+def cascade_status(connection):
+    """
+    Returns [(name, child table, child column, constraint name, delete rule)]
+    for the foreign keys the batch deletes go through. The constraint name
+    and rule are None where the foreign key does not exist.
+    """
+    links = catalog_module.delete_rules(connection)
+    status = []
+    for name, (table, key, key_type, children) in CASCADES.items():
+        for child, column in children:
+            constraint, rule = links.get((child.upper(), column.upper(), table.upper()), (None, None))
+            status.append((name, child, column, constraint, rule))
+    return status
+
+
+def set_cascades(connection, enabled=True):
+    """
+    Re-creates the foreign keys the batch deletes go through with (or,
+    when `enabled` is False, without) ON DELETE CASCADE, so deleting a book,
+    author or borrower removes its dependent rows on the server. Oracle
+    cannot change a foreign key's delete rule in place, so each one is
+    dropped and added again as FK_<child>_<parent>; keys that already have
+    the wanted rule are left alone. These are DDL statements, each of which
+    commits. Returns the number of foreign keys changed.
+    """
+    wanted = "CASCADE" if enabled else "NO ACTION"
+    changed = 0
+    cursor = connection.cursor()
+    try:
+        for name, child, column, constraint, rule in cascade_status(connection):
+            table, key = CASCADES[name][:2]
+            if rule == wanted:
+                continue
+            if constraint is not None:
+                cursor.execute(f"ALTER TABLE {child} DROP CONSTRAINT {constraint}")
+            cursor.execute(f"ALTER TABLE {child} ADD CONSTRAINT FK_{child}_{table} FOREIGN KEY ({column}) "
+                           f"REFERENCES {table} ({key}){' ON DELETE CASCADE' if enabled else ''}")
+            changed += 1
+    finally:
+        cursor.close()
+    if changed:
+        cache_module.invalidate_all()
+        validation_module.forget_constraints()
+    return changed
+
+
+def _delete_chunk(connection, table, key, children, loans_column, keys, report):
+    rows = [(k,) for k in keys]
+    cursor = connection.cursor()
+    try:
+        # Open loans about to go, by the client or by ON DELETE CASCADE, give their copies back first
+        if loans_column is not None:
+            circulation_module.release_copies(connection, loans_column, keys)
+        # One array DELETE per child table, then the parents, all in one transaction
+        for child, column in children:
+            cursor.executemany(f"DELETE FROM {child} WHERE {column} = :1", rows)
+            report["children"][child] = report["children"].get(child, 0) + cursor.rowcount
+        cursor.executemany(f"DELETE FROM {table} WHERE {key} = :1", rows, arraydmlrowcounts=True)
+        for k, count in zip(keys, cursor.getarraydmlrowcounts()):
+            if count:
+                report["deleted"] += 1
+            else:
+                report["not_found"].append(k)
+        tables = {child.upper() for child, column in children}
+        if loans_column is not None:
+            tables.update({"LOANS", "BOOKS"})
+        cache_module.commit(connection, table.upper(), *tables)
+        report["batches"] += 1
+    except cx_Oracle.DatabaseError:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def batch_delete(connection, name, keys, batch_size=DELETE_BATCH_SIZE, progress=None):
+    """
+    Deletes the `name` rows ("books", "authors" or "borrowers") with the
+    given keys and everything that refers to them. Each chunk of
+    `batch_size` keys is one transaction: one array-bound DELETE per child
+    table and one for the parent rows, so a chunk costs a round trip per
+    table however many keys it has. Where every foreign key involved is
+    ON DELETE CASCADE (see set_cascades) the child deletes are skipped and
+    the server removes the dependent rows. Either way the copies of the open
+    loans removed are first given back with one array UPDATE per chunk.
+    `progress`, if given, is called with the report after every chunk.
+    Returns {"deleted", "not_found" (keys with no row), "children" ({child
+    table: rows deleted by the client}), "cascaded", "batches", "seconds"}.
+    """
+    table, key, key_type, children = CASCADES[name]
+    loans_column = dict(children).get("Loans")
+    cascaded = all(rule == "CASCADE" for n, child, column, constraint, rule in cascade_status(connection) if n == name)
+    if cascaded:
+        children = []
+    report = {"deleted": 0, "not_found": [], "children": {}, "cascaded": cascaded, "batches": 0, "seconds": 0.0}
+    started = time.perf_counter()
+    for start in range(0, len(keys), batch_size):
+        _delete_chunk(connection, table, key, children, loans_column, keys[start:start + batch_size], report)
+        report["seconds"] = time.perf_counter() - started
+        if progress is not None:
+            progress(report)
+    report["seconds"] = time.perf_counter() - started
+    return report
+
+
+def show_delete_report(name, report):
+    table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
+    for col in ["Deleted", "Not Found", "Child Rows", "Batches", "Seconds", "Rows/s"]:
+        table.add_column(col)
+    children = "ON DELETE CASCADE" if report["cascaded"] else \
+        ", ".join(f"{child} {count}" for child, count in report["children"].items()) or "0"
+    rate = report["deleted"] / report["seconds"] if report["seconds"] else 0.0
+    table.add_row(str(report["deleted"]), str(len(report["not_found"])), children,
+                  str(report["batches"]), f"{report['seconds']:.2f}", f"{rate:.0f}")
+    console.print(table)
+    if report["not_found"]:
+        console.print(f"[yellow]No {name[:-1]} with: {', '.join(str(k) for k in report['not_found'])}[/yellow]")
+
+
+def show_cascade_status(connection):
+    table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
+    for col in ["Delete", "Child Table", "Column", "Constraint", "Delete Rule"]:
+        table.add_column(col)
+    for name, child, column, constraint, rule in cascade_status(connection):
+        table.add_row(name, child, column, constraint or "-", rule or "missing")
+    console.print(table)
@@ -0,0 +1,8 @@
+-- delete_sequences.sql
+
+DROP SEQUENCE Users_Seq;
+DROP SEQUENCE Borrowers_Seq;
+DROP SEQUENCE Administrators_Seq;
+DROP SEQUENCE Authors_Seq;
+DROP SEQUENCE Genres_Seq;
+DROP SEQUENCE Loans_Seq;
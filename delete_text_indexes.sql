@@ -0,0 +1,6 @@
+-- delete_text_indexes.sql
+
+DROP INDEX TX_Books_Title;
+DROP INDEX TX_Books_Publisher;
+DROP INDEX TX_Authors_Name;
+DROP INDEX TX_Genres_Title;
@@ -0,0 +1,299 @@
+# executor_module.py
+
+import threading
+import weakref
+from collections import OrderedDict
+from rich.console import Console
+from rich.table import Table
+from rich.text import Text
+from rich import box
+
+import pool_module
+
+# Initialize Rich Console
+console = Console()
+
+# Number of open cursors kept per session, keyed by SQL text
+STATEMENT_CACHE_SIZE = 40
+
+# Cursor cache hits/misses across every session of this process
+cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+_stats_lock = threading.Lock()
+
+# Caches for plain (non-pooled) connections; pooled sessions keep theirs in the pool
+_plain_caches = weakref.WeakKeyDictionary()
+
+
+def _count(name):
+    # Sessions run on worker threads during bulk loads and the stress test
+    with _stats_lock:
+        cache_stats[name] += 1
+
+
+class StatementCache:
+    """
+    LRU cache of open cursors for one session, keyed by SQL text.
+
+    Re-executing the same text on the same cursor lets the driver skip the
+    prepare step, and the session's server-side statement cache turns the
+    remaining parses into soft parses.
+    """
+
+    def __init__(self, connection, size=STATEMENT_CACHE_SIZE):
+        self.connection = connection
+        self.size = size
+        self._cursors = OrderedDict()
+
+    def cursor(self, sql):
+        cursor = self._cursors.get(sql)
+        if cursor is not None:
+            self._cursors.move_to_end(sql)
+            _count("hits")
+            return cursor
+        _count("misses")
+        cursor = self.connection.cursor()
+        self._cursors[sql] = cursor
+        while len(self._cursors) > self.size:
+            _, evicted = self._cursors.popitem(last=False)
+            _count("evictions")
+            try:
+                evicted.close()
+            except Exception:
+                pass
+        return cursor
+
+    def close(self):
+        while self._cursors:
+            _, cursor = self._cursors.popitem()
+            try:
+                cursor.close()
+            except Exception:
+                pass
+
+
+def statement_cache(connection):
+    """
+    Returns the statement cache of the session behind `connection`, or None
+    when the connection cannot carry one.
+    """
+    if STATEMENT_CACHE_SIZE <= 0:
+        return None
+    if isinstance(connection, pool_module.PooledConnection):
+        session = connection.session
+        state = connection.pool.session_state(session)
+        cache = state.get("statements")
+        if cache is None:
+            cache = state["statements"] = StatementCache(session, STATEMENT_CACHE_SIZE)
+        return cache
+    try:
+        cache = _plain_caches.get(connection)
+        if cache is None:
+            cache = _plain_caches[connection] = StatementCache(connection, STATEMENT_CACHE_SIZE)
+        return cache
+    except TypeError:
+        # Driver connection objects that do not support weak references
+        return None
+
+
+def execute(connection, sql, params=None, **kwargs):
+    """
+    Executes `sql` on a cursor reused by SQL text and returns that cursor.
+    The cursor belongs to the cache: read from it, but do not close it.
+    """
+    cache = statement_cache(connection)
+    cursor = cache.cursor(sql) if cache is not None else connection.cursor()
+    binds = params or kwargs
+    if binds:
+        cursor.execute(sql, binds)
+    else:
+        cursor.execute(sql)
+    return cursor
+
+
+def fetch_one(connection, sql, params=None, **kwargs):
+    return execute(connection, sql, params, **kwargs).fetchone()
+
+
+def fetch_all(connection, sql, params=None, **kwargs):
+    return execute(connection, sql, params, **kwargs).fetchall()
+
+
+def record_exists(connection, sql, params=None, **kwargs):
+    """
+    Runs an existence check and returns True if it matched at least one row.
+    """
+    return fetch_one(connection, sql, params, **kwargs) is not None
+
+
+# Result rendering settings, changed from the tools menu
+output_settings = {
+    "arraysize": 500,       # Rows fetched per round trip (cursor.arraysize / fetchmany)
+    "page_size": 100,       # Rows rendered per table page
+    "max_rows": 1000,       # Rows shown before output stops (0 = no cap)
+    "mode": "table",        # "table" renders rich tables page by page, "tsv" prints plain tab-separated lines
+}
+
+# How far past the row cap rows are still counted for the "N more rows" line
+COUNT_AHEAD_LIMIT = 100000
+
+
+def _cell(item):
+    return str(item) if item is not None else "NULL"
+
+
+def print_rows(columns, rows, show_header=True):
+    """
+    Renders one page of rows as a rich table.
+    """
+    table = Table(show_header=show_header, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
+    for col in columns:
+        table.add_column(str(col))
+    for row in rows:
+        table.add_row(*[Text(_cell(item)) for item in row])
+    console.print(table)
+
+
+def _print_tsv(rows):
+    for row in rows:
+        console.out("\t".join(_cell(item).replace("\t", " ").replace("\n", " ") for item in row), highlight=False)
+
+
+def _count_remaining(cursor, arraysize):
+    """
+    Counts the rows left on the cursor without keeping them, up to
+    COUNT_AHEAD_LIMIT. Returns (count, True if the limit was reached).
+    """
+    remaining = 0
+    while remaining < COUNT_AHEAD_LIMIT:
+        rows = cursor.fetchmany(arraysize)
+        if not rows:
+            return remaining, False
+        remaining += len(rows)
+    return remaining, True
+
+
+class RowSource:
+    """
+    Serves rows that were already fetched, then carries on with the cursor
+    they came from (if any), through the same fetchmany() call a cursor has.
+    """
+
+    def __init__(self, rows, cursor=None):
+        self._rows = rows
+        self._position = 0
+        self.cursor = cursor
+
+    def fetchmany(self, size):
+        rows = self._rows[self._position:self._position + size]
+        self._position += len(rows)
+        if len(rows) < size and self.cursor is not None:
+            rows = rows + self.cursor.fetchmany(size - len(rows))
+        return rows
+
+
+def render(columns, source, max_rows=None, mode=None):
+    """
+    Renders rows from `source` (a cursor or RowSource) page by page (or as
+    TSV lines), so memory holds at most one page whatever the result size.
+    Output stops after max_rows rows with a line saying how many more there
+    were.
+    """
+    arraysize = max(1, output_settings["arraysize"])
+    page_size = max(1, output_settings["page_size"])
+    max_rows = output_settings["max_rows"] if max_rows is None else max_rows
+    mode = mode or output_settings["mode"]
+
+    if mode == "tsv":
+        console.out("\t".join(str(col) for col in columns), highlight=False)
+
+    shown = 0
+    first_page = True
+    while True:
+        want = page_size if not max_rows else min(page_size, max_rows - shown)
+        if want <= 0:
+            break
+        rows = source.fetchmany(want)
+        if not rows and not first_page:
+            break
+        if mode == "tsv":
+            _print_tsv(rows)
+        else:
+            print_rows(columns, rows, first_page)
+        first_page = False
+        shown += len(rows)
+        if len(rows) < want:
+            return
+
+    if max_rows and shown >= max_rows:
+        remaining, more = _count_remaining(source, arraysize)
+        if remaining:
+            count = f"more than {remaining}" if more else str(remaining)
+            console.print(f"[yellow]... {count} more rows not shown (row cap {max_rows}).[/yellow]")
+
+
+def open_cursor(connection, query, params=None):
+    """
+    Executes a query with the configured fetch arraysize and returns
+    (column names, cursor).
+    """
+    cursor = execute(connection, query, params)
+    cursor.arraysize = max(1, output_settings["arraysize"])
+    return [desc[0] for desc in cursor.description], cursor
+
+
+# Function to execute an inline SQL query and display results
+def execute_query(connection, query, params=None, max_rows=None, mode=None):
+    """
+    Streams a query's result to the console; rows are fetched arraysize at a
+    time through fetchmany and rendered as they arrive.
+    """
+    columns, cursor = open_cursor(connection, query, params)
+    render(columns, cursor, max_rows, mode)
+
+
+def parse_counts(connection):
+    """
+    Returns the session's parse statistics from V$MYSTAT, or None if the
+    user lacks access to the V$ views.
+    """
+    query = """
+    SELECT N.Name, S.Value
+    FROM V$MYSTAT S
+    JOIN V$STATNAME N ON S.Statistic# = N.Statistic#
+    WHERE N.Name IN ('parse count (total)', 'parse count (hard)', 'session cursor cache hits', 'execute count')
+    """
+    try:
+        cursor = connection.cursor()
+        cursor.execute(query)
+        counts = dict(cursor.fetchall())
+        cursor.close()
+        return counts
+    except Exception:
+        return None
+
+
+def show_cache_stats(connection):
+    """
+    Prints cursor cache hits/misses and, when available, the server-side parse counts.
+    """
+    table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
+    table.add_column("Statistic")
+    table.add_column("Value")
+    with _stats_lock:
+        stats = dict(cache_stats)
+    lookups = stats["hits"] + stats["misses"]
+    table.add_row("Cursor cache size", str(STATEMENT_CACHE_SIZE))
+    table.add_row("Cursor cache hits", str(stats["hits"]))
+    table.add_row("Cursor cache misses", str(stats["misses"]))
+    table.add_row("Cursor cache evictions", str(stats["evictions"]))
+    table.add_row("Hit ratio", f"{stats['hits'] / lookups:.1%}" if lookups else "N/A")
+    counts = parse_counts(connection)
+    if counts:
+        total = counts.get("parse count (total)", 0)
+        hard = counts.get("parse count (hard)", 0)
+        table.add_row("Session parses (total)", str(total))
+        table.add_row("Session parses (hard)", str(hard))
+        table.add_row("Session parses (soft)", str(total - hard))
+        table.add_row("Session cursor cache hits", str(counts.get("session cursor cache hits", 0)))
+        table.add_row("Session executions", str(counts.get("execute count", 0)))
+    console.print(table)
@@ -0,0 +1,183 @@
+# fuzzy_module.py
+
+import threading
+from rich.console import Console
+from rich.table import Table
+from rich import box
+
+import typeahead_module
+
+# Initialize Rich Console
+console = Console()
+
+# Typeahead fields that can be matched approximately
+FIELDS = ["title", "author"]
+
+# Closest matches returned
+TOP_K = 10
+
+# Character n-gram length used to find candidate words
+GRAM = 3
+
+
+def max_distance(word):
+    """
+    Edits tolerated in a query word: none for 1-2 letters, one up to five
+    letters, two beyond.
+    """
+    return 0 if len(word) <= 2 else 1 if len(word) <= 5 else 2
+
+
+def grams(word):
+    padded = "$" * (GRAM - 1) + word + "$" * (GRAM - 1)
+    return {padded[i:i + GRAM] for i in range(len(padded) - GRAM + 1)}
+
+
+def edit_distance(a, b, limit):
+    """
+    Optimal string alignment distance (insertions, deletions, substitutions
+    and adjacent transpositions, so "tolkein" is one edit from "tolkien").
+    Returns limit + 1 as soon as the distance is known to exceed `limit`.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    before, previous = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], before[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return previous[-1]
+
+
+class FuzzyIndex:
+    """
+    Word-level n-gram index over a set of texts. A query word is compared
+    only with the words that share enough n-grams with it to be within its
+    edit budget (the q-gram count filter), so the work per query follows
+    the number of similar words rather than the size of the catalog.
+    """
+
+    def __init__(self):
+        self.texts = {}     # key -> text
+        self.words = {}     # word -> set of keys
+        self.grams = {}     # n-gram -> set of words
+
+    def add(self, key, text):
+        self.remove(key)
+        self.texts[key] = text
+        for word in set(typeahead_module.normalize(text).split()):
+            keys = self.words.get(word)
+            if keys is None:
+                keys = self.words[word] = set()
+                for gram in grams(word):
+                    self.grams.setdefault(gram, set()).add(word)
+            keys.add(key)
+
+    def remove(self, key):
+        text = self.texts.pop(key, None)
+        if text is None:
+            return
+        for word in set(typeahead_module.normalize(text).split()):
+            keys = self.words[word]
+            keys.discard(key)
+            if not keys:
+                del self.words[word]
+                for gram in grams(word):
+                    self.grams[gram].discard(word)
+                    if not self.grams[gram]:
+                        del self.grams[gram]
+
+    def sync(self, texts):
+        """
+        Makes the index hold exactly `texts` ({key: text}), touching only
+        the keys that differ.
+        """
+        for key in [k for k in self.texts if k not in texts]:
+            self.remove(key)
+        for key, text in texts.items():
+            if self.texts.get(key) != text:
+                self.add(key, text)
+
+    def similar_words(self, word):
+        """
+        Returns {indexed word: edit distance} for the words within the edit
+        budget of `word`.
+        """
+        limit = max_distance(word)
+        if word in self.words and limit == 0:
+            return {word: 0}
+        query_grams = grams(word)
+        shared = {}
+        for gram in query_grams:
+            for candidate in self.grams.get(gram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+        similar = {}
+        for candidate, count in shared.items():
+            # Each edit changes at most GRAM n-grams (a transposition counts as two edits)
+            if count < max(len(query_grams), len(grams(candidate))) - 2 * limit * GRAM:
+                continue
+            distance = edit_distance(word, candidate, limit)
+            if distance <= limit:
+                similar[candidate] = distance
+        return similar
+
+    def search(self, text, k=TOP_K):
+        """
+        Returns up to `k` (key, text, distance) for the texts containing a
+        word close to every word of `text`, closest first. A text's
+        distance is the sum of its best word distances.
+        """
+        query = typeahead_module.normalize(text).split()
+        if not query:
+            return []
+        result = None
+        for word in query:
+            distances = {}
+            for candidate, distance in self.similar_words(word).items():
+                for key in self.words[candidate]:
+                    if distance < distances.get(key, distance + 1):
+                        distances[key] = distance
+            if result is None:
+                result = distances
+            else:
+                result = {key: total + distances[key] for key, total in result.items() if key in distances}
+            if not result:
+                return []
+        ranked = sorted(result.items(), key=lambda item: (item[1], self.texts[item[0]], str(item[0])))
+        return [(key, self.texts[key], distance) for key, distance in ranked[:k]]
+
+
+# Fuzzy indexes by field and the typeahead version they mirror
+_fuzzy = {"indexes": {field: FuzzyIndex() for field in FIELDS}, "version": None}
+_fuzzy_lock = threading.Lock()
+
+
+def closest(connection, field, text, k=TOP_K):
+    """
+    Returns the `k` closest (key, text, distance) matches for `text` in
+    `field` ("title" or "author"). The indexes follow the typeahead indexes,
+    so they are loaded and refreshed with them.
+    """
+    typeahead = typeahead_module.typeahead
+    typeahead.current(connection)
+    with _fuzzy_lock:
+        if _fuzzy["version"] != typeahead.version:
+            for name, index in _fuzzy["indexes"].items():
+                index.sync(typeahead.texts(name))
+            _fuzzy["version"] = typeahead.version
+        return _fuzzy["indexes"][field].search(text, k)
+
+
+def show_closest(matches):
+    table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
+    for col in ["Key", "Text", "Edits"]:
+        table.add_column(col)
+    for key, text, distance in matches:
+        table.add_row(str(key), text, str(distance))
+    console.print(table)
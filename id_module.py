@@ -0,0 +1,148 @@
+# id_module.py
+
+import threading
+import cx_Oracle
+
+import executor_module
+
+CREATE_SCRIPT = "create_sequences.sql"
+DROP_SCRIPT = "delete_sequences.sql"
+
+# Sequence and key column of each table with a generated numeric key
+SEQUENCES = {
+    "USERS": ("Users_Seq", "User_ID"),
+    "BORROWERS": ("Borrowers_Seq", "Borrower_ID"),
+    "ADMINISTRATORS": ("Administrators_Seq", "Admin_ID"),
+    "AUTHORS": ("Authors_Seq", "Author_ID"),
+    "GENRES": ("Genres_Seq", "Genre_ID"),
+    "LOANS": ("Loans_Seq", "Loan_Number"),
+}
+
+# Keys reserved per round trip by next_id
+ID_BLOCK = 50
+
+# Cache size of sequences created on demand (matches create_sequences.sql)
+SEQUENCE_CACHE = 100
+
+SEQUENCE_QUERY = "SELECT 1 FROM User_Sequences WHERE Sequence_Name = :name"
+
+# Tables whose sequence is known to be past every existing key, and the
+# reserved keys not handed out yet
+_synced = set()
+_blocks = {}
+_lock = threading.Lock()
+
+
+def next_value(table):
+    """
+    Returns the SQL expression that draws the next key of `table`.
+    """
+    return f"{SEQUENCES[table.upper()][0]}.NEXTVAL"
+
+
+def forget_synced():
+    """
+    Makes the next use of each sequence re-check it against the table, and
+    drops reserved keys. Call after scripts, loads or resets that insert
+    explicit keys.
+    """
+    with _lock:
+        _synced.clear()
+        _blocks.clear()
+
+
+def forget_table(table):
+    """
+    Makes the next ensure() of `table` re-check its sequence, and drops its
+    reserved keys. Call after inserting a row with an explicit key, which
+    the sequence may not be past yet.
+    """
+    with _lock:
+        _synced.discard(table.upper())
+        _blocks.pop(table.upper(), None)
+
+
+def ensure(connection, table):
+    """
+    Makes sure the sequence of `table` exists and will not hand out a key
+    already in the table: a missing sequence is created after the highest
+    key, and one that is behind is moved past it. Runs once per table until
+    forget_synced(). ALTER/CREATE SEQUENCE are DDL and commit, so call this
+    before starting a transaction.
+    """
+    table = table.upper()
+    if table in _synced:
+        return
+    sequence, key = SEQUENCES[table]
+    highest = executor_module.fetch_one(connection, f"SELECT NVL(MAX({key}), 0) FROM {table}")[0]
+    cursor = connection.cursor()
+    try:
+        if not executor_module.record_exists(connection, SEQUENCE_QUERY, name=sequence.upper()):
+            cursor.execute(f"CREATE SEQUENCE {sequence} START WITH {int(highest) + 1} CACHE {SEQUENCE_CACHE}")
+        else:
+            cursor.execute(f"SELECT {sequence}.NEXTVAL FROM DUAL")
+            gap = int(highest) - cursor.fetchone()[0]
+            if gap > 0:
+                # Portable alternative to ALTER SEQUENCE ... RESTART (18c+)
+                cursor.execute(f"ALTER SEQUENCE {sequence} INCREMENT BY {gap}")
+                try:
+                    cursor.execute(f"SELECT {sequence}.NEXTVAL FROM DUAL")
+                    cursor.fetchone()
+                finally:
+                    cursor.execute(f"ALTER SEQUENCE {sequence} INCREMENT BY 1")
+    finally:
+        cursor.close()
+    with _lock:
+        _synced.add(table)
+
+
+def reserve(connection, table, count):
+    """
+    Draws `count` keys of `table` from its sequence in one round trip, for
+    bulk paths that insert many rows.
+    """
+    ensure(connection, table)
+    rows = executor_module.fetch_all(connection, f"SELECT {next_value(table)} FROM DUAL CONNECT BY LEVEL <= :count",
+                                     count=count)
+    return [row[0] for row in rows]
+
+
+def next_id(connection, table, block=ID_BLOCK):
+    """
+    Returns one key of `table` from a block reserved in advance, so a
+    stream of single inserts draws a round trip only every `block` keys.
+    Keys reserved but never used are gaps, as with any sequence.
+    """
+    table = table.upper()
+    with _lock:
+        keys = _blocks.get(table)
+        if keys:
+            return keys.pop()
+    keys = reserve(connection, table, block)
+    keys.reverse()
+    with _lock:
+        _blocks.setdefault(table, []).extend(keys)
+        return _blocks[table].pop()
+
+
+def insert_returning(connection, table, query, params):
+    """
+    Executes an INSERT into `table` that takes its key as
+    NVL(:key, <sequence>.NEXTVAL) and ends in RETURNING <key> INTO :new_id,
+    and returns the key the row got. `params` holds the key under the key
+    column's name in lower case (e.g. "user_id"); a key given there rather
+    than drawn makes the next insert re-sync the sequence past it. Does not
+    commit.
+    """
+    ensure(connection, table)
+    cursor = connection.cursor()
+    try:
+        new_id = cursor.var(cx_Oracle.NUMBER)
+        cursor.execute(query, dict(params, new_id=new_id))
+        if params.get(SEQUENCES[table.upper()][1].lower()):
+            forget_table(table)
+        value = new_id.getvalue()
+        value = value[0] if isinstance(value, list) else value
+        return int(value)
+    finally:
+        cursor.close()
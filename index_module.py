@@ -0,0 +1,368 @@
+# index_module.py
+
+import re
+import statistics
+import time
+import cx_Oracle
+from rich.console import Console
+from rich.table import Table
+from rich import box
+
+import benchmark_module
+import catalog_module
+import executor_module
+import script_module
+
+# Initialize Rich Console
+console = Console()
+
+CREATE_SCRIPT = "create_indexes.sql"
+DROP_SCRIPT = "delete_indexes.sql"
+
+# Executions per query when timing; the median is reported
+TIMING_RUNS = 5
+
+# Oracle identifiers are limited to 30 bytes before 12.2
+MAX_NAME_LENGTH = 30
+
+# Statement ID under which the advisor's plans are written to Plan_Table
+PLAN_ID = "INDEX_ADVISOR"
+
+PLAN_QUERY = """
+SELECT Depth, Operation, Options, Object_Name, Cost
+FROM Plan_Table
+WHERE Statement_ID = :plan_id
+ORDER BY Id
+"""
+
+# Row lookups made by the delete menu, and by Oracle itself when it checks a
+# parent delete against the child table: (case name, query, query returning
+# a sample value for the query's bind)
+WRITE_PATH_CASES = [
+    ("delete_book:loans", "SELECT L.Loan_Number FROM Loans L WHERE L.ISBN = :isbn",
+     "SELECT MIN(ISBN) FROM Books"),
+    ("delete_borrower:loans", "SELECT L.Loan_Number FROM Loans L WHERE L.Borrower_ID = :borrower_id",
+     "SELECT MIN(Borrower_ID) FROM Borrowers"),
+    ("delete_administrator:books", "SELECT B.ISBN FROM Books B WHERE B.Admin_ID = :admin_id",
+     "SELECT MIN(Admin_ID) FROM Administrators"),
+    ("delete_administrator:loans", "SELECT L.Loan_Number FROM Loans L WHERE L.Admin_ID = :admin_id",
+     "SELECT MIN(Admin_ID) FROM Administrators"),
+    ("delete_author:bookauthor", "SELECT BA.ISBN FROM BookAuthor BA WHERE BA.Author_ID = :author_id",
+     "SELECT MIN(Author_ID) FROM Authors"),
+    ("delete_genre:bookgenre", "SELECT BG.ISBN FROM BookGenre BG WHERE BG.Genre_ID = :genre_id",
+     "SELECT MIN(Genre_ID) FROM Genres"),
+]
+
+# Words that can follow a table name in FROM/JOIN and are not its alias
+CLAUSE_WORDS = {"ON", "WHERE", "JOIN", "INNER", "LEFT", "RIGHT", "FULL", "OUTER", "CROSS", "GROUP", "ORDER",
+                "HAVING", "UNION", "MINUS", "INTERSECT", "FETCH", "SELECT", "AND", "OR", "USING"}
+
+TABLE_REFERENCE = re.compile(r"\b(?:FROM|JOIN)\s+(\w+)(?:\s+(\w+))?", re.IGNORECASE)
+
+# alias.column, not inside a function call such as LOWER(B.Title)
+COLUMN = r"(?<![\w.(])(\w+)\.(\w+)"
+
+# alias.column <op> [alias.column], where the right-hand column may be the
+# select list of an IN subquery. Only operators an index range scan can serve
+# are listed; LIKE '%...%' and != are left out on purpose.
+PREDICATE = re.compile(COLUMN + r"\s*(<=|>=|=|<|>|\bBETWEEN\b|\b(?:NOT\s+)?IN\b)\s*"
+                       r"(?:\(\s*SELECT\s+(?:DISTINCT\s+)?)?(?:" + COLUMN + r")?", re.IGNORECASE)
+
+# CASE expressions are served by function-based indexes on the same
+# expression, which the column advisor does not model
+CASE_EXPRESSION = re.compile(r"\bCASE\b.*?\bEND\b", re.IGNORECASE | re.DOTALL)
+
+BIND = re.compile(r"(?<!:):(\w+)")
+
+CREATE_INDEX_PATTERN = re.compile(r"^\s*CREATE\s+(?:UNIQUE\s+|BITMAP\s+)?INDEX\s+(\w+)\s+ON\s+(\w+)\s*\((.*)\)\s*$",
+                                  re.IGNORECASE | re.DOTALL)
+
+
+def analysis_cases():
+    """
+    Returns (case name, query, binds) for every report, representative search
+    and delete-path lookup the advisor looks at. Delete-path binds are filled
+    in by timing_cases.
+    """
+    cases = [(name, query, params) for name, kind, query, params in benchmark_module.cases()]
+    cases.extend((name, query, None) for name, query, sample in WRITE_PATH_CASES)
+    return cases
+
+
+def aliases(query):
+    """
+    Returns {alias or table name (upper case): table name as written} for
+    the tables referenced in FROM and JOIN clauses.
+    """
+    found = {}
+    for table, alias in TABLE_REFERENCE.findall(query):
+        found.setdefault(table.upper(), table)
+        if alias and alias.upper() not in CLAUSE_WORDS:
+            found.setdefault(alias.upper(), table)
+    return found
+
+
+def column_usage(cases):
+    """
+    Collects the join and filter columns of `cases` ((name, query, ...)).
+    Returns {(TABLE, COLUMN): {"table": name as written, "column": name as
+    written, "join": set of case names, "filter": set of case names}}.
+    """
+    usage = {}
+
+    def use(tables, alias, column, kind, case):
+        table = tables.get(alias.upper())
+        if table is None:
+            return
+        entry = usage.setdefault((table.upper(), column.upper()),
+                                 {"table": table, "column": column, "join": set(), "filter": set()})
+        entry[kind].add(case)
+
+    for case in cases:
+        name, query = case[0], case[1]
+        tables = aliases(query)
+        query = CASE_EXPRESSION.sub(" ", query)
+        for left_alias, left_column, operator, right_alias, right_column in PREDICATE.findall(query):
+            if right_alias:
+                use(tables, left_alias, left_column, "join", name)
+                use(tables, right_alias, right_column, "join", name)
+            else:
+                use(tables, left_alias, left_column, "filter", name)
+    return usage
+
+
+def covering_index(table, column, usage, indexes):
+    """
+    Returns the name of an index that serves lookups on `column`, or None.
+    An index serves a column it leads with, and also a later column when its
+    leading column is filtered on by one of the same queries (the later
+    column is then checked inside the index range scan).
+    """
+    cases = usage[(table, column)]["join"] | usage[(table, column)]["filter"]
+    for index, columns in sorted(indexes.get(table, {}).items()):
+        if columns[0] == column:
+            return index
+        lead = usage.get((table, columns[0]))
+        if column in columns and lead and lead["filter"] & cases:
+            return index
+    return None
+
+
+def advise(usage, indexes):
+    """
+    Returns one dict per used column with the index covering it (or None),
+    missing columns first.
+    """
+    advice = []
+    for (table, column), entry in usage.items():
+        advice.append({
+            "table": entry["table"],
+            "column": entry["column"],
+            "join": sorted(entry["join"]),
+            "filter": sorted(entry["filter"]),
+            "index": covering_index(table, column, usage, indexes),
+        })
+    advice.sort(key=lambda a: (a["index"] is not None, a["table"].upper(), a["column"].upper()))
+    return advice
+
+
+def script_indexes(file_path=CREATE_SCRIPT):
+    """
+    Returns (index name, table, [columns], statement) for each CREATE INDEX
+    in the managed index script.
+    """
+    found = []
+    for stmt in script_module.read_statements(file_path):
+        match = CREATE_INDEX_PATTERN.match(stmt)
+        if match:
+            columns = [c.strip().upper() for c in match.group(3).split(",")]
+            found.append((match.group(1), match.group(2), columns, stmt))
+    return found
+
+
+def proposals(usage, indexes, file_path=CREATE_SCRIPT):
+    """
+    Returns (index name, CREATE INDEX statement) for the indexes that would
+    cover every column without one. The managed script's definition is used
+    when it has an index leading with the column; a proposed composite index
+    also covers the later columns it serves, so those get no index of their
+    own. Missing function-based indexes from the script are proposed as well.
+    """
+    managed = {(table.upper(), columns[0]): (name, columns, stmt)
+               for name, table, columns, stmt in script_indexes(file_path)}
+    indexes = {table: dict(table_indexes) for table, table_indexes in indexes.items()}
+    missing = [key for key in usage if covering_index(key[0], key[1], usage, indexes) is None]
+    missing.sort(key=lambda key: (key not in managed, key))
+    proposed = []
+    for table, column in missing:
+        if covering_index(table, column, usage, indexes) is not None:
+            continue
+        if (table, column) in managed:
+            name, columns, stmt = managed[(table, column)]
+        else:
+            entry = usage[(table, column)]
+            name = f"IX_{entry['table']}_{entry['column']}"[:MAX_NAME_LENGTH]
+            columns = [column]
+            stmt = f"CREATE INDEX {name} ON {entry['table']} ({entry['column']})"
+        indexes.setdefault(table, {})[name.upper()] = columns
+        proposed.append((name, stmt))
+    # Function-based indexes of the managed script serve expressions rather
+    # than columns; propose any that do not exist yet
+    existing = {index for table_indexes in indexes.values() for index in table_indexes}
+    for name, table, columns, stmt in script_indexes(file_path):
+        if " " in columns[0] and name.upper() not in existing:
+            proposed.append((name, stmt))
+    return proposed
+
+
+def analyze(connection):
+    """
+    Returns (column usage, current indexes, advice) for the advisor cases
+    against the current schema.
+    """
+    usage = column_usage(analysis_cases())
+    indexes = catalog_module.index_columns(connection)
+    return usage, indexes, advise(usage, indexes)
+
+
+def timing_cases(connection):
+    """
+    Returns analysis_cases with the delete-path binds filled in from a sample
+    of the current data.
+    """
+    cases = [(name, query, params) for name, kind, query, params in benchmark_module.cases()]
+    for name, query, sample in WRITE_PATH_CASES:
+        value = executor_module.fetch_one(connection, sample)
+        cases.append((name, query, {BIND.search(query).group(1): value[0] if value else None}))
+    return cases
+
+
+def explain(connection, query):
+    """
+    Returns the optimizer plan for `query` as (depth, operation, options,
+    object name, cost) rows. Binds are left unbound, as EXPLAIN PLAN allows.
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute("DELETE FROM Plan_Table WHERE Statement_ID = :plan_id", plan_id=PLAN_ID)
+        cursor.execute(f"EXPLAIN PLAN SET STATEMENT_ID = '{PLAN_ID}' FOR {query}")
+        cursor.execute(PLAN_QUERY, plan_id=PLAN_ID)
+        plan = cursor.fetchall()
+        cursor.execute("DELETE FROM Plan_Table WHERE Statement_ID = :plan_id", plan_id=PLAN_ID)
+    finally:
+        cursor.close()
+    return plan
+
+
+def access_paths(plan):
+    """
+    Summarizes a plan as its table and index accesses, e.g.
+    "TABLE ACCESS FULL LOANS" or "INDEX RANGE SCAN IX_LOANS_DUE_DATE".
+    """
+    return [" ".join(part for part in (operation, options, name) if part)
+            for depth, operation, options, name, cost in plan if name]
+
+
+def time_query(connection, query, params=None, runs=TIMING_RUNS):
+    """
+    Runs `query` `runs` times, fetching every row, and returns (median
+    milliseconds, row count).
+    """
+    timings = []
+    rows = 0
+    for _ in range(runs):
+        started = time.perf_counter()
+        cursor = connection.cursor()
+        cursor.arraysize = executor_module.output_settings["arraysize"]
+        try:
+            cursor.execute(query, params or {})
+            rows = len(cursor.fetchall())
+        finally:
+            cursor.close()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), rows
+
+
+def gather_stats(connection, tables):
+    """
+    Refreshes optimizer statistics for `tables` so plans reflect the data
+    currently loaded.
+    """
+    cursor = connection.cursor()
+    try:
+        for table in tables:
+            cursor.execute("BEGIN DBMS_STATS.GATHER_TABLE_STATS(USER, :name); END;", name=table.upper())
+    finally:
+        cursor.close()
+
+
+def measure(connection, cases, runs=TIMING_RUNS):
+    """
+    Returns {case name: {"cost", "paths", "ms", "rows", "error"}}.
+    """
+    results = {}
+    for name, query, params in cases:
+        try:
+            plan = explain(connection, query)
+            ms, rows = time_query(connection, query, params, runs)
+            results[name] = {"cost": plan[0][4] if plan else None, "paths": access_paths(plan),
+                             "ms": ms, "rows": rows, "error": None}
+        except cx_Oracle.DatabaseError as e:
+            error, = e.args
+            results[name] = {"cost": None, "paths": [], "ms": None, "rows": None, "error": error.message}
+    return results
+
+
+def run_statements(connection, statements):
+    """
+    Executes DDL statements one at a time and returns (statement, seconds,
+    error message or None) for each.
+    """
+    results = []
+    cursor = connection.cursor()
+    try:
+        for stmt in statements:
+            started = time.perf_counter()
+            try:
+                cursor.execute(stmt)
+                results.append((stmt, time.perf_counter() - started, None))
+            except cx_Oracle.DatabaseError as e:
+                error, = e.args
+                results.append((stmt, time.perf_counter() - started, error.message))
+    finally:
+        cursor.close()
+    return results
+
+
+def show_advice(advice):
+    table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
+    for col in ["Table", "Column", "Joined In", "Filtered In", "Index"]:
+        table.add_column(col)
+    for entry in advice:
+        table.add_row(entry["table"], entry["column"], ", ".join(entry["join"]), ", ".join(entry["filter"]),
+                      entry["index"] or "[red]missing[/red]")
+    console.print(table)
+
+
+def show_statement_results(results):
+    for stmt, seconds, error in results:
+        status = f"[red]{error}[/red]" if error else f"[green]{seconds:.3f}s[/green]"
+        console.print(f"{' '.join(stmt.split())}: {status}")
+
+
+def show_comparison(before, after):
+    table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
+    for col in ["Case", "Rows", "Cost Before", "Cost After", "ms Before", "ms After", "Plan Before", "Plan After"]:
+        table.add_column(col)
+    for name, old in before.items():
+        new = after.get(name, {})
+        if old["error"] or new.get("error"):
+            table.add_row(name, "", "", "", "", "", f"[red]{old['error'] or ''}[/red]",
+                          f"[red]{new.get('error') or ''}[/red]")
+            continue
+        changed = old["paths"] != new["paths"]
+        table.add_row(name, str(new["rows"]), str(old["cost"]), str(new["cost"]),
+                      f"{old['ms']:.2f}", f"{new['ms']:.2f}",
+                      "\n".join(old["paths"]), ("[green]" if changed else "") + "\n".join(new["paths"])
+                      + ("[/green]" if changed else ""))
+    console.print(table)
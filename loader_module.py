@@ -0,0 +1,317 @@
+# loader_module.py
+
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from rich.console import Console
+from rich.table import Table
+from rich import box
+
+import executor_module
+import pool_module
+import catalog_module
+import script_module
+
+# Initialize Rich Console
+console = Console()
+
+# Rows sent per executemany call (and per commit)
+BATCH_SIZE = 500
+
+# Single-row INSERT: table, optional column list, and the VALUES (...) body
+INSERT_PATTERN = re.compile(
+    r"^\s*INSERT\s+INTO\s+([\w$#.]+)\s*(\(([^)]*)\))?\s*VALUES\s*\((.*)\)\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+NUMBER_PATTERN = re.compile(r"\d+(\.\d+)?([eE][+-]?\d+)?")
+TYPED_LITERAL_PATTERN = re.compile(r"\b(DATE|TIMESTAMP|INTERVAL)\s*$", re.IGNORECASE)
+
+
+def parse_insert(statement):
+    """
+    Splits a single-row INSERT ... VALUES (...) statement into a bind template
+    and its literal values.
+
+    Every string and numeric literal becomes a positional bind, while
+    expressions such as TO_DATE(...), SYSDATE or NULL stay in the template.
+    Statements with the same table, column list and expression shape
+    therefore share one template and can be array-bound together.
+    Returns (table, template, values), or None if the statement is not a
+    single-row INSERT.
+    """
+    match = INSERT_PATTERN.match(statement)
+    if not match:
+        return None
+    table = match.group(1)
+    columns = match.group(3)
+    body = match.group(4)
+
+    parts = []
+    values = []
+    depth = 0
+    i = 0
+    while i < len(body):
+        char = body[i]
+        last = parts[-1].rstrip()[-1:] if parts else "("
+        if char == "'":
+            # String literal with '' as the escaped quote
+            j = i + 1
+            literal = []
+            while True:
+                if j >= len(body):
+                    return None
+                if body[j] == "'":
+                    if body[j + 1:j + 2] == "'":
+                        literal.append("'")
+                        j += 2
+                        continue
+                    break
+                literal.append(body[j])
+                j += 1
+            if TYPED_LITERAL_PATTERN.search("".join(parts[-12:])):
+                # DATE '...' / TIMESTAMP '...' literals cannot take a bind
+                parts.append(body[i:j + 1])
+            else:
+                values.append("".join(literal))
+                parts.append(f":{len(values)}")
+            i = j + 1
+            continue
+        signed = char in "+-" and last in "(,"
+        number = NUMBER_PATTERN.match(body, i + 1 if signed else i)
+        if number and not (last.isalnum() or last in "_:"):
+            text = body[i:number.end()]
+            # Decimal keeps fractions such as 0.35 exact, as the literal would be
+            values.append(Decimal(text) if any(c in text for c in ".eE") else int(text))
+            parts.append(f":{len(values)}")
+            i = number.end()
+            continue
+        if char.isspace():
+            # Keep one space only where it separates two words (e.g. DATE '...')
+            j = i
+            while j < len(body) and body[j].isspace():
+                j += 1
+            following = body[j:j + 1]
+            if (last.isalnum() or last == "_") and (following.isalnum() or following in "_'"):
+                parts.append(" ")
+            i = j
+            continue
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            char = ", "
+        parts.append(char)
+        i += 1
+
+    if depth != 0 or not values:
+        return None
+    column_list = f" ({', '.join(c.strip() for c in columns.split(','))})" if columns else ""
+    template = f"INSERT INTO {table}{column_list} VALUES ({''.join(parts)})"
+    return table.upper(), template, values
+
+
+def _executemany(connection, template, rows, stats):
+    """
+    Array-binds one batch. Rows the database rejects are counted as failed
+    without aborting the rest of the batch.
+    """
+    cache = executor_module.statement_cache(connection)
+    cursor = cache.cursor(template) if cache is not None else connection.cursor()
+    try:
+        cursor.executemany(template, rows, batcherrors=True)
+        failed = len(cursor.getbatcherrors())
+    except TypeError:
+        # Driver without batch error support: retry row by row on failure
+        failed = 0
+        try:
+            cursor.executemany(template, rows)
+        except Exception:
+            connection.rollback()
+            for row in rows:
+                try:
+                    cursor.execute(template, row)
+                except Exception:
+                    failed += 1
+    except Exception:
+        # The whole batch was rejected (e.g. a missing table)
+        failed = len(rows)
+    connection.commit()
+    stats["rows"] += len(rows) - failed
+    stats["failed"] += failed
+    stats["batches"] += 1
+
+
+def load_statements(connection, statements, batch_size=BATCH_SIZE):
+    """
+    Executes a stream of SQL statements, rewriting runs of single-row INSERTs
+    that share a template into executemany batches committed per batch.
+    Other statements run one at a time; errors are ignored the same way
+    execute_sql_file ignores them. Returns per-table load statistics.
+    """
+    report = {}
+    pending = {"table": None, "template": None, "rows": []}
+
+    def flush():
+        if pending["rows"]:
+            stats = report.setdefault(pending["table"], {"rows": 0, "failed": 0, "batches": 0, "seconds": 0.0})
+            started = time.perf_counter()
+            _executemany(connection, pending["template"], pending["rows"], stats)
+            stats["seconds"] += time.perf_counter() - started
+            pending["rows"] = []
+
+    for stmt in statements:
+        if not stmt:
+            continue
+        if stmt.upper().startswith('SET') or stmt.upper().startswith('SPOOL'):
+            continue
+        parsed = parse_insert(stmt)
+        if parsed is None:
+            flush()
+            pending["template"] = None
+            cursor = connection.cursor()
+            try:
+                cursor.execute(stmt)
+            except Exception:
+                pass  # Silently ignore errors
+            cursor.close()
+            continue
+        table, template, values = parsed
+        if template != pending["template"]:
+            flush()
+            pending["table"], pending["template"] = table, template
+        pending["rows"].append(values)
+        if len(pending["rows"]) >= batch_size:
+            flush()
+    flush()
+    connection.commit()
+    return report
+
+
+def show_load_report(report):
+    """
+    Prints rows loaded and rows per second for each table.
+    """
+    table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
+    for col in ["Table", "Rows", "Failed", "Batches", "Seconds", "Rows/sec"]:
+        table.add_column(col)
+    for name, stats in report.items():
+        rate = stats["rows"] / stats["seconds"] if stats["seconds"] > 0 else 0
+        table.add_row(name, str(stats["rows"]), str(stats["failed"]), str(stats["batches"]),
+                      f"{stats['seconds']:.3f}", f"{rate:,.0f}")
+    console.print(table)
+
+
+def load_rows(connection, table, columns, rows, batch_size=BATCH_SIZE, report=None):
+    """
+    Array-binds an iterable of row tuples into `table`, batch_size rows per
+    executemany call and commit, without materializing the iterable.
+    """
+    report = {} if report is None else report
+    stats = report.setdefault(table.upper(), {"rows": 0, "failed": 0, "batches": 0, "seconds": 0.0})
+    binds = ", ".join(f":{i}" for i in range(1, len(columns) + 1))
+    template = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({binds})"
+    batch = []
+    started = time.perf_counter()
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            _executemany(connection, template, batch, stats)
+            batch = []
+    if batch:
+        _executemany(connection, template, batch, stats)
+    stats["seconds"] += time.perf_counter() - started
+    return report
+
+
+def split_by_table(statements, directory):
+    """
+    Spools the INSERT statements of a script into one file per table under
+    `directory`, so each table can be loaded on its own session without
+    holding the script in memory. Returns ({table: path}, other statements).
+    """
+    paths = {}
+    files = {}
+    other = []
+    try:
+        for stmt in statements:
+            match = INSERT_PATTERN.match(stmt)
+            if not match:
+                if stmt and not stmt.upper().startswith(('SET', 'SPOOL')):
+                    other.append(stmt)
+                continue
+            # Schema-qualified names (TSELCUK.Books) load into the same table
+            table = match.group(1).split(".")[-1].upper()
+            if table not in files:
+                paths[table] = os.path.join(directory, f"{table}.sql")
+                files[table] = open(paths[table], "w", encoding="utf-8")
+            files[table].write(stmt + ";\n")
+    finally:
+        for file in files.values():
+            file.close()
+    return paths, other
+
+
+def _load_table(pool, path, batch_size):
+    # Runs on a worker thread with its own pooled session
+    with pool.session() as session:
+        return load_statements(session, script_module.read_statements(path), batch_size)
+
+
+def bulk_load(connection, file_path, batch_size=BATCH_SIZE):
+    """
+    Loads a data script tier by tier in foreign key order. Tables in the same
+    tier reference none of each other, so they are loaded in parallel, one
+    pooled session each, with array-bound INSERT batches. A tier starts once
+    the previous one has committed. Plain (non-pooled) connections load the
+    same order serially.
+    Returns (per-table report, [(tier tables, seconds)], total seconds).
+    """
+    started = time.perf_counter()
+    report = {}
+    timings = []
+    with tempfile.TemporaryDirectory(prefix="bulk_load_") as directory:
+        paths, other = split_by_table(script_module.read_statements(file_path), directory)
+
+        # Statements other than INSERTs (sequence resets, ...) run first
+        if other:
+            load_statements(connection, other, batch_size)
+        tiers = catalog_module.load_tiers(connection, list(paths))
+        # The workers need the pool's sessions, including the one held here
+        pool_module.release_session(connection)
+
+        for tier in tiers:
+            tier_started = time.perf_counter()
+            if isinstance(connection, pool_module.PooledConnection):
+                workers = max(1, min(len(tier), connection.pool.max))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [executor.submit(_load_table, connection.pool, paths[t], batch_size) for t in tier]
+                    results = [future.result() for future in futures]
+            else:
+                results = [load_statements(connection, script_module.read_statements(paths[t]), batch_size)
+                           for t in tier]
+            for result in results:
+                for name, stats in result.items():
+                    report[name.split(".")[-1]] = stats
+            timings.append((tier, time.perf_counter() - tier_started))
+    return report, timings, time.perf_counter() - started
+
+
+def show_bulk_report(report, timings, seconds):
+    """
+    Prints the per-table load report, then each tier's wall time against the
+    time its tables would have taken one after another.
+    """
+    show_load_report(report)
+    table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
+    for col in ["Tier", "Tables", "Wall Seconds", "Serial Seconds"]:
+        table.add_column(col)
+    for number, (tables, wall) in enumerate(timings, start=1):
+        serial = sum(report.get(t, {}).get("seconds", 0.0) for t in tables)
+        table.add_row(str(number), ", ".join(tables), f"{wall:.3f}", f"{serial:.3f}")
+    console.print(table)
+    serial = sum(stats["seconds"] for stats in report.values())
+    console.print(f"Total: {seconds:.3f}s wall clock, {serial:.3f}s of table loading.")
@@ -0,0 +1,105 @@
+# lookup_module.py
+
+import sqlite3
+import cx_Oracle
+from rich.console import Console
+
+import executor_module
+import pool_module
+
+# Initialize Rich Console
+console = Console()
+
+# Batch lookups: name -> (table, key column, key type)
+LOOKUPS = {
+    "books": ("Books", "ISBN", str),
+    "borrowers": ("Borrowers", "Borrower_ID", int),
+    "users": ("Users", "User_ID", int),
+    "loans": ("Loans", "Loan_Number", int),
+}
+
+# Collection types every Oracle database grants to PUBLIC, by key type
+COLLECTION_TYPES = {str: "SYS.ODCIVARCHAR2LIST", int: "SYS.ODCINUMBERLIST"}
+
+# Keys per statement when the keys are bound as an IN list instead. Short
+# chunks are padded to this size so every chunk reuses one statement text.
+IN_LIST_CHUNK = 100
+
+# Whether the collection types can be used; None until first tried
+_collections = {"available": None}
+
+
+def parse_keys(lookup, text):
+    """
+    Splits pasted or scanned keys (commas, spaces or new lines) into a
+    de-duplicated list of keys of the lookup's type. Raises ValueError for
+    a key that is not a number where one is expected.
+    """
+    key_type = LOOKUPS[lookup][2]
+    keys = []
+    for part in text.replace(",", " ").split():
+        key = key_type(part)
+        if key not in keys:
+            keys.append(key)
+    return keys
+
+
+def _collection_type(connection, name):
+    # gettype is a round trip, so each pooled session keeps the types it has read
+    if isinstance(connection, pool_module.PooledConnection):
+        types = connection.pool.session_state(connection.session).setdefault("types", {})
+        if name not in types:
+            types[name] = connection.gettype(name)
+        return types[name]
+    return connection.gettype(name)
+
+
+def _by_collection(connection, table, key, key_type, keys):
+    collection = _collection_type(connection, COLLECTION_TYPES[key_type]).newobject()
+    collection.extend(keys)
+    # A fixed cardinality guess keeps the plan on primary key probes, whatever the batch size
+    return executor_module.execute(connection, f"""
+        SELECT * FROM {table}
+        WHERE {key} IN (SELECT /*+ CARDINALITY(K 100) */ COLUMN_VALUE FROM TABLE(:ids) K)
+    """, ids=collection)
+
+
+def _by_in_lists(connection, table, key, keys):
+    sql = f"SELECT * FROM {table} WHERE {key} IN ({', '.join(f':k{i}' for i in range(IN_LIST_CHUNK))})"
+    for start in range(0, len(keys), IN_LIST_CHUNK):
+        chunk = keys[start:start + IN_LIST_CHUNK]
+        chunk += [chunk[-1]] * (IN_LIST_CHUNK - len(chunk))
+        yield executor_module.execute(connection, sql, {f"k{i}": value for i, value in enumerate(chunk)})
+
+
+def lookup(connection, name, keys):
+    """
+    Fetches the rows of `keys` from the `name` lookup ("books",
+    "borrowers", "users" or "loans") and returns {key: {column: value}}.
+    Keys that do not exist are absent from the result. In Oracle all keys
+    are bound as one collection, so a batch costs one round trip; where the
+    collection types cannot be used the keys go as IN lists of
+    IN_LIST_CHUNK.
+    """
+    table, key, key_type = LOOKUPS[name]
+    keys = list(dict.fromkeys(keys))
+    if not keys:
+        return {}
+    cursors = None
+    if not isinstance(connection, sqlite3.Connection) and _collections["available"] is not False:
+        try:
+            cursors = [_by_collection(connection, table, key, key_type, keys)]
+            _collections["available"] = True
+        except cx_Oracle.DatabaseError as e:
+            error, = e.args
+            console.print(f"[yellow]Collection binds unavailable ({error.message}); using IN lists.[/yellow]")
+            _collections["available"] = False
+    if cursors is None:
+        cursors = _by_in_lists(connection, table, key, keys)
+    found = {}
+    for cursor in cursors:
+        columns = [desc[0] for desc in cursor.description]
+        position = [c.upper() for c in columns].index(key.upper())
+        for row in cursor.fetchall():
+            found[row[position]] = dict(zip(columns, row))
+    return found
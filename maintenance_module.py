@@ -0,0 +1,102 @@
+# maintenance_module.py
+
+import re
+import time
+import cx_Oracle
+from rich.console import Console
+from rich.table import Table
+from rich import box
+
+import catalog_module
+import script_module
+
+# Initialize Rich Console
+console = Console()
+
+# Safe-mode reset script; fast mode truncates the same tables
+RESET_SCRIPT = "delete_all_data.sql"
+
+DELETE_ALL_PATTERN = re.compile(r"^\s*DELETE\s+FROM\s+([\w$#.]+)\s*$", re.IGNORECASE)
+
+
+def script_tables(file_path):
+    """
+    Returns the tables a reset script empties with DELETE FROM <table>, in
+    script order.
+    """
+    tables = []
+    for stmt in script_module.read_statements(file_path):
+        match = DELETE_ALL_PATTERN.match(stmt)
+        if match and match.group(1).upper() not in tables:
+            tables.append(match.group(1).upper())
+    return tables
+
+
+def truncate_tables(connection, tables):
+    """
+    Empties `tables` with TRUNCATE. Foreign keys between them are disabled
+    first (Oracle refuses to truncate a table referenced by an enabled
+    foreign key, ORA-02266) and re-enabled afterwards, even if a truncate
+    fails. Tables are truncated children first.
+    Returns [(table, seconds, error message or None)] and the list of
+    constraints that could not be re-enabled.
+    """
+    order = catalog_module.child_first_order(connection, tables)
+    wanted = set(order)
+    constraints = [(child, name) for child, name, status in catalog_module.foreign_key_constraints(connection, order)
+                   if child.upper() in wanted and status == "ENABLED"]
+    cursor = connection.cursor()
+    timings = []
+    disabled = []
+    not_enabled = []
+    try:
+        for child, name in constraints:
+            cursor.execute(f"ALTER TABLE {child} DISABLE CONSTRAINT {name}")
+            disabled.append((child, name))
+        for table in order:
+            started = time.perf_counter()
+            try:
+                cursor.execute(f"TRUNCATE TABLE {table}")
+                timings.append((table, time.perf_counter() - started, None))
+            except cx_Oracle.DatabaseError as e:
+                error, = e.args
+                timings.append((table, time.perf_counter() - started, error.message))
+    finally:
+        for child, name in disabled:
+            try:
+                cursor.execute(f"ALTER TABLE {child} ENABLE CONSTRAINT {name}")
+            except cx_Oracle.DatabaseError as e:
+                error, = e.args
+                not_enabled.append(f"{child}.{name}: {error.message}")
+        cursor.close()
+    return timings, not_enabled
+
+
+def show_reset_report(timings, not_enabled):
+    table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
+    for col in ["Table", "Seconds", "Status"]:
+        table.add_column(col)
+    for name, seconds, error in timings:
+        table.add_row(name, f"{seconds:.3f}", f"[red]{error}[/red]" if error else "Truncated")
+    console.print(table)
+    console.print(f"Total: {sum(seconds for _, seconds, _ in timings):.3f}s")
+    for failure in not_enabled:
+        console.print(f"[red]Could not re-enable constraint {failure}[/red]")
+
+
+def fast_reset(connection, file_path=RESET_SCRIPT):
+    """
+    Fast mode of delete_all_data: truncates every table the reset script
+    deletes from. TRUNCATE is DDL, so it commits immediately and cannot be
+    rolled back.
+    """
+    try:
+        tables = script_tables(file_path)
+        if not tables:
+            console.print(f"[red]No DELETE FROM statements found in {file_path}.[/red]")
+            return
+        timings, not_enabled = truncate_tables(connection, tables)
+        show_reset_report(timings, not_enabled)
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        console.print(f"[red]Fast reset failed: {error.message}[/red]")
@@ -0,0 +1,166 @@
+# mview_module.py
+
+import time
+import cx_Oracle
+from rich.console import Console
+from rich.table import Table
+from rich import box
+
+import executor_module
+
+# Initialize Rich Console
+console = Console()
+
+CREATE_SCRIPT = "create_materialized_views.sql"
+DROP_SCRIPT = "delete_materialized_views.sql"
+
+# Seconds the list of existing materialized views is trusted before it is re-read
+PRESENCE_TTL = 60
+
+# Report function -> (materialized view it can read, query against that view)
+MVIEW_REPORT_QUERIES = {
+    "find_top_borrowed_authors": ("MV_TOPBORROWEDAUTHORS", """
+    SELECT
+        Author_ID,
+        Author_Name,
+        Borrow_Count
+    FROM
+        MV_TopBorrowedAuthors
+    ORDER BY
+        Borrow_Count DESC
+    FETCH FIRST 5 ROWS ONLY
+    """),
+    "list_overdue_loans": ("MV_OPENLOANS", """
+    SELECT
+        Borrower_ID,
+        First_Name || ' ' || Last_Name AS Borrower_Name,
+        Loan_Number,
+        Due_Date,
+        Return_Status,
+        TRUNC(SYSDATE - Due_Date) AS Days_Overdue
+    FROM
+        MV_OpenLoans
+    WHERE
+        Due_Date < SYSDATE
+    ORDER BY
+        Days_Overdue DESC
+    """),
+    "find_genres_with_most_books": ("MV_GENREBOOKCOUNT", """
+    SELECT
+        Genre_ID,
+        Genre_Title,
+        Number_of_Books
+    FROM
+        MV_GenreBookCount
+    WHERE
+        Number_of_Books > 1
+    """),
+}
+
+# Views whose reports need current data: used only while refreshed on
+# commit or fresh. The others are read even when stale, with a note.
+CURRENT_MVIEWS = {"MV_OPENLOANS"}
+
+MVIEWS_QUERY = """
+SELECT MView_Name, Refresh_Mode, Refresh_Method, Staleness, Last_Refresh_Type, Last_Refresh_Date
+FROM User_MViews
+WHERE MView_Name IN ('MV_TOPBORROWEDAUTHORS', 'MV_OPENLOANS', 'MV_GENREBOOKCOUNT')
+ORDER BY MView_Name
+"""
+
+# Cached usable materialized views ({name: (staleness, last refresh)}) and
+# when they were read
+_presence = {"views": {}, "checked": None}
+
+
+def forget_presence():
+    """
+    Makes the next report re-check which materialized views exist.
+    """
+    _presence["checked"] = None
+
+
+def present_mviews(connection):
+    checked = _presence["checked"]
+    if checked is None or time.monotonic() - checked > PRESENCE_TTL:
+        try:
+            rows = executor_module.fetch_all(connection, MVIEWS_QUERY)
+            _presence["views"] = {row[0]: (row[3], row[5]) for row in rows if row[3] != "UNUSABLE" and
+                                  (row[0] not in CURRENT_MVIEWS or row[1] == "COMMIT" or row[3] == "FRESH")}
+        except cx_Oracle.DatabaseError:
+            _presence["views"] = {}
+        _presence["checked"] = time.monotonic()
+    return _presence["views"]
+
+
+def report_query(connection, report, default_query):
+    """
+    Returns the query a report should run: the one reading its materialized
+    view when that view exists (and, for CURRENT_MVIEWS, is kept current),
+    otherwise the report's own inline query. Says so when the view read is
+    stale.
+    """
+    mview = MVIEW_REPORT_QUERIES.get(report)
+    views = present_mviews(connection)
+    if mview is None or mview[0] not in views:
+        return default_query
+    staleness, last_refresh = views[mview[0]]
+    if staleness != "FRESH":
+        console.print(f"[yellow]{mview[0]} is {staleness} as of its last refresh ({last_refresh}); "
+                      f"refresh it from Tools > Materialized View Status & Refresh for current totals.[/yellow]")
+    return mview[1]
+
+
+def mview_status(connection):
+    """
+    Returns one dict per library materialized view with its refresh settings
+    and staleness.
+    """
+    columns = ["name", "mode", "method", "staleness", "last_refresh_type", "last_refresh"]
+    return [dict(zip(columns, row)) for row in executor_module.fetch_all(connection, MVIEWS_QUERY)]
+
+
+def refresh_mviews(connection):
+    """
+    Refreshes every library materialized view (fast when its logs allow it,
+    complete otherwise) and returns (name, staleness before, seconds,
+    staleness after, error or None) for each.
+    """
+    results = []
+    cursor = connection.cursor()
+    try:
+        for status in mview_status(connection):
+            started = time.perf_counter()
+            error = None
+            try:
+                cursor.execute("BEGIN DBMS_MVIEW.REFRESH(:name, '?'); END;", name=status["name"])
+            except cx_Oracle.DatabaseError as e:
+                error, = e.args
+                error = error.message
+            seconds = time.perf_counter() - started
+            after = executor_module.fetch_one(connection, "SELECT Staleness FROM User_MViews WHERE MView_Name = :name",
+                                              name=status["name"])
+            results.append((status["name"], status["staleness"], seconds, after[0] if after else None, error))
+    finally:
+        cursor.close()
+    forget_presence()
+    return results
+
+
+def show_mview_status(connection):
+    table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
+    for col in ["Materialized View", "Refresh", "Staleness", "Last Refresh"]:
+        table.add_column(col)
+    for status in mview_status(connection):
+        table.add_row(status["name"], f"{status['method']} ON {status['mode']}", str(status["staleness"]),
+                      f"{status['last_refresh']} ({status['last_refresh_type']})")
+    console.print(table)
+
+
+def show_refresh_report(results):
+    table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
+    for col in ["Materialized View", "Staleness Before", "Seconds", "Staleness After"]:
+        table.add_column(col)
+    for name, before, seconds, after, error in results:
+        table.add_row(name, str(before), f"{seconds:.3f}", f"[red]{error}[/red]" if error else str(after))
+    console.print(table)
@@ -0,0 +1,215 @@
+# partition_module.py
+
+import re
+import time
+import cx_Oracle
+from rich.console import Console
+from rich.table import Table
+from rich import box
+
+import executor_module
+import script_module
+
+# Initialize Rich Console
+console = Console()
+
+PARTITIONED_SCHEMA = "schema_creation_partitioned.sql"
+
+# Interim table used by migrate_loans; after the swap it holds the original
+# rows and is renamed to the retired name
+INTERIM_TABLE = "Loans_Part"
+OLD_TABLE = "Loans_Old"
+
+LOANS_TABLE_PATTERN = re.compile(r"^\s*CREATE\s+TABLE\s+Loans\b", re.IGNORECASE)
+LOANS_INDEX_PATTERN = re.compile(r"^\s*CREATE\s+INDEX\s+(\w+)\s+ON\s+Loans\b", re.IGNORECASE)
+
+LOANS_PARTITIONING_QUERY = """
+SELECT Partitioning_Type, Interval
+FROM User_Part_Tables
+WHERE Table_Name = 'LOANS'
+"""
+
+LOANS_PARTITIONS_QUERY = """
+SELECT COUNT(*)
+FROM User_Tab_Partitions
+WHERE Table_Name = 'LOANS'
+"""
+
+# Foreign keys of a table (used to retire Loans_Old's after the swap)
+FOREIGN_KEYS_OF_QUERY = "SELECT Constraint_Name FROM User_Constraints WHERE Table_Name = :name AND Constraint_Type = 'R'"
+
+LOANS_MVIEW_LOGS_QUERY = "SELECT Log_Table FROM User_MView_Logs WHERE Master = 'LOANS'"
+
+
+def partitioned_loans_ddl(file_path=PARTITIONED_SCHEMA):
+    """
+    Returns the partitioned Loans CREATE TABLE statement and its
+    [(index name, CREATE INDEX statement)] from the partitioned schema script.
+    """
+    table = None
+    indexes = []
+    for stmt in script_module.read_statements(file_path):
+        if LOANS_TABLE_PATTERN.match(stmt):
+            table = stmt
+        else:
+            match = LOANS_INDEX_PATTERN.match(stmt)
+            if match:
+                indexes.append((match.group(1), stmt))
+    return table, indexes
+
+
+def loans_partitioning(connection):
+    """
+    Returns (partitioning type, interval, partition count) for Loans, or None
+    when Loans is not partitioned.
+    """
+    row = executor_module.fetch_one(connection, LOANS_PARTITIONING_QUERY)
+    if row is None:
+        return None
+    return row[0], row[1], executor_module.fetch_one(connection, LOANS_PARTITIONS_QUERY)[0]
+
+
+# Online redefinition of Loans into the interim table (primary key based).
+# DBMS_REDEFINITION tracks the changes made during the copy itself, and
+# FINISH_REDEF_TABLE applies the last ones and swaps the two tables' names
+# in the dictionary under a brief lock, so no write is lost and there is no
+# moment without a table called Loans.
+CAN_REDEF_BLOCK = "BEGIN DBMS_REDEFINITION.CAN_REDEF_TABLE(USER, 'LOANS', DBMS_REDEFINITION.CONS_USE_PK); END;"
+START_REDEF_BLOCK = """
+BEGIN
+    DBMS_REDEFINITION.START_REDEF_TABLE(uname => USER, orig_table => 'LOANS', int_table => :interim,
+                                        options_flag => DBMS_REDEFINITION.CONS_USE_PK);
+END;
+"""
+# Triggers and grants follow the table; the indexes come from the partitioned
+# script and the constraints from its CREATE TABLE
+COPY_DEPENDENTS_BLOCK = """
+DECLARE
+    errors PLS_INTEGER;
+BEGIN
+    DBMS_REDEFINITION.COPY_TABLE_DEPENDENTS(uname => USER, orig_table => 'LOANS', int_table => :interim,
+                                            copy_indexes => 0, copy_triggers => TRUE, copy_constraints => FALSE,
+                                            copy_privileges => TRUE, ignore_errors => FALSE, num_errors => errors);
+END;
+"""
+SYNC_REDEF_BLOCK = "BEGIN DBMS_REDEFINITION.SYNC_INTERIM_TABLE(USER, 'LOANS', :interim); END;"
+FINISH_REDEF_BLOCK = "BEGIN DBMS_REDEFINITION.FINISH_REDEF_TABLE(USER, 'LOANS', :interim); END;"
+ABORT_REDEF_BLOCK = "BEGIN DBMS_REDEFINITION.ABORT_REDEF_TABLE(USER, 'LOANS', :interim); END;"
+
+
+def migrate_loans(connection, file_path=PARTITIONED_SCHEMA):
+    """
+    Converts an unpartitioned Loans table into the partitioned layout of the
+    partitioned schema script with online redefinition, while the library
+    stays usable:
+
+    1. the partitioned table is created as Loans_Part and START_REDEF_TABLE
+       copies the rows into it, recording changes made meanwhile;
+    2. the existing Loans indexes are renamed out of the way and the
+       script's indexes are built on Loans_Part under their own names;
+    3. SYNC_INTERIM_TABLE applies the changes made during steps 1-2;
+    4. FINISH_REDEF_TABLE applies the last changes and swaps the tables
+       under a brief lock. The original rows are kept as Loans_Old for
+       verification, with their foreign keys disabled so they do not block
+       deleting the books, borrowers and administrators they refer to.
+
+    Returns a list of (step, seconds, detail) for show_migration_report.
+    Raises ValueError when Loans cannot be migrated.
+    """
+    if loans_partitioning(connection) is not None:
+        raise ValueError("Loans is already partitioned.")
+    if executor_module.fetch_one(connection, LOANS_MVIEW_LOGS_QUERY) is not None:
+        raise ValueError("Loans has a materialized view log. Drop the materialized views (option 6) first.")
+    missing_dates = executor_module.fetch_one(connection, "SELECT COUNT(*) FROM Loans WHERE Loan_Date IS NULL")[0]
+    if missing_dates:
+        raise ValueError(f"{missing_dates} loans have no Loan_Date, the partition key. Set it before migrating.")
+    table_ddl, index_ddl = partitioned_loans_ddl(file_path)
+    if table_ddl is None:
+        raise ValueError(f"No CREATE TABLE Loans statement found in {file_path}.")
+
+    interim = INTERIM_TABLE.upper()
+    steps = []
+    renamed = []
+    created = redefining = swapped = False
+    cursor = connection.cursor()
+    try:
+        # 1. Interim table and initial copy
+        started = time.perf_counter()
+        cursor.execute(CAN_REDEF_BLOCK)
+        cursor.execute(LOANS_TABLE_PATTERN.sub(f"CREATE TABLE {INTERIM_TABLE}", table_ddl, count=1))
+        created = True
+        steps.append(("Create partitioned table", time.perf_counter() - started, INTERIM_TABLE))
+
+        started = time.perf_counter()
+        cursor.execute(START_REDEF_BLOCK, interim=interim)
+        redefining = True
+        cursor.execute(f"SELECT COUNT(*) FROM {INTERIM_TABLE}")
+        copied = cursor.fetchone()[0]
+        steps.append(("Copy rows", time.perf_counter() - started, f"{copied} rows"))
+
+        # 2. Indexes under the final names, then triggers and grants
+        started = time.perf_counter()
+        cursor.execute("SELECT Index_Name FROM User_Indexes WHERE Table_Name = 'LOANS'")
+        existing = {row[0] for row in cursor.fetchall()}
+        for name, stmt in index_ddl:
+            if name.upper() in existing:
+                cursor.execute(f"ALTER INDEX {name} RENAME TO {name[:26]}_OLD")
+                renamed.append(name)
+            cursor.execute(LOANS_INDEX_PATTERN.sub(f"CREATE INDEX {name} ON {INTERIM_TABLE}", stmt, count=1))
+        cursor.execute(COPY_DEPENDENTS_BLOCK, interim=interim)
+        steps.append(("Build indexes", time.perf_counter() - started, f"{len(index_ddl)} indexes"))
+
+        # 3. Catch up with changes made so far, so the final step has little left
+        started = time.perf_counter()
+        cursor.execute(SYNC_REDEF_BLOCK, interim=interim)
+        steps.append(("Catch up", time.perf_counter() - started, "SYNC_INTERIM_TABLE"))
+
+        # 4. Final catch-up and swap
+        started = time.perf_counter()
+        cursor.execute(FINISH_REDEF_BLOCK, interim=interim)
+        swapped = True
+        cursor.execute(f"ALTER TABLE {INTERIM_TABLE} RENAME TO {OLD_TABLE}")
+        cursor.execute(FOREIGN_KEYS_OF_QUERY, name=OLD_TABLE.upper())
+        retired = [row[0] for row in cursor.fetchall()]
+        for constraint in retired:
+            cursor.execute(f"ALTER TABLE {OLD_TABLE} DISABLE CONSTRAINT {constraint}")
+        steps.append(("Swap", time.perf_counter() - started,
+                      f"original kept as {OLD_TABLE}, {len(retired)} foreign keys disabled"))
+
+        cursor.execute(f"SELECT (SELECT COUNT(*) FROM Loans), (SELECT COUNT(*) FROM {OLD_TABLE}) FROM DUAL")
+        new_count, old_count = cursor.fetchone()
+        steps.append(("Verify", 0.0, f"{new_count} rows in Loans, {old_count} rows in {OLD_TABLE}"))
+    except cx_Oracle.DatabaseError:
+        connection.rollback()
+        if created and not swapped:
+            _abandon(cursor, renamed, redefining)
+        raise
+    finally:
+        cursor.close()
+    return steps
+
+
+def _abandon(cursor, renamed, redefining):
+    """
+    Undoes a migration that failed before the swap: ends the redefinition,
+    drops the interim table (and its indexes) and gives the original Loans
+    indexes their names back. Loans itself is untouched until the swap.
+    """
+    statements = [(ABORT_REDEF_BLOCK, {"interim": INTERIM_TABLE.upper()})] if redefining else []
+    statements.append((f"DROP TABLE {INTERIM_TABLE} PURGE", {}))
+    statements.extend((f"ALTER INDEX {name[:26]}_OLD RENAME TO {name}", {}) for name in renamed)
+    for stmt, params in statements:
+        try:
+            cursor.execute(stmt, params)
+        except cx_Oracle.DatabaseError:
+            pass  # Best effort; the original error is re-raised
+
+
+def show_migration_report(steps):
+    table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
+    for col in ["Step", "Seconds", "Detail"]:
+        table.add_column(col)
+    for step, seconds, detail in steps:
+        table.add_row(step, f"{seconds:.3f}", detail)
+    console.print(table)
+    console.print(f"Total: {sum(seconds for _, seconds, _ in steps):.3f}s")
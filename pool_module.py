@@ -0,0 +1,306 @@
+# pool_module.py
+
+import threading
+import time
+
+# Pool sizing defaults (same meaning as the cx_Oracle.SessionPool arguments)
+POOL_MIN = 1            # Sessions opened when the pool is created
+POOL_MAX = 4            # Hard cap on concurrent sessions held by this process
+POOL_INCREMENT = 1      # Sessions opened at a time when the pool has to grow
+PING_INTERVAL = 60      # Seconds a session may sit idle before it is pinged on acquire
+ACQUIRE_TIMEOUT = 30    # Seconds to wait for a free session when the pool is exhausted
+
+# Oracle errors that mean the server side of a session is gone
+DISCONNECT_CODES = {28, 1012, 1089, 1092, 3113, 3114, 3135, 12153, 12537, 12547, 12570, 12571}
+DISCONNECT_PREFIXES = ("DPI-1010", "DPI-1080")
+
+
+def is_disconnect_error(error):
+    """
+    Returns True if a database exception was caused by a dropped session.
+    Works for cx_Oracle errors (which carry an error object with a code) and
+    for plain DB-API errors from other drivers.
+    """
+    detail = error.args[0] if error.args else error
+    code = getattr(detail, "code", None)
+    if code in DISCONNECT_CODES:
+        return True
+    message = str(getattr(detail, "message", detail))
+    return message.startswith(DISCONNECT_PREFIXES)
+
+
+class PoolExhaustedError(Exception):
+    """
+    Raised when no session becomes free within the acquire timeout.
+    """
+
+
+class SessionPool:
+    """
+    A thread-safe pool of database sessions.
+
+    `connect` is any zero-argument callable that returns a DB-API connection,
+    so the pool works the same with cx_Oracle and with a local driver such as
+    sqlite3. Sessions are pinged before reuse when they have been idle for
+    longer than `ping_interval` seconds; dead sessions are discarded and
+    replaced transparently.
+    """
+
+    def __init__(self, connect, min=POOL_MIN, max=POOL_MAX, increment=POOL_INCREMENT,
+                 ping_interval=PING_INTERVAL, ping_sql="SELECT 1 FROM DUAL",
+                 acquire_timeout=ACQUIRE_TIMEOUT, stmtcachesize=None):
+        if min < 0 or max < 1 or min > max or increment < 1:
+            raise ValueError("Invalid pool sizing: need 0 <= min <= max, max >= 1 and increment >= 1")
+        self.min = min
+        self.max = max
+        self.increment = increment
+        self.ping_interval = ping_interval
+        self.ping_sql = ping_sql
+        self.acquire_timeout = acquire_timeout
+        self.stmtcachesize = stmtcachesize
+        self._connect = connect
+        self._idle = []          # (connection, time it was returned to the pool)
+        self._state = {}         # Per-session client-side state, dropped with the session
+        self._opened = 0         # Sessions currently open, idle or busy
+        self._closed = False
+        self._condition = threading.Condition()
+        self.stats = {"acquired": 0, "opened": 0, "discarded": 0, "pings_failed": 0}
+        with self._condition:
+            self._opened += self.min
+        self._add_idle(self._open_reserved(self.min))
+
+    @property
+    def opened(self):
+        return self._opened
+
+    @property
+    def busy(self):
+        return self._opened - len(self._idle)
+
+    def _open(self):
+        connection = self._connect()
+        if self.stmtcachesize is not None:
+            try:
+                # Server statement cache of the driver (cx_Oracle: Connection.stmtcachesize)
+                connection.stmtcachesize = self.stmtcachesize
+            except (AttributeError, TypeError):
+                pass
+        return connection
+
+    def _open_reserved(self, count):
+        # Opens `count` sessions whose slots the caller already counted in
+        # _opened under the lock. Connecting can take seconds, so the lock is
+        # not held meanwhile. If a connect fails, its slot and the ones after
+        # it are given back and the sessions already opened go to the idle list.
+        connections = []
+        try:
+            for _ in range(count):
+                connections.append(self._open())
+        except Exception:
+            with self._condition:
+                self._opened -= count - len(connections)
+                self._condition.notify_all()
+            self._add_idle(connections)
+            raise
+        return connections
+
+    def _add_idle(self, connections):
+        with self._condition:
+            self.stats["opened"] += len(connections)
+            for connection in connections:
+                self._idle.append((connection, time.monotonic()))
+                self._condition.notify()
+
+    def acquire(self):
+        """
+        Returns a healthy session, opening new ones (up to max) as needed.
+        """
+        deadline = time.monotonic() + self.acquire_timeout
+        with self._condition:
+            while not self._idle and self._opened >= self.max:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolExhaustedError(f"No database session became free within {self.acquire_timeout} seconds.")
+                self._condition.wait(remaining)
+            if self._idle:
+                connection, returned_at = self._idle.pop()
+                grow = 0
+            else:
+                # Reserve the new sessions' slots; they are opened below
+                grow = min(self.increment, self.max - self._opened)
+                self._opened += grow
+
+        if grow:
+            connections = self._open_reserved(grow)
+            connection, returned_at = connections.pop(), time.monotonic()
+            self._add_idle(connections)
+            with self._condition:
+                self.stats["opened"] += 1
+        elif time.monotonic() - returned_at >= self.ping_interval and not self.ping(connection):
+            # The session was dropped while idle; replace it with a fresh one,
+            # reserving the slot before the dead session gives its own back
+            with self._condition:
+                self.stats["pings_failed"] += 1
+                self._opened += 1
+            self._discard(connection)
+            connection = self._open_reserved(1)[0]
+            with self._condition:
+                self.stats["opened"] += 1
+        with self._condition:
+            self.stats["acquired"] += 1
+        return connection
+
+    def release(self, connection, discard=False):
+        """
+        Returns a session to the pool. Uncommitted work is rolled back so the
+        next operation starts clean; a session that cannot roll back is dead
+        and is discarded instead of being reused.
+        """
+        if not discard and not self._closed:
+            try:
+                connection.rollback()
+            except Exception:
+                discard = True
+        if discard or self._closed:
+            self._discard(connection)
+            return
+        with self._condition:
+            self._idle.append((connection, time.monotonic()))
+            self._condition.notify()
+
+    def session_state(self, connection):
+        """
+        Returns a dict for client-side state tied to one session (cached
+        cursors, for example). It is thrown away when the session is.
+        """
+        with self._condition:
+            return self._state.setdefault(id(connection), {})
+
+    def _discard(self, connection):
+        with self._condition:
+            state = self._state.pop(id(connection), {})
+        for value in state.values():
+            close = getattr(value, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except Exception:
+                    pass
+        try:
+            connection.close()
+        except Exception:
+            pass
+        with self._condition:
+            self._opened -= 1
+            self.stats["discarded"] += 1
+            self._condition.notify()
+
+    def ping(self, connection):
+        """
+        Checks that a session is still usable.
+        """
+        try:
+            if hasattr(connection, "ping"):
+                connection.ping()
+            else:
+                cursor = connection.cursor()
+                cursor.execute(self.ping_sql)
+                cursor.fetchall()
+                cursor.close()
+            return True
+        except Exception:
+            return False
+
+    def session(self):
+        """
+        Context manager that acquires a session and always releases it.
+        """
+        return _PoolSession(self)
+
+    def clone(self, max):
+        """
+        Returns a new pool that opens sessions the same way as this one, for
+        work that needs more concurrent sessions than this pool allows.
+        """
+        return SessionPool(self._connect, min=0, max=max, increment=self.increment,
+                           ping_interval=self.ping_interval, ping_sql=self.ping_sql,
+                           acquire_timeout=self.acquire_timeout, stmtcachesize=self.stmtcachesize)
+
+    def close(self):
+        """
+        Closes every idle session. Busy sessions are closed when released.
+        """
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for connection, _ in idle:
+            self._discard(connection)
+
+
+class _PoolSession:
+    def __init__(self, pool):
+        self.pool = pool
+        self.connection = None
+
+    def __enter__(self):
+        self.connection = self.pool.acquire()
+        return self.connection
+
+    def __exit__(self, exc_type, exc, tb):
+        broken = exc is not None and is_disconnect_error(exc)
+        self.pool.release(self.connection, discard=broken)
+        return False
+
+
+class PooledConnection:
+    """
+    Connection-like handle shared by the menu modules.
+
+    A pooled session is acquired lazily on the first cursor() call and handed
+    back with release(), which the menu loops call after every operation, so a
+    terminal sitting at a prompt holds no server session.
+    """
+
+    def __init__(self, pool):
+        self.pool = pool
+        self._session = None
+
+    @property
+    def session(self):
+        if self._session is None:
+            self._session = self.pool.acquire()
+        return self._session
+
+    def cursor(self):
+        return self.session.cursor()
+
+    def commit(self):
+        if self._session is not None:
+            self._session.commit()
+
+    def rollback(self):
+        if self._session is not None:
+            self._session.rollback()
+
+    def release(self, discard=False):
+        if self._session is not None:
+            session, self._session = self._session, None
+            self.pool.release(session, discard=discard)
+
+    def close(self):
+        self.release()
+        self.pool.close()
+
+    def __getattr__(self, name):
+        # Driver-specific attributes (gettype, stmtcachesize, ...) go to the session
+        return getattr(self.session, name)
+
+
+def release_session(connection):
+    """
+    Hands the session behind `connection` back to its pool. Plain DB-API
+    connections are left untouched, so the menus also work without a pool.
+    """
+    release = getattr(type(connection), "release", None)
+    if release is not None:
+        connection.release()
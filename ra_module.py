@@ -1,9 +1,10 @@
 # ra_module.py
 
 import cx_Oracle
+import pool_module
+import executor_module
 from rich.console import Console
 from rich.prompt import Prompt, IntPrompt
-from rich.table import Table
 from rich import box
 from rich.panel import Panel
 
@@ -16,19 +17,7 @@ def execute_query(connection, query, params=None):
     Executes a SQL query and displays the results in a formatted table.
     """
     try:
-        cursor = connection.cursor()
-        if params:
-            cursor.execute(query, params)
-        else:
-            cursor.execute(query)
-        columns = [desc[0] for desc in cursor.description]
-        table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
-        for col in columns:
-            table.add_column(str(col))
-        for row in cursor:
-            table.add_row(*[str(item) if item is not None else "NULL" for item in row])
-        console.print(table)
-        cursor.close()
+        executor_module.execute_query(connection, query, params)
     except cx_Oracle.DatabaseError as e:
         error, = e.args
         console.print(f"[red]An error occurred: {error.message}[/red]")
@@ -714,6 +703,7 @@ def ra_operations(connection):
         else:
             console.print("[red]Invalid option. Please try again.[/red]")
 
+        pool_module.release_session(connection)
         pause()
 
 
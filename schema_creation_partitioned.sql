@@ -0,0 +1,138 @@
+-- schema_creation_partitioned.sql
+-- Variant of schema_creation.sql with Loans partitioned by month of
+-- Loan_Date. Interval partitioning creates each month's partition on the
+-- first insert into it, and queries bounded on Loan_Date (such as the books
+-- not borrowed in the last year report) read only the matching partitions.
+-- Loans indexes are LOCAL so each partition carries its own index segment,
+-- except the two open-loan indexes: those are probed without a Loan_Date
+-- bound, so they are global and one probe stays one probe however many
+-- months of history there are.
+-- The Loans indexes in create_indexes.sql are skipped when run afterwards
+-- (the names already exist).
+
+-- ========================
+-- CREATE TABLE Statements
+-- ========================
+
+-- Users table
+CREATE TABLE Users (
+    User_ID NUMBER PRIMARY KEY,
+    First_Name VARCHAR2(50) NOT NULL,
+    Last_Name VARCHAR2(50) NOT NULL,
+    Phone_Number VARCHAR2(20),
+    Email VARCHAR2(100) UNIQUE,
+    Username VARCHAR2(50) UNIQUE NOT NULL,
+    Password VARCHAR2(255) NOT NULL,
+    Street VARCHAR2(100),
+    City VARCHAR2(50),
+    State VARCHAR2(50),
+    ZIP_Code VARCHAR2(10)
+);
+
+-- Borrowers table
+CREATE TABLE Borrowers (
+    Borrower_ID NUMBER PRIMARY KEY,
+    User_ID NUMBER UNIQUE,
+    Borrowing_Limit NUMBER DEFAULT 5 CHECK (Borrowing_Limit > 0),
+    Amount_Payable NUMBER DEFAULT 0 CHECK (Amount_Payable >= 0),
+    FOREIGN KEY (User_ID) REFERENCES Users(User_ID)
+);
+
+-- Administrators table
+CREATE TABLE Administrators (
+    Admin_ID NUMBER PRIMARY KEY,
+    User_ID NUMBER UNIQUE,
+    Role VARCHAR2(100) NOT NULL,
+    Permissions VARCHAR2(255),
+    Last_Login DATE,
+    FOREIGN KEY (User_ID) REFERENCES Users(User_ID)
+);
+
+-- Authors table
+CREATE TABLE Authors (
+    Author_ID NUMBER PRIMARY KEY,
+    Name VARCHAR2(100) NOT NULL,
+    Biography CLOB,
+    Date_of_Birth DATE,
+    Date_of_Death DATE,
+    Nationality VARCHAR2(50),
+    Languages VARCHAR2(100)
+);
+
+-- Genres table
+CREATE TABLE Genres (
+    Genre_ID NUMBER PRIMARY KEY,
+    Title VARCHAR2(50) NOT NULL UNIQUE,
+    Description VARCHAR2(255)
+);
+
+-- Books table
+CREATE TABLE Books (
+    ISBN VARCHAR2(20) PRIMARY KEY,
+    Title VARCHAR2(200) NOT NULL,
+    Publication_Date DATE,
+    Pages NUMBER CHECK (Pages > 0),
+    Copies_Available NUMBER DEFAULT 1 CHECK (Copies_Available >= 0),
+    Publisher VARCHAR2(100),
+    Admin_ID NUMBER,
+    FOREIGN KEY (Admin_ID) REFERENCES Administrators(Admin_ID)
+);
+
+-- BookAuthor table
+CREATE TABLE BookAuthor (
+    ISBN VARCHAR2(20),
+    Author_ID NUMBER,
+    PRIMARY KEY (ISBN, Author_ID),
+    FOREIGN KEY (ISBN) REFERENCES Books(ISBN),
+    FOREIGN KEY (Author_ID) REFERENCES Authors(Author_ID)
+);
+
+-- BookGenre table
+CREATE TABLE BookGenre (
+    ISBN VARCHAR2(20),
+    Genre_ID NUMBER,
+    PRIMARY KEY (ISBN, Genre_ID),
+    FOREIGN KEY (ISBN) REFERENCES Books(ISBN),
+    FOREIGN KEY (Genre_ID) REFERENCES Genres(Genre_ID)
+);
+
+-- Loans table, one partition per month of Loan_Date. Loan_Date is the
+-- partition key, so it is required.
+CREATE TABLE Loans (
+    Loan_Number NUMBER PRIMARY KEY,
+    Borrower_ID NUMBER,
+    ISBN VARCHAR2(20),
+    Loan_Date DATE DEFAULT SYSDATE NOT NULL,
+    Due_Date DATE,
+    Return_Date DATE,
+    Fine_Amount NUMBER DEFAULT 0 CHECK (Fine_Amount >= 0),
+    Return_Status CHAR(1) CHECK (Return_Status IN ('Y', 'N')),
+    Admin_ID NUMBER,
+    FOREIGN KEY (Borrower_ID) REFERENCES Borrowers(Borrower_ID),
+    FOREIGN KEY (ISBN) REFERENCES Books(ISBN),
+    FOREIGN KEY (Admin_ID) REFERENCES Administrators(Admin_ID)
+)
+PARTITION BY RANGE (Loan_Date)
+INTERVAL (NUMTOYMINTERVAL(1, 'MONTH'))
+(
+    PARTITION P_Loans_Initial VALUES LESS THAN (DATE '2000-01-01')
+)
+ENABLE ROW MOVEMENT;
+
+-- ========================
+-- Loans Indexes
+-- ========================
+
+CREATE INDEX IX_Loans_Borrower_ID ON Loans (Borrower_ID) LOCAL;
+
+CREATE INDEX IX_Loans_ISBN ON Loans (ISBN) LOCAL;
+
+CREATE INDEX IX_Loans_Admin_ID ON Loans (Admin_ID) LOCAL;
+
+-- Global: the overdue report and the checkout limit check do not filter on
+-- Loan_Date, so a LOCAL index would be probed once per monthly partition
+CREATE INDEX IX_Loans_Open_Due_Date ON Loans (CASE WHEN Return_Status = 'N' THEN Due_Date END);
+
+CREATE INDEX IX_Loans_Open_Borrower_ID ON Loans (CASE WHEN Return_Status = 'N' THEN Borrower_ID END);
+
+CREATE INDEX IX_Loans_Loan_Date ON Loans (Loan_Date, ISBN) LOCAL;
@@ -0,0 +1,279 @@
+# script_module.py
+
+import io
+
+# First words of a PL/SQL block that ends at its matching END; (or at a "/" line)
+BLOCK_KEYWORDS = {"BEGIN", "DECLARE"}
+
+# CREATE ... <kind> statements that are stored PL/SQL units and only end at a "/" line
+UNIT_KINDS = {"PROCEDURE", "FUNCTION", "PACKAGE", "TRIGGER", "TYPE", "LIBRARY"}
+CREATE_MODIFIERS = {"OR", "REPLACE", "EDITIONABLE", "NONEDITIONABLE"}
+
+# SQL*Plus commands that take up one line and have no ";" terminator
+SQLPLUS_COMMANDS = {"SPOOL", "PROMPT", "REM", "REMARK", "WHENEVER", "EXIT", "QUIT", "SHOW", "DEFINE", "SET"}
+SQL_SET_OBJECTS = {"TRANSACTION", "ROLE", "CONSTRAINT", "CONSTRAINTS"}
+
+# Closing delimiters of q'X...X' strings; any other character closes itself
+Q_QUOTE_PAIRS = {"[": "]", "{": "}", "<": ">", "(": ")"}
+
+
+def _is_word_char(char):
+    return char.isalnum() or char in "_$#"
+
+
+class _Splitter:
+    """
+    Incremental tokenizer state for one script.
+
+    Characters are fed one line at a time; feed() returns the statements that
+    the line completed. Comments are dropped (optimizer hints /*+ ... */ are
+    kept), while string literals, q-quoted strings and quoted identifiers are
+    copied verbatim so a ";" or "--" inside them never splits a statement.
+    """
+
+    def __init__(self):
+        self.buffer = []        # Characters of the current statement
+        self.state = None       # None, "'", '"', "q", "--" or "/*"
+        self.q_close = None     # Closing delimiter of the current q'X...X' string
+        self.word = []          # Identifier being read
+        self.head = []          # First words of the statement (kind detection)
+        self.kind = None        # "sql", "block" or "unit" once known
+        self.depth = 0          # BEGIN/CASE ... END nesting of an anonymous block
+        self.opened = False     # The block has reached its first BEGIN
+        self.after_end = False  # Previous word was END (END IF / END LOOP / END CASE)
+        self.keep_comment = False
+
+    def _reset(self):
+        self.buffer = []
+        self.word = []
+        self.head = []
+        self.kind = None
+        self.depth = 0
+        self.opened = False
+        self.after_end = False
+
+    def _take(self, include_terminator=False):
+        statement = "".join(self.buffer).strip()
+        if include_terminator:
+            statement += ";"
+        self._reset()
+        return statement
+
+    def _classify(self):
+        words = [w for w in self.head if w not in CREATE_MODIFIERS]
+        if not words:
+            return None
+        if words[0] in BLOCK_KEYWORDS:
+            return "block"
+        if words[0] != "CREATE":
+            return "sql"
+        if len(words) < 2:
+            return None
+        return "unit" if words[1] in UNIT_KINDS else "sql"
+
+    def _end_word(self):
+        if not self.word:
+            return
+        word = "".join(self.word).upper()
+        self.word = []
+        if len(self.head) < 6:
+            self.head.append(word)
+        if self.kind is None:
+            self.kind = self._classify()
+        if self.kind != "block":
+            return
+        if self.after_end:
+            self.after_end = False
+            if word in ("IF", "LOOP"):
+                # END IF / END LOOP close constructs that were never counted
+                self.depth += 1
+                return
+            if word == "CASE":
+                # END CASE: the closing END was already counted
+                return
+        if word in ("BEGIN", "CASE"):
+            self.depth += 1
+            self.opened = self.opened or word == "BEGIN"
+        elif word == "END":
+            self.depth -= 1
+            self.after_end = True
+
+    def _sqlplus_line(self, line):
+        # Only a line that starts a statement can be a SQL*Plus command
+        if self.buffer and "".join(self.buffer).strip():
+            return False
+        words = line.split(None, 2)
+        if not words:
+            return False
+        first = words[0].upper().rstrip(";")
+        if first.startswith("@"):
+            return True
+        if first not in SQLPLUS_COMMANDS:
+            return False
+        if first == "SET" and len(words) > 1 and words[1].upper().rstrip(";") in SQL_SET_OBJECTS:
+            return False
+        return True
+
+    def feed(self, line):
+        statements = []
+        if self.state is None:
+            stripped = line.strip()
+            if stripped == "/":
+                # SQL*Plus terminator: ends a PL/SQL unit or re-runs the buffer
+                self._end_word()
+                statement = self._take()
+                if statement:
+                    statements.append(statement)
+                return statements
+            if self._sqlplus_line(stripped):
+                return statements
+
+        i = 0
+        length = len(line)
+        while i < length:
+            char = line[i]
+            state = self.state
+
+            if state == "--":
+                if char == "\n":
+                    self.state = None
+                    self.buffer.append(char)
+                i += 1
+                continue
+            if state == "/*":
+                if char == "*" and line[i + 1:i + 2] == "/":
+                    self.state = None
+                    if self.keep_comment:
+                        self.buffer.append("*/")
+                    else:
+                        self.buffer.append(" ")
+                    i += 2
+                    continue
+                if self.keep_comment:
+                    self.buffer.append(char)
+                i += 1
+                continue
+            if state in ("'", '"'):
+                self.buffer.append(char)
+                if char == state:
+                    if line[i + 1:i + 2] == state:
+                        # Doubled quote inside the literal
+                        self.buffer.append(state)
+                        i += 2
+                        continue
+                    self.state = None
+                i += 1
+                continue
+            if state == "q":
+                self.buffer.append(char)
+                if char == self.q_close and line[i + 1:i + 2] == "'":
+                    self.buffer.append("'")
+                    self.state = None
+                    i += 2
+                    continue
+                i += 1
+                continue
+
+            # Outside of any literal or comment
+            if char == "-" and line[i + 1:i + 2] == "-":
+                self._end_word()
+                self.state = "--"
+                i += 2
+                continue
+            if char == "/" and line[i + 1:i + 2] == "*":
+                self._end_word()
+                self.state = "/*"
+                self.keep_comment = line[i + 2:i + 3] == "+"
+                if self.keep_comment:
+                    self.buffer.append("/*")
+                i += 2
+                continue
+            if char in "qQ" and line[i + 1:i + 2] == "'" and i + 2 < length and \
+                    (not self.word or "".join(self.word).upper() == "N"):
+                # q'X...X' (or nq'X...X') alternative quoting
+                opener = line[i + 2]
+                self.word = []
+                self.q_close = Q_QUOTE_PAIRS.get(opener, opener)
+                self.state = "q"
+                self.buffer.append(line[i:i + 3])
+                i += 3
+                continue
+            if _is_word_char(char):
+                self.word.append(char)
+                self.buffer.append(char)
+                i += 1
+                continue
+
+            self._end_word()
+            if char in ("'", '"'):
+                self.state = char
+                self.buffer.append(char)
+                i += 1
+                continue
+            if char == ";":
+                # END; closes a block, so a following IF/LOOP/CASE opens a new construct
+                self.after_end = False
+                if self.kind is None:
+                    self.kind = self._classify() or "sql"
+                if self.kind == "sql":
+                    statement = self._take()
+                    if statement:
+                        statements.append(statement)
+                    i += 1
+                    continue
+                if self.kind == "block" and self.opened and self.depth <= 0:
+                    # END; of the outermost BEGIN: PL/SQL keeps its semicolon
+                    statements.append(self._take(include_terminator=True))
+                    i += 1
+                    continue
+            self.buffer.append(char)
+            i += 1
+        return statements
+
+    def close(self):
+        """
+        Returns whatever is left at end of input (a final statement without
+        a terminator), or None.
+        """
+        self._end_word()
+        statement = self._take()
+        return statement or None
+
+
+def iter_statements(lines):
+    """
+    Yields the complete statements of a SQL script as they are read.
+
+    `lines` is any iterable of text lines (an open file, a list, a generator),
+    so only the statement currently being assembled is held in memory. SQL
+    statements are yielded without their ";" terminator. PL/SQL blocks
+    (BEGIN/DECLARE ... END;) and stored units (CREATE PROCEDURE, PACKAGE,
+    TRIGGER, ...) keep their final "END;", as Oracle requires, and also end
+    at a line holding only "/".
+    """
+    splitter = _Splitter()
+    for line in lines:
+        for statement in splitter.feed(line):
+            yield statement
+    statement = splitter.close()
+    if statement:
+        yield statement
+
+
+def read_statements(file_path, encoding="utf-8"):
+    """
+    Lazily yields the statements of a script file, reading it line by line.
+    """
+    with open(file_path, "r", encoding=encoding) as file:
+        yield from iter_statements(file)
+
+
+def split_sql_statements(sql_script):
+    """
+    Splits an in-memory SQL script into a list of statements.
+
+    >>> split_sql_statements("BEGIN BEGIN NULL; END; IF 1=1 THEN NULL; END IF; END; "
+    ...                      "SELECT 1 FROM DUAL; INSERT INTO T VALUES (1);")
+    ['BEGIN BEGIN NULL; END; IF 1=1 THEN NULL; END IF; END;', 'SELECT 1 FROM DUAL', 'INSERT INTO T VALUES (1)']
+    """
+    return list(iter_statements(io.StringIO(sql_script)))
@@ -1,34 +1,197 @@
 # search_module.py
 
+import re
+import time
 import cx_Oracle
+import pool_module
+import executor_module
+import text_module
+import typeahead_module
+import fuzzy_module
+import lookup_module
 from rich.console import Console
 from rich.prompt import Prompt, IntPrompt
-from rich.table import Table
 from rich import box
 from rich.panel import Panel
 
 # Initialize Rich Console
 console = Console()
 
+# Rows per search results page
+PAGE_SIZE = 25
+
+# Keyset (primary key) columns that give each search a stable, unique order
+BOOK_KEYS = ["B.ISBN"]
+AUTHOR_KEYS = ["A.Author_ID"]
+BORROWER_KEYS = ["BR.Borrower_ID"]
+USER_KEYS = ["U.User_ID"]
+ADMINISTRATOR_KEYS = ["A.Admin_ID"]
+GENRE_KEYS = ["G.Genre_ID"]
+
 # Function to execute an inline SQL query and display results
 def execute_query(connection, query, params=None):
     try:
-        cursor = connection.cursor()
-        if params:
-            cursor.execute(query, params)
-        else:
-            cursor.execute(query)
-        columns = [desc[0] for desc in cursor.description]
-        table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
-        for col in columns:
-            table.add_column(str(col))
-        for row in cursor:
-            table.add_row(*[str(item) if item is not None else "NULL" for item in row])
-        console.print(table)
-        cursor.close()
+        executor_module.execute_query(connection, query, params)
     except cx_Oracle.DatabaseError as e:
         console.print(f"[red]An error occurred: {e}[/red]")
 
+# Function to add keyset columns, the seek predicate and the page ORDER BY to a search query
+def build_page_query(query, keys, direction="next"):
+    """
+    Turns a search query into one page of a keyset (seek) scan ordered by
+    `keys`. The key columns are appended to the select list as Key_1..n so
+    the caller can pick up where the page ended. With direction "next" the
+    page starts after the binds :key_1..n, with "prev" it ends before them
+    (rows come back in descending order), and with "first" it starts at the
+    top. Oracle has no row-value comparison, so (k1, k2) > (:k1, :k2) is
+    expanded into OR terms, led by k1 >= :key_1 so the primary key index can
+    drive a range scan.
+    """
+    key_columns = ", ".join(f"{key} AS Key_{i}" for i, key in enumerate(keys, start=1))
+    # The outer FROM: the select list may hold scalar subqueries with their own
+    select_end = next(m.start() for m in re.finditer(r"\bFROM\b", query, re.IGNORECASE)
+                      if query.count("(", 0, m.start()) == query.count(")", 0, m.start()))
+    query = f"{query[:select_end].rstrip()},\n        {key_columns}\n    {query[select_end:]}"
+
+    if direction in ("next", "prev"):
+        op = ">" if direction == "next" else "<"
+        terms = []
+        for i in range(len(keys)):
+            equal = [f"{keys[j]} = :key_{j + 1}" for j in range(i)]
+            terms.append(" AND ".join(equal + [f"{keys[i]} {op} :key_{i + 1}"]))
+        seek = terms[0] if len(terms) == 1 else f"{keys[0]} {op}= :key_1 AND ({' OR '.join(f'({t})' for t in terms)})"
+        query += f"\n    AND {seek}"
+    order = "DESC" if direction == "prev" else "ASC"
+    query += f"\n    ORDER BY {', '.join(f'{key} {order}' for key in keys)}"
+    query += "\n    FETCH FIRST :page_rows ROWS ONLY"
+    return query
+
+# Function to fetch one keyset page: returns (columns, rows, key of first row, key of last row, more rows)
+def fetch_page(connection, query, params, keys, direction="first", key=None, page_size=None):
+    page_size = page_size or PAGE_SIZE
+    binds = dict(params)
+    binds["page_rows"] = page_size + 1
+    if direction != "first":
+        binds.update({f"key_{i}": value for i, value in enumerate(key, start=1)})
+    cursor = executor_module.execute(connection, build_page_query(query, keys, direction), binds)
+    columns = [desc[0] for desc in cursor.description][:-len(keys)]
+    rows = cursor.fetchall()
+    more = len(rows) > page_size
+    rows = rows[:page_size]
+    if direction == "prev":
+        rows.reverse()
+    if not rows:
+        return columns, [], None, None, False
+    first_key = tuple(rows[0][-len(keys):])
+    last_key = tuple(rows[-1][-len(keys):])
+    return columns, [row[:-len(keys)] for row in rows], first_key, last_key, more
+
+# Function to display search results one keyset page at a time with next/previous navigation
+def show_pages(connection, query, params, keys, page_size=None):
+    page_size = page_size or PAGE_SIZE
+    columns, rows, first_key, last_key, has_next = fetch_page(connection, query, params, keys, page_size=page_size)
+    page = 1
+    while True:
+        if not rows:
+            executor_module.print_rows(columns, [])
+            return
+        executor_module.print_rows(columns, rows)
+        console.print(f"Page {page} ({len(rows)} rows)")
+        choices = []
+        if has_next:
+            choices.append('n')
+        if page > 1:
+            choices.append('p')
+        if not choices:
+            return
+        choices.append('q')
+        action = Prompt.ask("\\[n]ext page, \\[p]revious page or \\[q]uit", choices=choices, default=choices[0])
+        if action == 'q':
+            return
+        if action == 'n':
+            result = fetch_page(connection, query, params, keys, "next", last_key, page_size)
+            page += 1
+        else:
+            result = fetch_page(connection, query, params, keys, "prev", first_key, page_size)
+            page -= 1
+        columns, rows, new_first, new_last, more = result
+        if action == 'n':
+            has_next = more
+        else:
+            # Moving back always leaves a page after this one
+            has_next = True
+            if not more:
+                page = 1
+        first_key, last_key = new_first, new_last
+
+# Function to fetch the rows of the next ranked keys that pass the query's other filters
+def fetch_ranked_page(connection, query, params, key, ranked, start, page_size=None):
+    """
+    Returns (columns, rows, end) for the page of text search results that
+    starts at position `start` of `ranked` ([(key value, score)] best
+    first). Ranked keys are bound into `query` page_size at a time, as an
+    IN list on `key`, until page_size of them have matched; rows come back
+    in rank order with a Relevance column, and `end` is where the next page
+    starts.
+    """
+    page_size = page_size or PAGE_SIZE
+    # The outer FROM: the select list may hold scalar subqueries with their own
+    select_end = next(m.start() for m in re.finditer(r"\bFROM\b", query, re.IGNORECASE)
+                      if query.count("(", 0, m.start()) == query.count(")", 0, m.start()))
+    keyed = f"{query[:select_end].rstrip()},\n        {key} AS Rank_Key\n    {query[select_end:]}"
+    columns = None
+    found = {}
+    matched = []
+    position = start
+    while len(matched) < page_size and position < len(ranked):
+        chunk = [value for value, score in ranked[position:position + page_size - len(matched)]]
+        position += len(chunk)
+        binds = dict(params)
+        binds.update({f"rank_{i}": value for i, value in enumerate(chunk, start=1)})
+        in_list = ", ".join(f":rank_{i}" for i in range(1, len(chunk) + 1))
+        cursor = executor_module.execute(connection, f"{keyed}\n    AND {key} IN ({in_list})", binds)
+        columns = [desc[0] for desc in cursor.description][:-1]
+        for row in cursor.fetchall():
+            found.setdefault(row[-1], []).append(row[:-1])
+        matched.extend(value for value in chunk if value in found)
+    scores = dict(ranked)
+    rows = [row + (round(scores[value], 3),) for value in matched for row in found[value]]
+    return (columns or []) + ["RELEVANCE"], rows, position
+
+# Function to display text search results in relevance order with next/previous navigation
+def show_ranked(connection, query, params, key, ranked, page_size=None):
+    starts = [0]
+    columns, rows, end = fetch_ranked_page(connection, query, params, key, ranked, 0, page_size)
+    while True:
+        if not rows:
+            executor_module.print_rows(columns, [])
+            return
+        executor_module.print_rows(columns, rows)
+        console.print(f"Page {len(starts)} ({len(rows)} rows, {len(ranked)} text matches)")
+        choices = []
+        if end < len(ranked):
+            choices.append('n')
+        if len(starts) > 1:
+            choices.append('p')
+        if not choices:
+            return
+        choices.append('q')
+        action = Prompt.ask("\\[n]ext page, \\[p]revious page or \\[q]uit", choices=choices, default=choices[0])
+        if action == 'q':
+            return
+        if action == 'n':
+            next_columns, next_rows, next_end = fetch_ranked_page(connection, query, params, key, ranked, end, page_size)
+            if not next_rows:
+                # The remaining matches all fail the other filters
+                console.print("No more results.")
+                ranked = ranked[:end]
+                continue
+            starts.append(end)
+            columns, rows, end = next_columns, next_rows, next_end
+        else:
+            starts.pop()
+            columns, rows, end = fetch_ranked_page(connection, query, params, key, ranked, starts[-1], page_size)
+
 # Enhanced Search Records Function with Comparison Operators
 def search_records(connection):
     while True:
@@ -42,19 +205,22 @@ def search_records(connection):
                 "4. Search Users",
                 "5. Search Administrators",  # <--- New Option
                 "6. Search Genres",          # <--- New Option
-                "7. Back to Main Menu",
+                "7. Typeahead (Prefix Suggestions)",
+                "8. Approximate Title/Author Match (Typo-Tolerant)",
+                "9. Batch Lookup by ISBN / ID",
+                "10. Back to Main Menu",
                 "----------------------------------------"
             ]),
             title="Search Menu",
-            subtitle="Choose an option [1-7]",
+            subtitle="Choose an option [1-10]",
             style="bold cyan",
             box=box.DOUBLE_EDGE
         )
         console.print(search_menu)
         try:
-            choice = IntPrompt.ask("Your choice", default=7)
+            choice = IntPrompt.ask("Your choice", default=10)
         except Exception:
-            console.print("[red]Invalid input. Please enter a number between 1 and 7.[/red]")
+            console.print("[red]Invalid input. Please enter a number between 1 and 10.[/red]")
             continue
 
         console.print("\n")
@@ -71,48 +237,114 @@ def search_records(connection):
         elif choice == 6:
             search_genres(connection)          # <--- New Function
         elif choice == 7:
+            typeahead_search(connection)
+        elif choice == 8:
+            approximate_search(connection)
+        elif choice == 9:
+            batch_lookup(connection)
+        elif choice == 10:
             break
         else:
             console.print("[red]Invalid option. Please try again.[/red]")
 
+        pool_module.release_session(connection)
         pause()
 
-def search_books(connection):
-    console.print("[bold underline]Search Books[/bold underline]")
-    isbn = Prompt.ask("Enter ISBN to search (leave blank to skip)")
-    title = Prompt.ask("Enter book title to search (leave blank to skip)")
-    author = Prompt.ask("Enter author name to search (leave blank to skip)")
-    genre = Prompt.ask("Enter genre title to search (leave blank to skip)")
-
-    # Enhanced: Add Publication Date Filters
-    pub_date_filter = Prompt.ask("Do you want to filter by Publication Date? (y/n)", default="n").lower()
-    if pub_date_filter == 'y':
-        pub_date_operator = Prompt.ask("Enter operator for Publication Date [>, >=, =, <=, <]")
-        pub_date_value = Prompt.ask("Enter Publication Date (YYYY-MM-DD)")
-    else:
-        pub_date_operator = None
-        pub_date_value = None
-
-    publisher = Prompt.ask("Enter publisher to search (leave blank to skip)")
-
+# Function to suggest titles, authors, genres and publishers for typed prefixes from memory
+def typeahead_search(connection):
+    console.print("[bold underline]Typeahead[/bold underline]")
+    typeahead = typeahead_module.typeahead
+    first = True
+    while True:
+        try:
+            typeahead.current(connection)
+        except cx_Oracle.DatabaseError as e:
+            console.print(f"[red]An error occurred while refreshing the typeahead index: {e}[/red]")
+            if typeahead.indexes is None:
+                return
+        if first:
+            typeahead_module.show_typeahead_stats()
+            first = False
+        prefix = Prompt.ask("Type the start of a title, author, genre or publisher (leave blank to go back)")
+        if not prefix.strip():
+            return
+        started = time.perf_counter()
+        suggestions = typeahead.suggest(prefix)
+        typeahead_module.show_suggestions(suggestions, time.perf_counter() - started)
+
+# Function to list the titles or author names closest to a possibly misspelled one
+def approximate_search(connection):
+    console.print("[bold underline]Approximate Match[/bold underline]")
+    field = Prompt.ask("Match \\[t]itles or \\[a]uthor names?", choices=['t', 'a'], default='t')
+    text = Prompt.ask("Enter the title or name as spelled")
+    if not text.strip():
+        return
+    show_closest(connection, "title" if field == 't' else "author", text)
+
+# Function to show the closest title/author matches when a search found nothing
+def show_closest(connection, field, text):
+    try:
+        matches = fuzzy_module.closest(connection, field, text)
+    except cx_Oracle.DatabaseError as e:
+        console.print(f"[red]An error occurred while matching: {e}[/red]")
+        return
+    if not matches:
+        console.print(f"No {field} within a few typos of '{text}'.")
+        return
+    console.print(f"Closest {field} matches for '{text}':")
+    fuzzy_module.show_closest(matches)
+
+# Function to resolve a batch of scanned or pasted keys in one round trip
+def batch_lookup(connection):
+    console.print("[bold underline]Batch Lookup[/bold underline]")
+    name = Prompt.ask("Look up", choices=list(lookup_module.LOOKUPS), default="books")
+    table, key, key_type = lookup_module.LOOKUPS[name]
+    text = Prompt.ask(f"Enter or paste the {key} values (separated by spaces, commas or new lines)")
+    try:
+        keys = lookup_module.parse_keys(name, text)
+    except ValueError:
+        console.print(f"[red]{key} values must be numbers.[/red]")
+        return
+    if not keys:
+        return
+    try:
+        found = lookup_module.lookup(connection, name, keys)
+    except cx_Oracle.DatabaseError as e:
+        console.print(f"[red]An error occurred while looking up {table}: {e}[/red]")
+        return
+    rows = [found[k] for k in keys if k in found]
+    if rows:
+        columns = list(rows[0])
+        executor_module.print_rows(columns, [tuple(row[c] for c in columns) for row in rows])
+    missing = [str(k) for k in keys if k not in found]
+    console.print(f"{len(rows)} of {len(keys)} found.")
+    if missing:
+        console.print(f"[yellow]Not found: {', '.join(missing)}[/yellow]")
+
+# Function to build the search_books query and its bind parameters
+def build_books_query(isbn=None, title=None, author=None, genre=None, pub_date_operator=None,
+                      pub_date_value=None, publisher=None):
+    """
+    Returns one row per book, with its authors and genres aggregated into
+    comma-separated lists. Author and genre filters are EXISTS subqueries,
+    so BookAuthor/Authors and BookGenre/Genres are read only when filtered
+    on (besides the per-book lists) and books without an author or genre
+    are still found.
+    """
     query = """
     SELECT
         B.ISBN,
         B.Title,
-        A.Name AS Author_Name,
-        G.Title AS Genre_Title,
+        (SELECT LISTAGG(A.Name, ', ') WITHIN GROUP (ORDER BY A.Name)
+         FROM BookAuthor BA JOIN Authors A ON BA.Author_ID = A.Author_ID
+         WHERE BA.ISBN = B.ISBN) AS Authors,
+        (SELECT LISTAGG(G.Title, ', ') WITHIN GROUP (ORDER BY G.Title)
+         FROM BookGenre BG JOIN Genres G ON BG.Genre_ID = G.Genre_ID
+         WHERE BG.ISBN = B.ISBN) AS Genres,
         B.Publication_Date,
         B.Publisher
     FROM
         Books B
-    JOIN
-        BookAuthor BA ON B.ISBN = BA.ISBN
-    JOIN
-        Authors A ON BA.Author_ID = A.Author_ID
-    JOIN
-        BookGenre BG ON B.ISBN = BG.ISBN
-    JOIN
-        Genres G ON BG.Genre_ID = G.Genre_ID
     WHERE
         1=1
     """
@@ -124,10 +356,14 @@ def search_books(connection):
         query += " AND LOWER(B.Title) LIKE '%' || LOWER(:title) || '%'"
         params['title'] = title
     if author:
-        query += " AND LOWER(A.Name) LIKE '%' || LOWER(:author) || '%'"
+        query += """
+    AND EXISTS (SELECT 1 FROM BookAuthor BA JOIN Authors A ON BA.Author_ID = A.Author_ID
+                WHERE BA.ISBN = B.ISBN AND LOWER(A.Name) LIKE '%' || LOWER(:author) || '%')"""
         params['author'] = author
     if genre:
-        query += " AND LOWER(G.Title) LIKE '%' || LOWER(:genre) || '%'"
+        query += """
+    AND EXISTS (SELECT 1 FROM BookGenre BG JOIN Genres G ON BG.Genre_ID = G.Genre_ID
+                WHERE BG.ISBN = B.ISBN AND LOWER(G.Title) LIKE '%' || LOWER(:genre) || '%')"""
         params['genre'] = genre
     if pub_date_operator and pub_date_value:
         if pub_date_operator not in ['>', '>=', '=', '<=', '<']:
@@ -138,41 +374,46 @@ def search_books(connection):
     if publisher:
         query += " AND LOWER(B.Publisher) LIKE '%' || LOWER(:publisher) || '%'"
         params['publisher'] = publisher
+    return query, params
+
+def search_books(connection):
+    console.print("[bold underline]Search Books[/bold underline]")
+    isbn = Prompt.ask("Enter ISBN to search (leave blank to skip)")
+    title = Prompt.ask("Enter book title to search (leave blank to skip)")
+    author = Prompt.ask("Enter author name to search (leave blank to skip)")
+    genre = Prompt.ask("Enter genre title to search (leave blank to skip)")
+
+    # Enhanced: Add Publication Date Filters
+    pub_date_filter = Prompt.ask("Do you want to filter by Publication Date? (y/n)", default="n").lower()
+    if pub_date_filter == 'y':
+        pub_date_operator = Prompt.ask("Enter operator for Publication Date [>, >=, =, <=, <]")
+        pub_date_value = Prompt.ask("Enter Publication Date (YYYY-MM-DD)")
+    else:
+        pub_date_operator = None
+        pub_date_value = None
+
+    publisher = Prompt.ask("Enter publisher to search (leave blank to skip)")
+
+    # Title, author, genre and publisher words go through the text index
+    query, params = build_books_query(isbn=isbn, pub_date_operator=pub_date_operator, pub_date_value=pub_date_value)
 
     try:
-        cursor = connection.cursor()
-        if params:
-            cursor.execute(query, params)
+        ranked = text_module.rank_books(connection, title=title, author=author, genre=genre, publisher=publisher)
+        if ranked is None:
+            show_pages(connection, query, params, BOOK_KEYS)
         else:
-            cursor.execute(query)
-        columns = [desc[0] for desc in cursor.description]
-        table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
-        for col in columns:
-            table.add_column(str(col))
-        for row in cursor:
-            table.add_row(*[str(item) if item is not None else "NULL" for item in row])
-        console.print(table)
-        cursor.close()
+            show_ranked(connection, query, params, "B.ISBN", ranked)
+            if not ranked:
+                # Nothing matched the words as typed; suggest spellings that exist
+                for field, text in (("title", title), ("author", author)):
+                    if text:
+                        show_closest(connection, field, text)
     except cx_Oracle.DatabaseError as e:
         console.print(f"[red]An error occurred while searching for books: {e}[/red]")
 
-def search_authors(connection):
-    console.print("[bold underline]Search Authors[/bold underline]")
-    author_id = Prompt.ask("Enter Author ID to search (leave blank to skip)")
-    name = Prompt.ask("Enter author name to search (leave blank to skip)")
-    nationality = Prompt.ask("Enter nationality to search (leave blank to skip)")
-
-    # Enhanced: Add Date of Birth Filters
-    dob_filter = Prompt.ask("Do you want to filter by Date of Birth? (y/n)", default="n").lower()
-    if dob_filter == 'y':
-        dob_operator = Prompt.ask("Enter operator for Date of Birth [>, >=, =, <=, <]")
-        dob_value = Prompt.ask("Enter Date of Birth (YYYY-MM-DD)")
-    else:
-        dob_operator = None
-        dob_value = None
-
-    languages = Prompt.ask("Enter languages to search (leave blank to skip)")
-
+# Function to build the search_authors query and its bind parameters
+def build_authors_query(author_id=None, name=None, nationality=None, dob_operator=None, dob_value=None,
+                        languages=None):
     query = """
     SELECT
         A.Author_ID,
@@ -204,46 +445,43 @@ def search_authors(connection):
     if languages:
         query += " AND LOWER(A.Languages) LIKE '%' || LOWER(:languages) || '%'"
         params['languages'] = languages
+    return query, params
+
+def search_authors(connection):
+    console.print("[bold underline]Search Authors[/bold underline]")
+    author_id = Prompt.ask("Enter Author ID to search (leave blank to skip)")
+    name = Prompt.ask("Enter author name to search (leave blank to skip)")
+    nationality = Prompt.ask("Enter nationality to search (leave blank to skip)")
+
+    # Enhanced: Add Date of Birth Filters
+    dob_filter = Prompt.ask("Do you want to filter by Date of Birth? (y/n)", default="n").lower()
+    if dob_filter == 'y':
+        dob_operator = Prompt.ask("Enter operator for Date of Birth [>, >=, =, <=, <]")
+        dob_value = Prompt.ask("Enter Date of Birth (YYYY-MM-DD)")
+    else:
+        dob_operator = None
+        dob_value = None
+
+    languages = Prompt.ask("Enter languages to search (leave blank to skip)")
+
+    # Name words go through the text index
+    query, params = build_authors_query(author_id=author_id, nationality=nationality,
+                                        dob_operator=dob_operator, dob_value=dob_value, languages=languages)
 
     try:
-        cursor = connection.cursor()
-        if params:
-            cursor.execute(query, params)
+        ranked = text_module.rank_authors(connection, name=name)
+        if ranked is None:
+            show_pages(connection, query, params, AUTHOR_KEYS)
         else:
-            cursor.execute(query)
-        columns = [desc[0] for desc in cursor.description]
-        table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
-        for col in columns:
-            table.add_column(str(col))
-        for row in cursor:
-            table.add_row(*[str(item) if item is not None else "NULL" for item in row])
-        console.print(table)
-        cursor.close()
+            show_ranked(connection, query, params, "A.Author_ID", ranked)
+            if not ranked:
+                show_closest(connection, "author", name)
     except cx_Oracle.DatabaseError as e:
         console.print(f"[red]An error occurred while searching for authors: {e}[/red]")
 
-def search_borrowers(connection):
-    console.print("[bold underline]Search Borrowers[/bold underline]")
-    borrower_id = Prompt.ask("Enter Borrower ID to search (leave blank to skip)")
-    user_name = Prompt.ask("Enter User Name to search (leave blank to skip)")
-
-    # Enhanced: Add Borrowing Limit and Amount Payable Filters
-    borrowing_limit_filter = Prompt.ask("Do you want to filter by Borrowing Limit? (y/n)", default="n").lower()
-    if borrowing_limit_filter == 'y':
-        borrowing_limit_operator = Prompt.ask("Enter operator for Borrowing Limit [>, >=, =, <=, <]")
-        borrowing_limit_value = Prompt.ask("Enter Borrowing Limit")
-    else:
-        borrowing_limit_operator = None
-        borrowing_limit_value = None
-
-    amount_payable_filter = Prompt.ask("Do you want to filter by Amount Payable? (y/n)", default="n").lower()
-    if amount_payable_filter == 'y':
-        amount_payable_operator = Prompt.ask("Enter operator for Amount Payable [>, >=, =, <=, <]")
-        amount_payable_value = Prompt.ask("Enter Amount Payable")
-    else:
-        amount_payable_operator = None
-        amount_payable_value = None
-
+# Function to build the search_borrowers query and its bind parameters
+def build_borrowers_query(borrower_id=None, user_name=None, borrowing_limit_operator=None,
+                          borrowing_limit_value=None, amount_payable_operator=None, amount_payable_value=None):
     query = """
     SELECT
         BR.Borrower_ID,
@@ -276,46 +514,45 @@ def search_borrowers(connection):
         else:
             query += f" AND BR.Amount_Payable {amount_payable_operator} :amount_payable_value"
             params['amount_payable_value'] = amount_payable_value
+    return query, params
 
-    try:
-        cursor = connection.cursor()
-        if params:
-            cursor.execute(query, params)
-        else:
-            cursor.execute(query)
-        columns = [desc[0] for desc in cursor.description]
-        table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
-        for col in columns:
-            table.add_column(str(col))
-        for row in cursor:
-            table.add_row(*[str(item) if item is not None else "NULL" for item in row])
-        console.print(table)
-        cursor.close()
-    except cx_Oracle.DatabaseError as e:
-        console.print(f"[red]An error occurred while searching for borrowers: {e}[/red]")
+def search_borrowers(connection):
+    console.print("[bold underline]Search Borrowers[/bold underline]")
+    borrower_id = Prompt.ask("Enter Borrower ID to search (leave blank to skip)")
+    user_name = Prompt.ask("Enter User Name to search (leave blank to skip)")
 
-def search_users(connection):
-    console.print("[bold underline]Search Users[/bold underline]")
-    user_id = Prompt.ask("Enter User ID to search (leave blank to skip)")
-    first_name = Prompt.ask("Enter First Name to search (leave blank to skip)")
-    last_name = Prompt.ask("Enter Last Name to search (leave blank to skip)")
-    phone_number = Prompt.ask("Enter Phone Number to search (leave blank to skip)")
-    email = Prompt.ask("Enter Email to search (leave blank to skip)")
-    username = Prompt.ask("Enter Username to search (leave blank to skip)")
-    street = Prompt.ask("Enter Street to search (leave blank to skip)")
-    city = Prompt.ask("Enter City to search (leave blank to skip)")
-    state = Prompt.ask("Enter State to search (leave blank to skip)")
-    zip_code = Prompt.ask("Enter ZIP Code to search (leave blank to skip)")
+    # Enhanced: Add Borrowing Limit and Amount Payable Filters
+    borrowing_limit_filter = Prompt.ask("Do you want to filter by Borrowing Limit? (y/n)", default="n").lower()
+    if borrowing_limit_filter == 'y':
+        borrowing_limit_operator = Prompt.ask("Enter operator for Borrowing Limit [>, >=, =, <=, <]")
+        borrowing_limit_value = Prompt.ask("Enter Borrowing Limit")
+    else:
+        borrowing_limit_operator = None
+        borrowing_limit_value = None
 
-    # Enhanced: Add ZIP Code Comparison (if needed)
-    zip_code_filter = Prompt.ask("Do you want to apply a specific condition on ZIP Code? (y/n)", default="n").lower()
-    if zip_code_filter == 'y':
-        zip_operator = Prompt.ask("Enter operator for ZIP Code [=]")
-        zip_value = Prompt.ask("Enter ZIP Code")
+    amount_payable_filter = Prompt.ask("Do you want to filter by Amount Payable? (y/n)", default="n").lower()
+    if amount_payable_filter == 'y':
+        amount_payable_operator = Prompt.ask("Enter operator for Amount Payable [>, >=, =, <=, <]")
+        amount_payable_value = Prompt.ask("Enter Amount Payable")
     else:
-        zip_operator = None
-        zip_value = None
+        amount_payable_operator = None
+        amount_payable_value = None
+
+    query, params = build_borrowers_query(borrower_id=borrower_id, user_name=user_name,
+                                          borrowing_limit_operator=borrowing_limit_operator,
+                                          borrowing_limit_value=borrowing_limit_value,
+                                          amount_payable_operator=amount_payable_operator,
+                                          amount_payable_value=amount_payable_value)
+
+    try:
+        show_pages(connection, query, params, BORROWER_KEYS)
+    except cx_Oracle.DatabaseError as e:
+        console.print(f"[red]An error occurred while searching for borrowers: {e}[/red]")
 
+# Function to build the search_users query and its bind parameters
+def build_users_query(user_id=None, first_name=None, last_name=None, phone_number=None, email=None,
+                      username=None, street=None, city=None, state=None, zip_code=None, zip_operator=None,
+                      zip_value=None):
     query = """
     SELECT
         U.User_ID,
@@ -367,31 +604,42 @@ def search_users(connection):
         else:
             query += " AND U.ZIP_Code = :zip_code"
             params['zip_code'] = zip_value
+    return query, params
+
+def search_users(connection):
+    console.print("[bold underline]Search Users[/bold underline]")
+    user_id = Prompt.ask("Enter User ID to search (leave blank to skip)")
+    first_name = Prompt.ask("Enter First Name to search (leave blank to skip)")
+    last_name = Prompt.ask("Enter Last Name to search (leave blank to skip)")
+    phone_number = Prompt.ask("Enter Phone Number to search (leave blank to skip)")
+    email = Prompt.ask("Enter Email to search (leave blank to skip)")
+    username = Prompt.ask("Enter Username to search (leave blank to skip)")
+    street = Prompt.ask("Enter Street to search (leave blank to skip)")
+    city = Prompt.ask("Enter City to search (leave blank to skip)")
+    state = Prompt.ask("Enter State to search (leave blank to skip)")
+    zip_code = Prompt.ask("Enter ZIP Code to search (leave blank to skip)")
+
+    # Enhanced: Add ZIP Code Comparison (if needed)
+    zip_code_filter = Prompt.ask("Do you want to apply a specific condition on ZIP Code? (y/n)", default="n").lower()
+    if zip_code_filter == 'y':
+        zip_operator = Prompt.ask("Enter operator for ZIP Code [=]")
+        zip_value = Prompt.ask("Enter ZIP Code")
+    else:
+        zip_operator = None
+        zip_value = None
+
+    query, params = build_users_query(user_id=user_id, first_name=first_name, last_name=last_name,
+                                      phone_number=phone_number, email=email, username=username,
+                                      street=street, city=city, state=state, zip_code=zip_code,
+                                      zip_operator=zip_operator, zip_value=zip_value)
 
     try:
-        cursor = connection.cursor()
-        if params:
-            cursor.execute(query, params)
-        else:
-            cursor.execute(query)
-        columns = [desc[0] for desc in cursor.description]
-        table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
-        for col in columns:
-            table.add_column(str(col))
-        for row in cursor:
-            table.add_row(*[str(item) if item is not None else "NULL" for item in row])
-        console.print(table)
-        cursor.close()
+        show_pages(connection, query, params, USER_KEYS)
     except cx_Oracle.DatabaseError as e:
         console.print(f"[red]An error occurred while searching for users: {e}[/red]")
 
-def search_administrators(connection):
-    console.print("[bold underline]Search Administrators[/bold underline]")
-    admin_id = Prompt.ask("Enter Admin ID to search (leave blank to skip)")
-    user_name = Prompt.ask("Enter User Name to search (leave blank to skip)")
-    role = Prompt.ask("Enter Role to search (leave blank to skip)")
-    permissions = Prompt.ask("Enter Permissions to search (leave blank to skip)")
-
+# Function to build the search_administrators query and its bind parameters
+def build_administrators_query(admin_id=None, user_name=None, role=None, permissions=None):
     query = """
     SELECT
         A.Admin_ID,
@@ -419,30 +667,25 @@ def search_administrators(connection):
     if permissions:
         query += " AND LOWER(A.Permissions) LIKE '%' || LOWER(:permissions) || '%'"
         params['permissions'] = permissions
+    return query, params
+
+def search_administrators(connection):
+    console.print("[bold underline]Search Administrators[/bold underline]")
+    admin_id = Prompt.ask("Enter Admin ID to search (leave blank to skip)")
+    user_name = Prompt.ask("Enter User Name to search (leave blank to skip)")
+    role = Prompt.ask("Enter Role to search (leave blank to skip)")
+    permissions = Prompt.ask("Enter Permissions to search (leave blank to skip)")
+
+    query, params = build_administrators_query(admin_id=admin_id, user_name=user_name, role=role,
+                                               permissions=permissions)
 
     try:
-        cursor = connection.cursor()
-        if params:
-            cursor.execute(query, params)
-        else:
-            cursor.execute(query)
-        columns = [desc[0] for desc in cursor.description]
-        table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
-        for col in columns:
-            table.add_column(str(col))
-        for row in cursor:
-            table.add_row(*[str(item) if item is not None else "NULL" for item in row])
-        console.print(table)
-        cursor.close()
+        show_pages(connection, query, params, ADMINISTRATOR_KEYS)
     except cx_Oracle.DatabaseError as e:
         console.print(f"[red]An error occurred while searching for administrators: {e}[/red]")
 
-def search_genres(connection):
-    console.print("[bold underline]Search Genres[/bold underline]")
-    genre_id = Prompt.ask("Enter Genre ID to search (leave blank to skip)")
-    title = Prompt.ask("Enter Genre Title to search (leave blank to skip)")
-    description = Prompt.ask("Enter Description to search (leave blank to skip)")
-
+# Function to build the search_genres query and its bind parameters
+def build_genres_query(genre_id=None, title=None, description=None):
     query = """
     SELECT
         G.Genre_ID,
@@ -463,21 +706,18 @@ def search_genres(connection):
     if description:
         query += " AND LOWER(G.Description) LIKE '%' || LOWER(:description) || '%'"
         params['description'] = description
+    return query, params
+
+def search_genres(connection):
+    console.print("[bold underline]Search Genres[/bold underline]")
+    genre_id = Prompt.ask("Enter Genre ID to search (leave blank to skip)")
+    title = Prompt.ask("Enter Genre Title to search (leave blank to skip)")
+    description = Prompt.ask("Enter Description to search (leave blank to skip)")
+
+    query, params = build_genres_query(genre_id=genre_id, title=title, description=description)
 
     try:
-        cursor = connection.cursor()
-        if params:
-            cursor.execute(query, params)
-        else:
-            cursor.execute(query)
-        columns = [desc[0] for desc in cursor.description]
-        table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
-        for col in columns:
-            table.add_column(str(col))
-        for row in cursor:
-            table.add_row(*[str(item) if item is not None else "NULL" for item in row])
-        console.print(table)
-        cursor.close()
+        show_pages(connection, query, params, GENRE_KEYS)
     except cx_Oracle.DatabaseError as e:
         console.print(f"[red]An error occurred while searching for genres: {e}[/red]")
 
@@ -8,7 +8,6 @@ import re
 import validators
 from rich.console import Console
 from rich.prompt import Prompt, IntPrompt
-from rich.table import Table
 from rich.panel import Panel
 from rich import box
 from datetime import datetime
@@ -16,6 +15,21 @@ from datetime import datetime
 # Import the search module for option 15
 import search_module  # <--- New Import
 import ra_module
+import pool_module
+import executor_module
+import tools_module
+import loader_module
+import script_module
+import maintenance_module
+import mview_module
+import cache_module
+import partition_module
+import text_module
+import typeahead_module
+import validation_module
+import circulation_module
+import id_module
+import delete_module
 
 # Initialize Rich Console
 console = Console()
@@ -25,12 +39,19 @@ DB_HOST = "oracle12c.cs.torontomu.ca"  # Replace with your Oracle server host
 DB_PORT = 1521                          # Default Oracle port
 DB_SID = "orcl12c"                      # Replace with your Oracle SID
 
-# Function to establish database connection
+# Function to establish a pooled database connection
 def get_db_connection(username, password):
     dsn = cx_Oracle.makedsn(DB_HOST, DB_PORT, sid=DB_SID)
+
+    def connect():
+        return cx_Oracle.connect(user=username, password=password, dsn=dsn, threaded=True)
+
     try:
-        connection = cx_Oracle.connect(user=username, password=password, dsn=dsn)
-        return connection
+        # Sized by pool_module.POOL_MIN/POOL_MAX/POOL_INCREMENT (shared by every menu, search_module and ra_module)
+        pool = pool_module.SessionPool(connect, min=pool_module.POOL_MIN, max=pool_module.POOL_MAX,
+                                       increment=pool_module.POOL_INCREMENT,
+                                       stmtcachesize=executor_module.STATEMENT_CACHE_SIZE)
+        return pool_module.PooledConnection(pool)
     except cx_Oracle.DatabaseError as e:
         # Suppress detailed error messages for silent operations
         if username and password:
@@ -40,25 +61,15 @@ def get_db_connection(username, password):
 
 # Function to clean and split SQL script into executable statements
 def split_sql_statements(sql_script):
-    # Remove all block comments (/* */)
-    sql_script = re.sub(r'/\*.*?\*/', '', sql_script, flags=re.DOTALL)
-    # Remove all single-line comments (-- ...)
-    sql_script = re.sub(r'--.*', '', sql_script)
-    # Split by semicolon
-    statements = sql_script.strip().split(';')
-    # Remove any leading/trailing whitespace from each statement
-    statements = [stmt.strip() for stmt in statements]
-    return statements
+    return script_module.split_sql_statements(sql_script)
 
 # Function to execute SQL from a file without printing errors
 def execute_sql_file(connection, file_path):
     if not os.path.isfile(file_path):
         return False
 
-    with open(file_path, 'r') as file:
-        sql_script = file.read()
-
-    statements = split_sql_statements(sql_script)
+    # Statements are read from the file one at a time as they are executed
+    statements = script_module.read_statements(file_path)
 
     try:
         cursor = connection.cursor()
@@ -73,6 +84,9 @@ def execute_sql_file(connection, file_path):
                 continue  # Silently ignore errors
         connection.commit()
         cursor.close()
+        cache_module.invalidate_all()
+        text_module.data_reloaded(connection)
+        id_module.forget_synced()
         return True
     except cx_Oracle.DatabaseError:
         try:
@@ -81,6 +95,18 @@ def execute_sql_file(connection, file_path):
             pass
         return False
 
+# Function to load a data script with array-bound INSERT batches and report rows/sec
+def load_sql_file(connection, file_path, batch_size=loader_module.BATCH_SIZE):
+    if not os.path.isfile(file_path):
+        return None
+
+    report = loader_module.load_statements(connection, script_module.read_statements(file_path), batch_size)
+    cache_module.invalidate_all()
+    text_module.data_reloaded(connection)
+    id_module.forget_synced()
+    loader_module.show_load_report(report)
+    return report
+
 # Function to run SQL scripts silently for options 1-6
 def silent_execute(connection, file_path):
     execute_sql_file(connection, file_path)
@@ -88,22 +114,44 @@ def silent_execute(connection, file_path):
 
 # Functions corresponding to menu options 1-6
 def create_tables(connection):
-    silent_execute(connection, "schema_creation.sql")
+    partitioned = Prompt.ask("Partition Loans by month of Loan_Date? (y/n)", default="n").lower()
+    if partitioned == 'y':
+        execute_sql_file(connection, partition_module.PARTITIONED_SCHEMA)
+    else:
+        execute_sql_file(connection, "schema_creation.sql")
+    execute_sql_file(connection, id_module.CREATE_SCRIPT)
+    silent_execute(connection, "create_indexes.sql")
 
 def drop_tables(connection):
+    execute_sql_file(connection, id_module.DROP_SCRIPT)
     silent_execute(connection, "delete_all_tables.sql")
 
 def populate_tables(connection):
-    silent_execute(connection, "insert_sample_data.sql")
+    load_sql_file(connection, "insert_sample_data.sql")
+    console.print("Finished executing script.")
 
 def delete_all_data(connection):
-    silent_execute(connection, "delete_all_data.sql")
+    mode = Prompt.ask("Reset mode: \\[s]afe transactional DELETE or \\[f]ast TRUNCATE", choices=['s', 'f'], default='s')
+    if mode == 'f':
+        maintenance_module.fast_reset(connection, "delete_all_data.sql")
+        cache_module.invalidate_all()
+        text_module.data_reloaded(connection)
+        id_module.forget_synced()
+    else:
+        silent_execute(connection, "delete_all_data.sql")
 
 def create_views(connection):
     silent_execute(connection, "create_views.sql")
+    build_mviews = Prompt.ask("Also build the reporting views as fast-refresh materialized views? (y/n)", default="n").lower()
+    if build_mviews == 'y':
+        silent_execute(connection, mview_module.CREATE_SCRIPT)
+        mview_module.forget_presence()
+        mview_module.show_mview_status(connection)
 
 def drop_views(connection):
     silent_execute(connection, "delete_all_views.sql")
+    execute_sql_file(connection, mview_module.DROP_SCRIPT)
+    mview_module.forget_presence()
 
 def validate_date_format(date_str):
     try:
@@ -128,24 +176,19 @@ def validate_email(email):
 # Function to execute an inline SQL query and display results
 def execute_query(connection, query, params=None):
     try:
-        cursor = connection.cursor()
-        if params:
-            cursor.execute(query, params)
-        else:
-            cursor.execute(query)
-        columns = [desc[0] for desc in cursor.description]
-        table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
-        for col in columns:
-            table.add_column(str(col))
-        for row in cursor:
-            table.add_row(*[str(item) if item is not None else "NULL" for item in row])
-        console.print(table)
-        cursor.close()
+        executor_module.execute_query(connection, query, params)
     except cx_Oracle.DatabaseError:
         pass  # Silently ignore query execution errors
 
-def find_top_borrowed_authors(connection):
-    query = """
+# Function to display a report through the client-side result cache
+def run_report(connection, report, query):
+    try:
+        cache_module.run_report(connection, report, query)
+    except cx_Oracle.DatabaseError:
+        pass  # Silently ignore query execution errors
+
+# Report queries for menu options 7-14
+TOP_BORROWED_AUTHORS_QUERY = """
     SELECT
         A.Author_ID,
         A.Name AS Author_Name,
@@ -162,10 +205,8 @@ def find_top_borrowed_authors(connection):
         Borrow_Count DESC
     FETCH FIRST 5 ROWS ONLY
     """
-    execute_query(connection, query)
 
-def list_overdue_loans(connection):
-    query = """
+OVERDUE_LOANS_QUERY = """
     SELECT
         BR.Borrower_ID,
         U.First_Name || ' ' || U.Last_Name AS Borrower_Name,
@@ -180,15 +221,12 @@ def list_overdue_loans(connection):
     JOIN
         Users U ON BR.User_ID = U.User_ID
     WHERE
-        L.Return_Status = 'N'
-        AND L.Due_Date < SYSDATE
+        CASE WHEN L.Return_Status = 'N' THEN L.Due_Date END < SYSDATE
     ORDER BY
         Days_Overdue DESC
     """
-    execute_query(connection, query)
 
-def find_genres_with_most_books(connection):
-    query = """
+GENRES_WITH_MOST_BOOKS_QUERY = """
     SELECT
         G.Genre_ID,
         G.Title AS Genre_Title,
@@ -201,10 +239,8 @@ def find_genres_with_most_books(connection):
         G.Genre_ID, G.Title
     HAVING COUNT(BG.ISBN) > 1
     """
-    execute_query(connection, query)
 
-def list_admins_managing_most_books(connection):
-    query = """
+ADMINS_MANAGING_MOST_BOOKS_QUERY = """
     SELECT
         A.Admin_ID,
         U.First_Name || ' ' || U.Last_Name AS Admin_Name,
@@ -220,10 +256,8 @@ def list_admins_managing_most_books(connection):
     ORDER BY
         Books_Managed DESC
     """
-    execute_query(connection, query)
 
-def show_total_fines(connection):
-    query = """
+TOTAL_FINES_QUERY = """
     SELECT
         A.Admin_ID,
         U.First_Name || ' ' || U.Last_Name AS Admin_Name,
@@ -239,10 +273,8 @@ def show_total_fines(connection):
     ORDER BY
         Total_Fines_Collected DESC
     """
-    execute_query(connection, query)
 
-def find_authors_no_borrowed_books(connection):
-    query = """
+AUTHORS_NO_BORROWED_BOOKS_QUERY = """
     SELECT
         A.Author_ID,
         A.Name AS Author_Name
@@ -256,18 +288,14 @@ def find_authors_no_borrowed_books(connection):
             WHERE BA.Author_ID = A.Author_ID
         )
     """
-    execute_query(connection, query)
 
-def list_unique_genres(connection):
-    query = """
+UNIQUE_GENRES_QUERY = """
     SELECT Title AS Genre_Title FROM Genres
     UNION
     SELECT DISTINCT G.Title AS Genre_Title FROM Genres G
     """
-    execute_query(connection, query)
 
-def show_books_not_borrowed_last_year(connection):
-    query = """
+BOOKS_NOT_BORROWED_LAST_YEAR_QUERY = """
     SELECT
         B.ISBN,
         B.Title
@@ -280,7 +308,42 @@ def show_books_not_borrowed_last_year(connection):
             WHERE L.Loan_Date >= ADD_MONTHS(SYSDATE, -12)
         )
     """
-    execute_query(connection, query)
+
+# Report queries by menu option function, for benchmarks and tools
+REPORT_QUERIES = {
+    "find_top_borrowed_authors": TOP_BORROWED_AUTHORS_QUERY,
+    "list_overdue_loans": OVERDUE_LOANS_QUERY,
+    "find_genres_with_most_books": GENRES_WITH_MOST_BOOKS_QUERY,
+    "list_admins_managing_most_books": ADMINS_MANAGING_MOST_BOOKS_QUERY,
+    "show_total_fines": TOTAL_FINES_QUERY,
+    "find_authors_no_borrowed_books": AUTHORS_NO_BORROWED_BOOKS_QUERY,
+    "list_unique_genres": UNIQUE_GENRES_QUERY,
+    "show_books_not_borrowed_last_year": BOOKS_NOT_BORROWED_LAST_YEAR_QUERY,
+}
+
+def find_top_borrowed_authors(connection):
+    run_report(connection, "find_top_borrowed_authors", mview_module.report_query(connection, "find_top_borrowed_authors", TOP_BORROWED_AUTHORS_QUERY))
+
+def list_overdue_loans(connection):
+    run_report(connection, "list_overdue_loans", mview_module.report_query(connection, "list_overdue_loans", OVERDUE_LOANS_QUERY))
+
+def find_genres_with_most_books(connection):
+    run_report(connection, "find_genres_with_most_books", mview_module.report_query(connection, "find_genres_with_most_books", GENRES_WITH_MOST_BOOKS_QUERY))
+
+def list_admins_managing_most_books(connection):
+    run_report(connection, "list_admins_managing_most_books", ADMINS_MANAGING_MOST_BOOKS_QUERY)
+
+def show_total_fines(connection):
+    run_report(connection, "show_total_fines", TOTAL_FINES_QUERY)
+
+def find_authors_no_borrowed_books(connection):
+    run_report(connection, "find_authors_no_borrowed_books", AUTHORS_NO_BORROWED_BOOKS_QUERY)
+
+def list_unique_genres(connection):
+    run_report(connection, "list_unique_genres", UNIQUE_GENRES_QUERY)
+
+def show_books_not_borrowed_last_year(connection):
+    run_report(connection, "show_books_not_borrowed_last_year", BOOKS_NOT_BORROWED_LAST_YEAR_QUERY)
 
 # New Functions: Adding, Updating, Deleting Records
 
@@ -332,6 +395,7 @@ def add_record(connection):
         else:
             console.print("[red]Invalid option. Please try again.[/red]")
 
+        pool_module.release_session(connection)
         pause()
 
 def add_book(connection):
@@ -344,30 +408,22 @@ def add_book(connection):
     publisher = Prompt.ask("Enter Publisher")
     admin_id = Prompt.ask("Enter Admin ID who is adding the book")
 
-    # Check if Admin ID exists
-    cursor = connection.cursor()
-    cursor.execute("SELECT * FROM Administrators WHERE Admin_ID = :admin_id", admin_id=admin_id)
-    if cursor.fetchone() is None:
-        console.print(f"[red]Admin ID {admin_id} does not exist. Please add the administrator first.[/red]")
-        cursor.close()
-        return
-    cursor.close()
-
-    # Insert into Books
+    # Insert into Books. The constraints check the ISBN and Admin ID in the
+    # same round trip; violations are reported by name.
     query = """
     INSERT INTO Books (ISBN, Title, Publication_Date, Pages, Copies_Available, Publisher, Admin_ID)
     VALUES (:isbn, :title, TO_DATE(:publication_date, 'YYYY-MM-DD'), :pages, :copies_available, :publisher, :admin_id)
     """
+    params = dict(isbn=isbn, title=title, publication_date=publication_date, pages=pages,
+                  copies_available=copies_available, publisher=publisher, admin_id=admin_id)
     try:
-        cursor = connection.cursor()
-        cursor.execute(query, isbn=isbn, title=title, publication_date=publication_date,
-                       pages=pages, copies_available=copies_available, publisher=publisher, admin_id=admin_id)
-        connection.commit()
+        executor_module.execute(connection, query, params)
+        cache_module.commit(connection, "BOOKS")
+        text_module.book_changed(connection, isbn)
         console.print("[green]Book added successfully to the Books table.[/green]")
-        cursor.close()
     except cx_Oracle.DatabaseError as e:
         error, = e.args
-        console.print(f"[red]Failed to add book: {error.message}[/red]")
+        console.print(f"[red]Failed to add book: {validation_module.describe_error(connection, error, params)}[/red]")
         return
 
     # Now, add entries to BookAuthor and BookGenre
@@ -376,25 +432,16 @@ def add_book(connection):
         author_id = Prompt.ask("Enter Author ID to associate with this book (leave blank to finish adding authors)")
         if not author_id:
             break
-        # Check if author exists
-        cursor = connection.cursor()
-        cursor.execute("SELECT * FROM Authors WHERE Author_ID = :author_id", author_id=author_id)
-        if cursor.fetchone() is None:
-            # Author does not exist
-            console.print(f"[red]Author ID {author_id} does not exist. Please add the author first.[/red]")
-            cursor.close()
-            continue
-        cursor.close()
-        # Insert into BookAuthor
+        # Insert into BookAuthor; an unknown author fails on the foreign key
+        params = dict(isbn=isbn, author_id=author_id)
         try:
-            cursor = connection.cursor()
-            cursor.execute("INSERT INTO BookAuthor (ISBN, Author_ID) VALUES (:isbn, :author_id)", isbn=isbn, author_id=author_id)
-            connection.commit()
+            executor_module.execute(connection, "INSERT INTO BookAuthor (ISBN, Author_ID) VALUES (:isbn, :author_id)", params)
+            cache_module.commit(connection, "BOOKAUTHOR")
+            text_module.book_changed(connection, isbn)
             console.print(f"[green]Associated Author ID {author_id} with the book.[/green]")
-            cursor.close()
         except cx_Oracle.DatabaseError as e:
             error, = e.args
-            console.print(f"[red]Failed to associate author: {error.message}[/red]")
+            console.print(f"[red]Failed to associate author: {validation_module.describe_error(connection, error, params)}[/red]")
             continue
 
     # Now, handle genres
@@ -402,40 +449,21 @@ def add_book(connection):
         genre_id = Prompt.ask("Enter Genre ID to associate with this book (leave blank to finish adding genres)")
         if not genre_id:
             break
-        # Check if genre exists
-        cursor = connection.cursor()
-        cursor.execute("SELECT * FROM Genres WHERE Genre_ID = :genre_id", genre_id=genre_id)
-        if cursor.fetchone() is None:
-            # Genre does not exist
-            console.print(f"[red]Genre ID {genre_id} does not exist. Please add the genre first.[/red]")
-            cursor.close()
-            continue
-        cursor.close()
-        # Insert into BookGenre
+        # Insert into BookGenre; an unknown genre fails on the foreign key
+        params = dict(isbn=isbn, genre_id=genre_id)
         try:
-            cursor = connection.cursor()
-            cursor.execute("INSERT INTO BookGenre (ISBN, Genre_ID) VALUES (:isbn, :genre_id)", isbn=isbn, genre_id=genre_id)
-            connection.commit()
+            executor_module.execute(connection, "INSERT INTO BookGenre (ISBN, Genre_ID) VALUES (:isbn, :genre_id)", params)
+            cache_module.commit(connection, "BOOKGENRE")
+            text_module.book_changed(connection, isbn)
             console.print(f"[green]Associated Genre ID {genre_id} with the book.[/green]")
-            cursor.close()
         except cx_Oracle.DatabaseError as e:
             error, = e.args
-            console.print(f"[red]Failed to associate genre: {error.message}[/red]")
+            console.print(f"[red]Failed to associate genre: {validation_module.describe_error(connection, error, params)}[/red]")
             continue
 
 def add_author(connection):
     console.print("[bold underline]Add New Author[/bold underline]")
-    author_id = Prompt.ask("Enter Author ID")
-
-    # Check if Author ID already exists
-    cursor = connection.cursor()
-    cursor.execute("SELECT * FROM Authors WHERE Author_ID = :author_id", author_id=author_id)
-    if cursor.fetchone():
-        console.print(f"[red]Author ID {author_id} already exists. Please use a different Author ID.[/red]")
-        cursor.close()
-        return
-    cursor.close()
-
+    author_id = Prompt.ask("Enter Author ID (leave blank to generate)", default=None)
     name = Prompt.ask("Enter Name")
     nationality = Prompt.ask("Enter Nationality")
     date_of_birth = Prompt.ask("Enter Date of Birth (YYYY-MM-DD)")
@@ -443,73 +471,68 @@ def add_author(connection):
     biography = Prompt.ask("Enter Biography", default=None)
     languages = Prompt.ask("Enter Languages")
 
+    # A blank ID is drawn from Authors_Seq; a taken one fails on the primary key
     query = """
     INSERT INTO Authors (Author_ID, Name, Nationality, Date_of_Birth, Date_of_Death, Biography, Languages)
-    VALUES (:author_id, :name, :nationality, TO_DATE(:date_of_birth, 'YYYY-MM-DD'),
+    VALUES (NVL(:author_id, Authors_Seq.NEXTVAL), :name, :nationality, TO_DATE(:date_of_birth, 'YYYY-MM-DD'),
             TO_DATE(:date_of_death, 'YYYY-MM-DD'), :biography, :languages)
+    RETURNING Author_ID INTO :new_id
     """
+    params = dict(author_id=author_id, name=name, nationality=nationality, date_of_birth=date_of_birth,
+                  date_of_death=date_of_death if date_of_death else None, biography=biography, languages=languages)
     try:
-        cursor = connection.cursor()
-        cursor.execute(query, author_id=author_id, name=name, nationality=nationality,
-                       date_of_birth=date_of_birth, date_of_death=date_of_death if date_of_death else None,
-                       biography=biography, languages=languages)
-        connection.commit()
-        console.print("[green]Author added successfully.[/green]")
-        cursor.close()
+        author_id = id_module.insert_returning(connection, "AUTHORS", query, params)
+        cache_module.commit(connection, "AUTHORS")
+        text_module.author_changed(connection, author_id)
+        console.print(f"[green]Author added successfully with Author ID {author_id}.[/green]")
     except cx_Oracle.DatabaseError as e:
         error, = e.args
-        console.print(f"[red]Failed to add author: {error.message}[/red]")
+        console.print(f"[red]Failed to add author: {validation_module.describe_error(connection, error, params)}[/red]")
 
 def add_borrower(connection):
     console.print("[bold underline]Add New Borrower[/bold underline]")
-    borrower_id = Prompt.ask("Enter Borrower ID")
-    user_id = Prompt.ask("Enter User ID")
+    borrower_id = Prompt.ask("Enter Borrower ID (leave blank to generate)", default=None)
+    user_id = Prompt.ask("Enter User ID (leave blank to add a new user)", default=None)
 
-    # Check if User ID exists
-    cursor = connection.cursor()
-    cursor.execute("SELECT * FROM Users WHERE User_ID = :user_id", user_id=user_id)
-    user_exists = cursor.fetchone() is not None
-    cursor.close()
-
-    if not user_exists:
-        console.print(f"[yellow]User ID {user_id} does not exist in Users table.[/yellow]")
-        add_user_prompt = Prompt.ask("Do you want to add a new user? (y/n)", default="y").lower()
-        if add_user_prompt == 'y':
-            add_user(connection, user_id)  # Pass user_id to add_user function
-        else:
-            console.print("[red]Cannot proceed without a valid User ID. Aborting add borrower.[/red]")
-            return
+    user_id = _existing_or_new_user(connection, user_id)
+    if user_id is None:
+        console.print("[red]Cannot proceed without a valid User ID. Aborting add borrower.[/red]")
+        return
 
     borrowing_limit = Prompt.ask("Enter Borrowing Limit")
     amount_payable = Prompt.ask("Enter Amount Payable")
 
     query = """
     INSERT INTO Borrowers (Borrower_ID, User_ID, Borrowing_Limit, Amount_Payable)
-    VALUES (:borrower_id, :user_id, :borrowing_limit, :amount_payable)
+    VALUES (NVL(:borrower_id, Borrowers_Seq.NEXTVAL), :user_id, :borrowing_limit, :amount_payable)
+    RETURNING Borrower_ID INTO :new_id
     """
+    params = dict(borrower_id=borrower_id, user_id=user_id, borrowing_limit=borrowing_limit, amount_payable=amount_payable)
     try:
-        cursor = connection.cursor()
-        cursor.execute(query, borrower_id=borrower_id, user_id=user_id, borrowing_limit=borrowing_limit, amount_payable=amount_payable)
-        connection.commit()
-        console.print("[green]Borrower added successfully.[/green]")
-        cursor.close()
+        borrower_id = id_module.insert_returning(connection, "BORROWERS", query, params)
+        cache_module.commit(connection, "BORROWERS")
+        console.print(f"[green]Borrower added successfully with Borrower ID {borrower_id}.[/green]")
     except cx_Oracle.DatabaseError as e:
         error, = e.args
-        console.print(f"[red]Failed to add borrower: {error.message}[/red]")
+        console.print(f"[red]Failed to add borrower: {validation_module.describe_error(connection, error, params)}[/red]")
+
+# Function to resolve the User ID of a borrower or administrator form: an
+# existing user is used as is, otherwise the user is added (with the given
+# ID, or a generated one when blank). Returns None when there is no user.
+def _existing_or_new_user(connection, user_id):
+    if user_id and executor_module.record_exists(connection, "SELECT * FROM Users WHERE User_ID = :user_id", user_id=user_id):
+        return user_id
+    if user_id:
+        console.print(f"[yellow]User ID {user_id} does not exist in Users table.[/yellow]")
+    add_user_prompt = Prompt.ask("Do you want to add a new user? (y/n)", default="y").lower()
+    if add_user_prompt != 'y':
+        return None
+    return add_user(connection, user_id, ask_id=False)
 
-def add_user(connection, user_id=None):
+def add_user(connection, user_id=None, ask_id=True):
     console.print("[bold underline]Add New User[/bold underline]")
-    if user_id is None:
-        user_id = Prompt.ask("Enter User ID")
-
-    # Check if User ID already exists
-    cursor = connection.cursor()
-    cursor.execute("SELECT * FROM Users WHERE User_ID = :user_id", user_id=user_id)
-    if cursor.fetchone() is not None:
-        console.print(f"[red]User ID {user_id} already exists. Please use a different User ID.[/red]")
-        cursor.close()
-        return
-    cursor.close()
+    if user_id is None and ask_id:
+        user_id = Prompt.ask("Enter User ID (leave blank to generate)", default=None)
 
     first_name = Prompt.ask("Enter First Name")
     last_name = Prompt.ask("Enter Last Name")
@@ -529,41 +552,34 @@ def add_user(connection, user_id=None):
         console.print("[red]Invalid ZIP Code format. Please enter a valid US or Canadian ZIP Code.[/red]")
         zip_code = Prompt.ask("Enter ZIP Code")
 
+    # A blank ID is drawn from Users_Seq; a taken one fails on the primary key
     query = """
     INSERT INTO Users (User_ID, First_Name, Last_Name, Phone_Number, Email, Username, Password, Street, City, State, ZIP_Code)
-    VALUES (:user_id, :first_name, :last_name, :phone_number, :email, :username, :password, :street, :city, :state, :zip_code)
+    VALUES (NVL(:user_id, Users_Seq.NEXTVAL), :first_name, :last_name, :phone_number, :email, :username, :password,
+            :street, :city, :state, :zip_code)
+    RETURNING User_ID INTO :new_id
     """
+    params = dict(user_id=user_id, first_name=first_name, last_name=last_name, phone_number=phone_number, email=email,
+                  username=username, password=password, street=street, city=city, state=state, zip_code=zip_code)
     try:
-        cursor = connection.cursor()
-        cursor.execute(query, user_id=user_id, first_name=first_name, last_name=last_name,
-                       phone_number=phone_number, email=email, username=username, password=password,
-                       street=street, city=city, state=state, zip_code=zip_code)
-        connection.commit()
-        console.print("[green]User added successfully.[/green]")
-        cursor.close()
+        user_id = id_module.insert_returning(connection, "USERS", query, params)
+        cache_module.commit(connection, "USERS")
+        console.print(f"[green]User added successfully with User ID {user_id}.[/green]")
+        return user_id
     except cx_Oracle.DatabaseError as e:
         error, = e.args
-        console.print(f"[red]Failed to add user: {error.message}[/red]")
+        console.print(f"[red]Failed to add user: {validation_module.describe_error(connection, error, params)}[/red]")
+        return None
 
 def add_administrator(connection):
     console.print("[bold underline]Add New Administrator[/bold underline]")
-    admin_id = Prompt.ask("Enter Admin ID")
-    user_id = Prompt.ask("Enter User ID")
+    admin_id = Prompt.ask("Enter Admin ID (leave blank to generate)", default=None)
+    user_id = Prompt.ask("Enter User ID (leave blank to add a new user)", default=None)
 
-    # Check if User ID exists
-    cursor = connection.cursor()
-    cursor.execute("SELECT * FROM Users WHERE User_ID = :user_id", user_id=user_id)
-    user_exists = cursor.fetchone() is not None
-    cursor.close()
-
-    if not user_exists:
-        console.print(f"[yellow]User ID {user_id} does not exist in Users table.[/yellow]")
-        add_user_prompt = Prompt.ask("Do you want to add a new user? (y/n)", default="y").lower()
-        if add_user_prompt == 'y':
-            add_user(connection, user_id)  # Pass user_id to add_user function
-        else:
-            console.print("[red]Cannot proceed without a valid User ID. Aborting add administrator.[/red]")
-            return
+    user_id = _existing_or_new_user(connection, user_id)
+    if user_id is None:
+        console.print("[red]Cannot proceed without a valid User ID. Aborting add administrator.[/red]")
+        return
 
     role = Prompt.ask("Enter Role")
     permissions = Prompt.ask("Enter Permissions")
@@ -571,96 +587,78 @@ def add_administrator(connection):
 
     query = """
     INSERT INTO Administrators (Admin_ID, User_ID, Role, Permissions, Last_Login)
-    VALUES (:admin_id, :user_id, :role, :permissions, TO_DATE(:last_login, 'YYYY-MM-DD'))
+    VALUES (NVL(:admin_id, Administrators_Seq.NEXTVAL), :user_id, :role, :permissions, TO_DATE(:last_login, 'YYYY-MM-DD'))
+    RETURNING Admin_ID INTO :new_id
     """
+    params = dict(admin_id=admin_id, user_id=user_id, role=role, permissions=permissions,
+                  last_login=last_login if last_login else None)
     try:
-        cursor = connection.cursor()
-        cursor.execute(query, admin_id=admin_id, user_id=user_id, role=role,
-                       permissions=permissions, last_login=last_login if last_login else None)
-        connection.commit()
-        console.print("[green]Administrator added successfully.[/green]")
-        cursor.close()
+        admin_id = id_module.insert_returning(connection, "ADMINISTRATORS", query, params)
+        cache_module.commit(connection, "ADMINISTRATORS")
+        console.print(f"[green]Administrator added successfully with Admin ID {admin_id}.[/green]")
     except cx_Oracle.DatabaseError as e:
         error, = e.args
-        console.print(f"[red]Failed to add administrator: {error.message}[/red]")
+        console.print(f"[red]Failed to add administrator: {validation_module.describe_error(connection, error, params)}[/red]")
 
 def add_genre(connection):
     console.print("[bold underline]Add New Genre[/bold underline]")
-    genre_id = Prompt.ask("Enter Genre ID")
-
-    # Check if Genre ID already exists
-    cursor = connection.cursor()
-    cursor.execute("SELECT * FROM Genres WHERE Genre_ID = :genre_id", genre_id=genre_id)
-    if cursor.fetchone():
-        console.print(f"[red]Genre ID {genre_id} already exists. Please use a different Genre ID.[/red]")
-        cursor.close()
-        return
-    cursor.close()
-
+    genre_id = Prompt.ask("Enter Genre ID (leave blank to generate)", default=None)
     title = Prompt.ask("Enter Genre Title")
     description = Prompt.ask("Enter Genre Description", default=None)
 
+    # A blank ID is drawn from Genres_Seq; a taken one fails on the primary key
     query = """
     INSERT INTO Genres (Genre_ID, Title, Description)
-    VALUES (:genre_id, :title, :description)
+    VALUES (NVL(:genre_id, Genres_Seq.NEXTVAL), :title, :description)
+    RETURNING Genre_ID INTO :new_id
     """
+    params = dict(genre_id=genre_id, title=title, description=description)
     try:
-        cursor = connection.cursor()
-        cursor.execute(query, genre_id=genre_id, title=title, description=description)
-        connection.commit()
-        console.print("[green]Genre added successfully.[/green]")
-        cursor.close()
+        genre_id = id_module.insert_returning(connection, "GENRES", query, params)
+        cache_module.commit(connection, "GENRES")
+        text_module.genre_changed(connection, genre_id)
+        console.print(f"[green]Genre added successfully with Genre ID {genre_id}.[/green]")
     except cx_Oracle.DatabaseError as e:
         error, = e.args
-        console.print(f"[red]Failed to add genre: {error.message}[/red]")
+        console.print(f"[red]Failed to add genre: {validation_module.describe_error(connection, error, params)}[/red]")
+
+# A borrower's limit and open loan count, read alongside the add_loan checks.
+# The CASE expression matches the IX_Loans_Open_Borrower_ID index, so only
+# unreturned loans are read.
+BORROWER_OPEN_LOANS_COLUMNS = [
+    "(SELECT Borrowing_Limit FROM Borrowers WHERE Borrower_ID = :borrower_id)",
+    "(SELECT COUNT(*) FROM Loans L WHERE CASE WHEN L.Return_Status = 'N' THEN L.Borrower_ID END = :borrower_id)",
+]
 
 def add_loan(connection):
     console.print("[bold underline]Add New Loan[/bold underline]")
-    loan_number = Prompt.ask("Enter Loan Number")
-
-    # Check if Loan Number already exists
-    cursor = connection.cursor()
-    cursor.execute("SELECT * FROM Loans WHERE Loan_Number = :loan_number", loan_number=loan_number)
-    if cursor.fetchone():
-        console.print(f"[red]Loan Number {loan_number} already exists. Please use a different Loan Number.[/red]")
-        cursor.close()
-        return
-    cursor.close()
-
+    loan_number = Prompt.ask("Enter Loan Number (leave blank to generate)", default=None)
     borrower_id = Prompt.ask("Enter Borrower ID")
-    # Check if Borrower ID exists
-    cursor = connection.cursor()
-    cursor.execute("SELECT * FROM Borrowers WHERE Borrower_ID = :borrower_id", borrower_id=borrower_id)
-    if cursor.fetchone() is None:
-        console.print(f"[red]Borrower ID {borrower_id} does not exist.[/red]")
-        cursor.close()
-        return
-    cursor.close()
-
     isbn = Prompt.ask("Enter ISBN")
-    # Check if ISBN exists
-    cursor = connection.cursor()
-    cursor.execute("SELECT * FROM Books WHERE ISBN = :isbn", isbn=isbn)
-    if cursor.fetchone() is None:
-        console.print(f"[red]ISBN {isbn} does not exist.[/red]")
-        cursor.close()
-        return
-    cursor.close()
-
     admin_id = Prompt.ask("Enter Admin ID")
-    # Check if Admin ID exists
-    cursor = connection.cursor()
-    cursor.execute("SELECT * FROM Administrators WHERE Admin_ID = :admin_id", admin_id=admin_id)
-    if cursor.fetchone() is None:
-        console.print(f"[red]Admin ID {admin_id} does not exist.[/red]")
-        cursor.close()
+
+    # Check every key, and read the borrower's limit, in one round trip. A
+    # loan number already taken is reported by the primary key on insert.
+    problems, borrower = validation_module.check(connection, [
+        (f"Borrower ID {borrower_id} does not exist.", "SELECT * FROM Borrowers WHERE Borrower_ID = :borrower_id", True),
+        (f"ISBN {isbn} does not exist.", "SELECT * FROM Books WHERE ISBN = :isbn", True),
+        (f"Admin ID {admin_id} does not exist.", "SELECT * FROM Administrators WHERE Admin_ID = :admin_id", True),
+    ], BORROWER_OPEN_LOANS_COLUMNS, borrower_id=borrower_id, isbn=isbn, admin_id=admin_id)
+    if problems:
+        for problem in problems:
+            console.print(f"[red]{problem}[/red]")
         return
-    cursor.close()
 
     loan_date = Prompt.ask("Enter Loan Date (YYYY-MM-DD)", default=None)
     due_date = Prompt.ask("Enter Due Date (YYYY-MM-DD)")
     return_status = Prompt.ask("Enter Return Status (Y/N)", choices=['Y', 'N'], default='N')
 
+    # An open loan must fit within the borrower's borrowing limit
+    borrowing_limit, open_loans = borrower
+    if return_status == 'N' and borrowing_limit is not None and open_loans >= borrowing_limit:
+        console.print(f"[red]Borrower ID {borrower_id} already has {open_loans} open loans (limit {borrowing_limit}).[/red]")
+        return
+
     # Validate dates
     if not due_date:
         console.print("[red]Due Date is required.[/red]")
@@ -681,20 +679,36 @@ def add_loan(connection):
         console.print("[red]Due Date cannot be earlier than Loan Date.[/red]")
         return
 
+    if return_status == 'N':
+        # An open loan takes a copy: checkout re-checks the limit and the
+        # copies under row locks, so concurrent desks cannot over-lend
+        try:
+            loan_number = circulation_module.checkout(connection, loan_number, borrower_id, isbn, admin_id, due_date, loan_date)
+            console.print(f"[green]Loan added successfully with Loan Number {loan_number}.[/green]")
+        except circulation_module.CirculationRefused as e:
+            console.print(f"[red]{e}[/red]")
+        except cx_Oracle.DatabaseError as e:
+            error, = e.args
+            params = dict(loan_number=loan_number, borrower_id=borrower_id, isbn=isbn, admin_id=admin_id)
+            console.print(f"[red]Failed to add loan: {validation_module.describe_error(connection, error, params)}[/red]")
+        return
+
+    # A loan recorded as already returned leaves the copies as they are
     query = """
     INSERT INTO Loans (Loan_Number, Borrower_ID, ISBN, Loan_Date, Due_Date, Return_Status, Admin_ID)
-    VALUES (:loan_number, :borrower_id, :isbn, TO_DATE(:loan_date, 'YYYY-MM-DD'), TO_DATE(:due_date, 'YYYY-MM-DD'), :return_status, :admin_id)
+    VALUES (NVL(:loan_number, Loans_Seq.NEXTVAL), :borrower_id, :isbn, NVL(TO_DATE(:loan_date, 'YYYY-MM-DD'), TRUNC(SYSDATE)), TO_DATE(:due_date, 'YYYY-MM-DD'), :return_status, :admin_id)
+    RETURNING Loan_Number INTO :new_id
     """
+    params = dict(loan_number=loan_number, borrower_id=borrower_id, isbn=isbn, loan_date=loan_date,
+                  due_date=due_date, return_status=return_status, admin_id=admin_id)
     try:
-        cursor = connection.cursor()
-        cursor.execute(query, loan_number=loan_number, borrower_id=borrower_id, isbn=isbn,
-                       loan_date=loan_date, due_date=due_date, return_status=return_status, admin_id=admin_id)
-        connection.commit()
-        console.print("[green]Loan added successfully.[/green]")
-        cursor.close()
+        loan_number = id_module.insert_returning(connection, "LOANS", query, params)
+        cache_module.commit(connection, "LOANS")
+        console.print(f"[green]Loan added successfully with Loan Number {loan_number}.[/green]")
     except cx_Oracle.DatabaseError as e:
         error, = e.args
-        console.print(f"[red]Failed to add loan: {error.message}[/red]")
+        # A key deleted since the check above still fails cleanly on the constraint
+        console.print(f"[red]Failed to add loan: {validation_module.describe_error(connection, error, params)}[/red]")
 
 
 def update_record(connection):
@@ -751,6 +765,7 @@ def update_record(connection):
         else:
             console.print("[red]Invalid option. Please try again.[/red]")
 
+        pool_module.release_session(connection)
         pause()
 
 def update_book(connection):
@@ -760,15 +775,11 @@ def update_book(connection):
     # Fetch current data
     query = "SELECT Title, Publication_Date, Pages, Copies_Available, Publisher, Admin_ID FROM Books WHERE ISBN = :isbn"
     try:
-        cursor = connection.cursor()
-        cursor.execute(query, isbn=isbn)
-        result = cursor.fetchone()
+        result = executor_module.fetch_one(connection, query, isbn=isbn)
         if not result:
             console.print("[red]Book not found.[/red]")
-            cursor.close()
             return
         (current_title, current_pub_date, current_pages, current_copies, current_publisher, current_admin_id) = result
-        cursor.close()
     except cx_Oracle.DatabaseError as e:
         error, = e.args
         console.print(f"[red]Error fetching book: {error.message}[/red]")
@@ -784,13 +795,9 @@ def update_book(connection):
     admin_id = Prompt.ask(f"Enter new Admin ID (current: {current_admin_id})", default=str(current_admin_id))
 
     # Check if Admin ID exists
-    cursor = connection.cursor()
-    cursor.execute("SELECT * FROM Administrators WHERE Admin_ID = :admin_id", admin_id=admin_id)
-    if cursor.fetchone() is None:
+    if not executor_module.record_exists(connection, "SELECT * FROM Administrators WHERE Admin_ID = :admin_id", admin_id=admin_id):
         console.print(f"[red]Admin ID {admin_id} does not exist. Please add the administrator first.[/red]")
-        cursor.close()
         return
-    cursor.close()
 
     update_query = """
     UPDATE Books
@@ -803,12 +810,11 @@ def update_book(connection):
     WHERE ISBN = :isbn
     """
     try:
-        cursor = connection.cursor()
-        cursor.execute(update_query, title=title, publication_date=publication_date, pages=pages,
-                       copies_available=copies_available, publisher=publisher, admin_id=admin_id, isbn=isbn)
-        connection.commit()
+        executor_module.execute(connection, update_query, title=title, publication_date=publication_date, pages=pages,
+                                copies_available=copies_available, publisher=publisher, admin_id=admin_id, isbn=isbn)
+        cache_module.commit(connection, "BOOKS")
+        text_module.book_changed(connection, isbn)
         console.print("[green]Book updated successfully.[/green]")
-        cursor.close()
     except cx_Oracle.DatabaseError as e:
         error, = e.args
         console.print(f"[red]Failed to update book: {error.message}[/red]")
@@ -820,16 +826,12 @@ def update_loan(connection):
     # Fetch current data
     query = "SELECT Borrower_ID, ISBN, Loan_Date, Due_Date, Return_Date, Fine_Amount, Return_Status, Admin_ID FROM Loans WHERE Loan_Number = :loan_number"
     try:
-        cursor = connection.cursor()
-        cursor.execute(query, loan_number=loan_number)
-        result = cursor.fetchone()
+        result = executor_module.fetch_one(connection, query, loan_number=loan_number)
         if not result:
             console.print("[red]Loan not found.[/red]")
-            cursor.close()
             return
         (current_borrower_id, current_isbn, current_loan_date, current_due_date, current_return_date,
          current_fine_amount, current_return_status, current_admin_id) = result
-        cursor.close()
     except cx_Oracle.DatabaseError as e:
         error, = e.args
         console.print(f"[red]Error fetching loan: {error.message}[/red]")
@@ -838,23 +840,15 @@ def update_loan(connection):
     # Prompt for new data
     borrower_id = Prompt.ask(f"Enter new Borrower ID (current: {current_borrower_id})", default=str(current_borrower_id))
     # Check if Borrower ID exists
-    cursor = connection.cursor()
-    cursor.execute("SELECT * FROM Borrowers WHERE Borrower_ID = :borrower_id", borrower_id=borrower_id)
-    if cursor.fetchone() is None:
+    if not executor_module.record_exists(connection, "SELECT * FROM Borrowers WHERE Borrower_ID = :borrower_id", borrower_id=borrower_id):
         console.print(f"[red]Borrower ID {borrower_id} does not exist.[/red]")
-        cursor.close()
         return
-    cursor.close()
 
     isbn = Prompt.ask(f"Enter new ISBN (current: {current_isbn})", default=current_isbn)
     # Check if ISBN exists
-    cursor = connection.cursor()
-    cursor.execute("SELECT * FROM Books WHERE ISBN = :isbn", isbn=isbn)
-    if cursor.fetchone() is None:
+    if not executor_module.record_exists(connection, "SELECT * FROM Books WHERE ISBN = :isbn", isbn=isbn):
         console.print(f"[red]ISBN {isbn} does not exist.[/red]")
-        cursor.close()
         return
-    cursor.close()
 
     loan_date = Prompt.ask(f"Enter new Loan Date (YYYY-MM-DD) (current: {current_loan_date.strftime('%Y-%m-%d') if current_loan_date else 'N/A'})",
                            default=current_loan_date.strftime('%Y-%m-%d') if current_loan_date else None)
@@ -867,13 +861,9 @@ def update_loan(connection):
                                choices=['Y', 'N'], default=current_return_status)
     admin_id = Prompt.ask(f"Enter new Admin ID (current: {current_admin_id})", default=str(current_admin_id))
     # Check if Admin ID exists
-    cursor = connection.cursor()
-    cursor.execute("SELECT * FROM Administrators WHERE Admin_ID = :admin_id", admin_id=admin_id)
-    if cursor.fetchone() is None:
+    if not executor_module.record_exists(connection, "SELECT * FROM Administrators WHERE Admin_ID = :admin_id", admin_id=admin_id):
         console.print(f"[red]Admin ID {admin_id} does not exist.[/red]")
-        cursor.close()
         return
-    cursor.close()
 
     # Validate dates
     if loan_date and not validate_date_format(loan_date):
@@ -905,17 +895,23 @@ def update_loan(connection):
     WHERE Loan_Number = :loan_number
     """
     try:
-        cursor = connection.cursor()
-        cursor.execute(update_query, borrower_id=borrower_id, isbn=isbn,
-                       loan_date=loan_date if loan_date else None,
-                       due_date=due_date if due_date else None,
-                       return_date=return_date if return_date else None,
-                       fine_amount=fine_amount, return_status=return_status,
-                       admin_id=admin_id, loan_number=loan_number)
-        connection.commit()
+        executor_module.execute(connection, update_query, borrower_id=borrower_id, isbn=isbn,
+                                loan_date=loan_date if loan_date else None,
+                                due_date=due_date if due_date else None,
+                                return_date=return_date if return_date else None,
+                                fine_amount=fine_amount, return_status=return_status,
+                                admin_id=admin_id, loan_number=loan_number)
+        # An open loan holds a copy: give back the old one and take the new one in the same transaction
+        if current_return_status == 'N':
+            executor_module.execute(connection, circulation_module.RETURN_COPY_QUERY, isbn=current_isbn)
+        if return_status == 'N' and executor_module.execute(connection, circulation_module.TAKE_COPY_QUERY, isbn=isbn).rowcount == 0:
+            connection.rollback()
+            console.print(f"[red]No copies of ISBN {isbn} are available. Loan not updated.[/red]")
+            return
+        cache_module.commit(connection, "LOANS", "BOOKS")
         console.print("[green]Loan updated successfully.[/green]")
-        cursor.close()
     except cx_Oracle.DatabaseError as e:
+        connection.rollback()
         error, = e.args
         console.print(f"[red]Failed to update loan: {error.message}[/red]")
 
@@ -926,15 +922,11 @@ def update_author(connection):
     # Fetch current data
     query = "SELECT Name, Nationality, Date_of_Birth, Date_of_Death, Biography, Languages FROM Authors WHERE Author_ID = :author_id"
     try:
-        cursor = connection.cursor()
-        cursor.execute(query, author_id=author_id)
-        result = cursor.fetchone()
+        result = executor_module.fetch_one(connection, query, author_id=author_id)
         if not result:
             console.print("[red]Author not found.[/red]")
-            cursor.close()
             return
         (current_name, current_nationality, current_dob, current_dod, current_bio, current_languages) = result
-        cursor.close()
     except cx_Oracle.DatabaseError as e:
         error, = e.args
         console.print(f"[red]Error fetching author: {error.message}[/red]")
@@ -961,13 +953,12 @@ def update_author(connection):
     WHERE Author_ID = :author_id
     """
     try:
-        cursor = connection.cursor()
-        cursor.execute(update_query, name=name, nationality=nationality, date_of_birth=date_of_birth,
-                       date_of_death=date_of_death if date_of_death else None,
-                       biography=biography, languages=languages, author_id=author_id)
-        connection.commit()
+        executor_module.execute(connection, update_query, name=name, nationality=nationality, date_of_birth=date_of_birth,
+                                date_of_death=date_of_death if date_of_death else None,
+                                biography=biography, languages=languages, author_id=author_id)
+        cache_module.commit(connection, "AUTHORS")
+        text_module.author_changed(connection, author_id)
         console.print("[green]Author updated successfully.[/green]")
-        cursor.close()
     except cx_Oracle.DatabaseError as e:
         error, = e.args
         console.print(f"[red]Failed to update author: {error.message}[/red]")
@@ -979,15 +970,11 @@ def update_borrower(connection):
     # Fetch current data
     query = "SELECT User_ID, Borrowing_Limit, Amount_Payable FROM Borrowers WHERE Borrower_ID = :borrower_id"
     try:
-        cursor = connection.cursor()
-        cursor.execute(query, borrower_id=borrower_id)
-        result = cursor.fetchone()
+        result = executor_module.fetch_one(connection, query, borrower_id=borrower_id)
         if not result:
             console.print("[red]Borrower not found.[/red]")
-            cursor.close()
             return
         current_user_id, current_limit, current_payable = result
-        cursor.close()
     except cx_Oracle.DatabaseError as e:
         error, = e.args
         console.print(f"[red]Error fetching borrower: {error.message}[/red]")
@@ -997,13 +984,9 @@ def update_borrower(connection):
     user_id = Prompt.ask(f"Enter new User ID (current: {current_user_id})", default=current_user_id)
 
     # Check if User ID exists
-    cursor = connection.cursor()
-    cursor.execute("SELECT * FROM Users WHERE User_ID = :user_id", user_id=user_id)
-    if cursor.fetchone() is None:
+    if not executor_module.record_exists(connection, "SELECT * FROM Users WHERE User_ID = :user_id", user_id=user_id):
         console.print(f"[red]User ID {user_id} does not exist. Please add the user first.[/red]")
-        cursor.close()
         return
-    cursor.close()
 
     borrowing_limit = Prompt.ask(f"Enter new Borrowing Limit (current: {current_limit})", default=str(current_limit))
     amount_payable = Prompt.ask(f"Enter new Amount Payable (current: {current_payable})", default=str(current_payable))
@@ -1016,12 +999,10 @@ def update_borrower(connection):
     WHERE Borrower_ID = :borrower_id
     """
     try:
-        cursor = connection.cursor()
-        cursor.execute(update_query, user_id=user_id, borrowing_limit=borrowing_limit,
-                       amount_payable=amount_payable, borrower_id=borrower_id)
-        connection.commit()
+        executor_module.execute(connection, update_query, user_id=user_id, borrowing_limit=borrowing_limit,
+                                amount_payable=amount_payable, borrower_id=borrower_id)
+        cache_module.commit(connection, "BORROWERS")
         console.print("[green]Borrower updated successfully.[/green]")
-        cursor.close()
     except cx_Oracle.DatabaseError as e:
         error, = e.args
         console.print(f"[red]Failed to update borrower: {error.message}[/red]")
@@ -1033,16 +1014,12 @@ def update_user(connection):
     # Fetch current data
     query = "SELECT First_Name, Last_Name, Phone_Number, Email, Username, Password, Street, City, State, ZIP_Code FROM Users WHERE User_ID = :user_id"
     try:
-        cursor = connection.cursor()
-        cursor.execute(query, user_id=user_id)
-        result = cursor.fetchone()
+        result = executor_module.fetch_one(connection, query, user_id=user_id)
         if not result:
             console.print("[red]User not found.[/red]")
-            cursor.close()
             return
         (current_first, current_last, current_phone, current_email, current_username, current_password,
          current_street, current_city, current_state, current_zip) = result
-        cursor.close()
     except cx_Oracle.DatabaseError as e:
         error, = e.args
         console.print(f"[red]Error fetching user: {error.message}[/red]")
@@ -1075,14 +1052,12 @@ def update_user(connection):
     WHERE User_ID = :user_id
     """
     try:
-        cursor = connection.cursor()
-        cursor.execute(update_query, first_name=first_name, last_name=last_name,
-                       phone_number=phone_number, email=email, username=username, password=password,
-                       street=street, city=city, state=state, zip_code=zip_code,
-                       user_id=user_id)
-        connection.commit()
+        executor_module.execute(connection, update_query, first_name=first_name, last_name=last_name,
+                                phone_number=phone_number, email=email, username=username, password=password,
+                                street=street, city=city, state=state, zip_code=zip_code,
+                                user_id=user_id)
+        cache_module.commit(connection, "USERS")
         console.print("[green]User updated successfully.[/green]")
-        cursor.close()
     except cx_Oracle.DatabaseError as e:
         error, = e.args
         console.print(f"[red]Failed to update user: {error.message}[/red]")
@@ -1094,15 +1069,11 @@ def update_administrator(connection):
     # Fetch current data
     query = "SELECT User_ID, Role, Permissions, Last_Login FROM Administrators WHERE Admin_ID = :admin_id"
     try:
-        cursor = connection.cursor()
-        cursor.execute(query, admin_id=admin_id)
-        result = cursor.fetchone()
+        result = executor_module.fetch_one(connection, query, admin_id=admin_id)
         if not result:
             console.print("[red]Administrator not found.[/red]")
-            cursor.close()
             return
         current_user_id, current_role, current_permissions, current_last_login = result
-        cursor.close()
     except cx_Oracle.DatabaseError as e:
         error, = e.args
         console.print(f"[red]Error fetching administrator: {error.message}[/red]")
@@ -1112,13 +1083,9 @@ def update_administrator(connection):
     user_id = Prompt.ask(f"Enter new User ID (current: {current_user_id})", default=str(current_user_id))
 
     # Check if User ID exists
-    cursor = connection.cursor()
-    cursor.execute("SELECT * FROM Users WHERE User_ID = :user_id", user_id=user_id)
-    if cursor.fetchone() is None:
+    if not executor_module.record_exists(connection, "SELECT * FROM Users WHERE User_ID = :user_id", user_id=user_id):
         console.print(f"[red]User ID {user_id} does not exist. Please add the user first.[/red]")
-        cursor.close()
         return
-    cursor.close()
 
     role = Prompt.ask(f"Enter new Role (current: {current_role})", default=current_role)
     permissions = Prompt.ask(f"Enter new Permissions (current: {current_permissions})", default=current_permissions)
@@ -1134,12 +1101,10 @@ def update_administrator(connection):
     WHERE Admin_ID = :admin_id
     """
     try:
-        cursor = connection.cursor()
-        cursor.execute(update_query, user_id=user_id, role=role, permissions=permissions,
-                       last_login=last_login if last_login else None, admin_id=admin_id)
-        connection.commit()
+        executor_module.execute(connection, update_query, user_id=user_id, role=role, permissions=permissions,
+                                last_login=last_login if last_login else None, admin_id=admin_id)
+        cache_module.commit(connection, "ADMINISTRATORS")
         console.print("[green]Administrator updated successfully.[/green]")
-        cursor.close()
     except cx_Oracle.DatabaseError as e:
         error, = e.args
         console.print(f"[red]Failed to update administrator: {error.message}[/red]")
@@ -1151,15 +1116,11 @@ def update_genre(connection):
     # Fetch current data
     query = "SELECT Title, Description FROM Genres WHERE Genre_ID = :genre_id"
     try:
-        cursor = connection.cursor()
-        cursor.execute(query, genre_id=genre_id)
-        result = cursor.fetchone()
+        result = executor_module.fetch_one(connection, query, genre_id=genre_id)
         if not result:
             console.print("[red]Genre not found.[/red]")
-            cursor.close()
             return
         current_title, current_description = result
-        cursor.close()
     except cx_Oracle.DatabaseError as e:
         error, = e.args
         console.print(f"[red]Error fetching genre: {error.message}[/red]")
@@ -1176,11 +1137,10 @@ def update_genre(connection):
     WHERE Genre_ID = :genre_id
     """
     try:
-        cursor = connection.cursor()
-        cursor.execute(update_query, title=title, description=description, genre_id=genre_id)
-        connection.commit()
+        executor_module.execute(connection, update_query, title=title, description=description, genre_id=genre_id)
+        cache_module.commit(connection, "GENRES")
+        text_module.genre_changed(connection, genre_id)
         console.print("[green]Genre updated successfully.[/green]")
-        cursor.close()
     except cx_Oracle.DatabaseError as e:
         error, = e.args
         console.print(f"[red]Failed to update genre: {error.message}[/red]")
@@ -1190,15 +1150,11 @@ def manage_book_genres(connection):
     isbn = Prompt.ask("Enter ISBN of the book")
 
     # Check if book exists
-    cursor = connection.cursor()
-    cursor.execute("SELECT Title FROM Books WHERE ISBN = :isbn", isbn=isbn)
-    result = cursor.fetchone()
+    result = executor_module.fetch_one(connection, "SELECT Title FROM Books WHERE ISBN = :isbn", isbn=isbn)
     if not result:
         console.print("[red]Book not found.[/red]")
-        cursor.close()
         return
     book_title = result[0]
-    cursor.close()
 
     console.print(f"Managing genres for book: [green]{book_title}[/green]")
 
@@ -1209,20 +1165,15 @@ def manage_book_genres(connection):
         elif action == 'a':
             genre_id = Prompt.ask("Enter Genre ID to associate with this book")
             # Check if genre exists
-            cursor = connection.cursor()
-            cursor.execute("SELECT * FROM Genres WHERE Genre_ID = :genre_id", genre_id=genre_id)
-            if cursor.fetchone() is None:
+            if not executor_module.record_exists(connection, "SELECT * FROM Genres WHERE Genre_ID = :genre_id", genre_id=genre_id):
                 console.print(f"[red]Genre ID {genre_id} does not exist. Please add the genre first.[/red]")
-                cursor.close()
                 continue
-            cursor.close()
             # Insert into BookGenre
             try:
-                cursor = connection.cursor()
-                cursor.execute("INSERT INTO BookGenre (ISBN, Genre_ID) VALUES (:isbn, :genre_id)", isbn=isbn, genre_id=genre_id)
-                connection.commit()
+                executor_module.execute(connection, "INSERT INTO BookGenre (ISBN, Genre_ID) VALUES (:isbn, :genre_id)", isbn=isbn, genre_id=genre_id)
+                cache_module.commit(connection, "BOOKGENRE")
+                text_module.book_changed(connection, isbn)
                 console.print(f"[green]Associated Genre ID {genre_id} with the book.[/green]")
-                cursor.close()
             except cx_Oracle.DatabaseError as e:
                 error, = e.args
                 console.print(f"[red]Failed to associate genre: {error.message}[/red]")
@@ -1230,20 +1181,15 @@ def manage_book_genres(connection):
         elif action == 'r':
             genre_id = Prompt.ask("Enter Genre ID to remove from this book")
             # Check if association exists
-            cursor = connection.cursor()
-            cursor.execute("SELECT * FROM BookGenre WHERE ISBN = :isbn AND Genre_ID = :genre_id", isbn=isbn, genre_id=genre_id)
-            if cursor.fetchone() is None:
+            if not executor_module.record_exists(connection, "SELECT * FROM BookGenre WHERE ISBN = :isbn AND Genre_ID = :genre_id", isbn=isbn, genre_id=genre_id):
                 console.print(f"[red]Genre ID {genre_id} is not associated with this book.[/red]")
-                cursor.close()
                 continue
-            cursor.close()
             # Delete from BookGenre
             try:
-                cursor = connection.cursor()
-                cursor.execute("DELETE FROM BookGenre WHERE ISBN = :isbn AND Genre_ID = :genre_id", isbn=isbn, genre_id=genre_id)
-                connection.commit()
+                executor_module.execute(connection, "DELETE FROM BookGenre WHERE ISBN = :isbn AND Genre_ID = :genre_id", isbn=isbn, genre_id=genre_id)
+                cache_module.commit(connection, "BOOKGENRE")
+                text_module.book_changed(connection, isbn)
                 console.print(f"[green]Removed Genre ID {genre_id} from the book.[/green]")
-                cursor.close()
             except cx_Oracle.DatabaseError as e:
                 error, = e.args
                 console.print(f"[red]Failed to remove genre: {error.message}[/red]")
@@ -1254,15 +1200,11 @@ def manage_book_authors(connection):
     isbn = Prompt.ask("Enter ISBN of the book")
 
     # Check if book exists
-    cursor = connection.cursor()
-    cursor.execute("SELECT Title FROM Books WHERE ISBN = :isbn", isbn=isbn)
-    result = cursor.fetchone()
+    result = executor_module.fetch_one(connection, "SELECT Title FROM Books WHERE ISBN = :isbn", isbn=isbn)
     if not result:
         console.print("[red]Book not found.[/red]")
-        cursor.close()
         return
     book_title = result[0]
-    cursor.close()
 
     console.print(f"Managing authors for book: [green]{book_title}[/green]")
 
@@ -1273,20 +1215,15 @@ def manage_book_authors(connection):
         elif action == 'a':
             author_id = Prompt.ask("Enter Author ID to associate with this book")
             # Check if author exists
-            cursor = connection.cursor()
-            cursor.execute("SELECT * FROM Authors WHERE Author_ID = :author_id", author_id=author_id)
-            if cursor.fetchone() is None:
+            if not executor_module.record_exists(connection, "SELECT * FROM Authors WHERE Author_ID = :author_id", author_id=author_id):
                 console.print(f"[red]Author ID {author_id} does not exist. Please add the author first.[/red]")
-                cursor.close()
                 continue
-            cursor.close()
             # Insert into BookAuthor
             try:
-                cursor = connection.cursor()
-                cursor.execute("INSERT INTO BookAuthor (ISBN, Author_ID) VALUES (:isbn, :author_id)", isbn=isbn, author_id=author_id)
-                connection.commit()
+                executor_module.execute(connection, "INSERT INTO BookAuthor (ISBN, Author_ID) VALUES (:isbn, :author_id)", isbn=isbn, author_id=author_id)
+                cache_module.commit(connection, "BOOKAUTHOR")
+                text_module.book_changed(connection, isbn)
                 console.print(f"[green]Associated Author ID {author_id} with the book.[/green]")
-                cursor.close()
             except cx_Oracle.DatabaseError as e:
                 error, = e.args
                 console.print(f"[red]Failed to associate author: {error.message}[/red]")
@@ -1294,20 +1231,15 @@ def manage_book_authors(connection):
         elif action == 'r':
             author_id = Prompt.ask("Enter Author ID to remove from this book")
             # Check if association exists
-            cursor = connection.cursor()
-            cursor.execute("SELECT * FROM BookAuthor WHERE ISBN = :isbn AND Author_ID = :author_id", isbn=isbn, author_id=author_id)
-            if cursor.fetchone() is None:
+            if not executor_module.record_exists(connection, "SELECT * FROM BookAuthor WHERE ISBN = :isbn AND Author_ID = :author_id", isbn=isbn, author_id=author_id):
                 console.print(f"[red]Author ID {author_id} is not associated with this book.[/red]")
-                cursor.close()
                 continue
-            cursor.close()
             # Delete from BookAuthor
             try:
-                cursor = connection.cursor()
-                cursor.execute("DELETE FROM BookAuthor WHERE ISBN = :isbn AND Author_ID = :author_id", isbn=isbn, author_id=author_id)
-                connection.commit()
+                executor_module.execute(connection, "DELETE FROM BookAuthor WHERE ISBN = :isbn AND Author_ID = :author_id", isbn=isbn, author_id=author_id)
+                cache_module.commit(connection, "BOOKAUTHOR")
+                text_module.book_changed(connection, isbn)
                 console.print(f"[green]Removed Author ID {author_id} from the book.[/green]")
-                cursor.close()
             except cx_Oracle.DatabaseError as e:
                 error, = e.args
                 console.print(f"[red]Failed to remove author: {error.message}[/red]")
@@ -1326,19 +1258,21 @@ def delete_record(connection):
                 "5. Delete Administrator",   # <--- New Option
                 "6. Delete Genre",          # <--- New Option
                 "7. Delete Loan",
-                "8. Back to Main Menu",
+                "8. Batch Delete (List / File)",
+                "9. ON DELETE CASCADE Foreign Keys",
+                "10. Back to Main Menu",
                 "----------------------------------------"
             ]),
             title="Delete Menu",
-            subtitle="Choose an option [1-8]",
+            subtitle="Choose an option [1-10]",
             style="bold red",
             box=box.DOUBLE_EDGE
         )
         console.print(delete_menu)
         try:
-            choice = IntPrompt.ask("Your choice", default=8)
+            choice = IntPrompt.ask("Your choice", default=10)
         except Exception:
-            console.print("[red]Invalid input. Please enter a number between 1 and 8.[/red]")
+            console.print("[red]Invalid input. Please enter a number between 1 and 10.[/red]")
             continue
 
         console.print("\n")
@@ -1357,10 +1291,15 @@ def delete_record(connection):
         elif choice == 7:
             delete_loan(connection)          
         elif choice == 8:
+            batch_delete(connection)
+        elif choice == 9:
+            cascade_settings(connection)
+        elif choice == 10:
             break
         else:
             console.print("[red]Invalid option. Please try again.[/red]")
 
+        pool_module.release_session(connection)
         pause()
 
 def delete_book(connection):
@@ -1369,21 +1308,21 @@ def delete_book(connection):
 
     # Delete from BookAuthor and BookGenre first due to foreign key constraints
     try:
-        cursor = connection.cursor()
-        # Delete related loans first if any
-        cursor.execute("DELETE FROM Loans WHERE ISBN = :isbn", isbn=isbn)
+        # Delete related loans first if any, giving back the copies of open ones
+        circulation_module.release_copies(connection, "ISBN", [isbn])
+        executor_module.execute(connection, "DELETE FROM Loans WHERE ISBN = :isbn", isbn=isbn)
         # Delete from BookAuthor
-        cursor.execute("DELETE FROM BookAuthor WHERE ISBN = :isbn", isbn=isbn)
+        executor_module.execute(connection, "DELETE FROM BookAuthor WHERE ISBN = :isbn", isbn=isbn)
         # Delete from BookGenre
-        cursor.execute("DELETE FROM BookGenre WHERE ISBN = :isbn", isbn=isbn)
+        executor_module.execute(connection, "DELETE FROM BookGenre WHERE ISBN = :isbn", isbn=isbn)
         # Finally, delete from Books
-        cursor.execute("DELETE FROM Books WHERE ISBN = :isbn", isbn=isbn)
+        cursor = executor_module.execute(connection, "DELETE FROM Books WHERE ISBN = :isbn", isbn=isbn)
         if cursor.rowcount == 0:
             console.print("[red]No book found with the provided ISBN.[/red]")
         else:
-            connection.commit()
+            cache_module.commit(connection, "LOANS", "BOOKAUTHOR", "BOOKGENRE", "BOOKS")
+            text_module.book_changed(connection, isbn)
             console.print("[green]Book and related records deleted successfully.[/green]")
-        cursor.close()
     except cx_Oracle.DatabaseError as e:
         error, = e.args
         console.print(f"[red]Failed to delete book: {error.message}[/red]")
@@ -1393,14 +1332,14 @@ def delete_loan(connection):
     loan_number = Prompt.ask("Enter Loan Number to delete")
 
     try:
-        cursor = connection.cursor()
-        cursor.execute("DELETE FROM Loans WHERE Loan_Number = :loan_number", loan_number=loan_number)
+        # An open loan holds a copy, which goes back to the book
+        circulation_module.release_copies(connection, "Loan_Number", [loan_number])
+        cursor = executor_module.execute(connection, "DELETE FROM Loans WHERE Loan_Number = :loan_number", loan_number=loan_number)
         if cursor.rowcount == 0:
             console.print("[red]No loan found with the provided Loan Number.[/red]")
         else:
-            connection.commit()
+            cache_module.commit(connection, "LOANS", "BOOKS")
             console.print("[green]Loan deleted successfully.[/green]")
-        cursor.close()
     except cx_Oracle.DatabaseError as e:
         error, = e.args
         console.print(f"[red]Failed to delete loan: {error.message}[/red]")
@@ -1412,17 +1351,18 @@ def delete_author(connection):
 
     # Delete from BookAuthor first due to foreign key constraints
     try:
-        cursor = connection.cursor()
+        # Books whose text index entries mention it, read before the links are deleted
+        isbns = text_module.linked_books(connection, text_module.AUTHOR_BOOKS_QUERY, author_id=author_id)
         # Delete related BookAuthor entries
-        cursor.execute("DELETE FROM BookAuthor WHERE Author_ID = :author_id", author_id=author_id)
+        executor_module.execute(connection, "DELETE FROM BookAuthor WHERE Author_ID = :author_id", author_id=author_id)
         # Finally, delete from Authors
-        cursor.execute("DELETE FROM Authors WHERE Author_ID = :author_id", author_id=author_id)
+        cursor = executor_module.execute(connection, "DELETE FROM Authors WHERE Author_ID = :author_id", author_id=author_id)
         if cursor.rowcount == 0:
             console.print("[red]No author found with the provided ID.[/red]")
         else:
-            connection.commit()
+            cache_module.commit(connection, "BOOKAUTHOR", "AUTHORS")
+            text_module.author_changed(connection, author_id, isbns)
             console.print("[green]Author and related records deleted successfully.[/green]")
-        cursor.close()
     except cx_Oracle.DatabaseError as e:
         error, = e.args
         console.print(f"[red]Failed to delete author: {error.message}[/red]")
@@ -1433,17 +1373,16 @@ def delete_borrower(connection):
 
     # Delete from Loans first due to foreign key constraints
     try:
-        cursor = connection.cursor()
-        # Delete related Loans
-        cursor.execute("DELETE FROM Loans WHERE Borrower_ID = :borrower_id", borrower_id=borrower_id)
+        # Delete related Loans, giving back the copies of open ones
+        circulation_module.release_copies(connection, "Borrower_ID", [borrower_id])
+        executor_module.execute(connection, "DELETE FROM Loans WHERE Borrower_ID = :borrower_id", borrower_id=borrower_id)
         # Delete from Borrowers
-        cursor.execute("DELETE FROM Borrowers WHERE Borrower_ID = :borrower_id", borrower_id=borrower_id)
+        cursor = executor_module.execute(connection, "DELETE FROM Borrowers WHERE Borrower_ID = :borrower_id", borrower_id=borrower_id)
         if cursor.rowcount == 0:
             console.print("[red]No borrower found with the provided ID.[/red]")
         else:
-            connection.commit()
+            cache_module.commit(connection, "LOANS", "BOOKS", "BORROWERS")
             console.print("[green]Borrower and related records deleted successfully.[/green]")
-        cursor.close()
     except cx_Oracle.DatabaseError as e:
         error, = e.args
         console.print(f"[red]Failed to delete borrower: {error.message}[/red]")
@@ -1454,26 +1393,20 @@ def delete_user(connection):
 
     # Check if User is associated with Borrower or Administrator
     try:
-        cursor = connection.cursor()
-        cursor.execute("SELECT * FROM Borrowers WHERE User_ID = :user_id", user_id=user_id)
-        borrower_exists = cursor.fetchone() is not None
-        cursor.execute("SELECT * FROM Administrators WHERE User_ID = :user_id", user_id=user_id)
-        admin_exists = cursor.fetchone() is not None
-        cursor.close()
+        borrower_exists = executor_module.record_exists(connection, "SELECT * FROM Borrowers WHERE User_ID = :user_id", user_id=user_id)
+        admin_exists = executor_module.record_exists(connection, "SELECT * FROM Administrators WHERE User_ID = :user_id", user_id=user_id)
 
         if borrower_exists or admin_exists:
             console.print("[red]Cannot delete user associated with Borrower or Administrator records.[/red]")
             return
 
         # Safe to delete the user
-        cursor = connection.cursor()
-        cursor.execute("DELETE FROM Users WHERE User_ID = :user_id", user_id=user_id)
+        cursor = executor_module.execute(connection, "DELETE FROM Users WHERE User_ID = :user_id", user_id=user_id)
         if cursor.rowcount == 0:
             console.print("[red]No user found with the provided ID.[/red]")
         else:
-            connection.commit()
+            cache_module.commit(connection, "USERS")
             console.print("[green]User deleted successfully.[/green]")
-        cursor.close()
     except cx_Oracle.DatabaseError as e:
         error, = e.args
         console.print(f"[red]Failed to delete user: {error.message}[/red]")
@@ -1484,25 +1417,20 @@ def delete_administrator(connection):
 
     # Delete from Administrators
     try:
-        cursor = connection.cursor()
         # Check if admin has associated books or loans
-        cursor.execute("SELECT * FROM Books WHERE Admin_ID = :admin_id", admin_id=admin_id)
-        books_managed = cursor.fetchone() is not None
-        cursor.execute("SELECT * FROM Loans WHERE Admin_ID = :admin_id", admin_id=admin_id)
-        loans_processed = cursor.fetchone() is not None
+        books_managed = executor_module.record_exists(connection, "SELECT * FROM Books WHERE Admin_ID = :admin_id", admin_id=admin_id)
+        loans_processed = executor_module.record_exists(connection, "SELECT * FROM Loans WHERE Admin_ID = :admin_id", admin_id=admin_id)
 
         if books_managed or loans_processed:
             console.print("[red]Cannot delete administrator associated with books or loans.[/red]")
-            cursor.close()
             return
 
-        cursor.execute("DELETE FROM Administrators WHERE Admin_ID = :admin_id", admin_id=admin_id)
+        cursor = executor_module.execute(connection, "DELETE FROM Administrators WHERE Admin_ID = :admin_id", admin_id=admin_id)
         if cursor.rowcount == 0:
             console.print("[red]No administrator found with the provided ID.[/red]")
         else:
-            connection.commit()
+            cache_module.commit(connection, "ADMINISTRATORS")
             console.print("[green]Administrator deleted successfully.[/green]")
-        cursor.close()
     except cx_Oracle.DatabaseError as e:
         error, = e.args
         console.print(f"[red]Failed to delete administrator: {error.message}[/red]")
@@ -1513,21 +1441,76 @@ def delete_genre(connection):
 
     # Delete from BookGenre first due to foreign key constraints
     try:
-        cursor = connection.cursor()
+        # Books whose text index entries mention it, read before the links are deleted
+        isbns = text_module.linked_books(connection, text_module.GENRE_BOOKS_QUERY, genre_id=genre_id)
         # Delete related BookGenre entries
-        cursor.execute("DELETE FROM BookGenre WHERE Genre_ID = :genre_id", genre_id=genre_id)
+        executor_module.execute(connection, "DELETE FROM BookGenre WHERE Genre_ID = :genre_id", genre_id=genre_id)
         # Finally, delete from Genres
-        cursor.execute("DELETE FROM Genres WHERE Genre_ID = :genre_id", genre_id=genre_id)
+        cursor = executor_module.execute(connection, "DELETE FROM Genres WHERE Genre_ID = :genre_id", genre_id=genre_id)
         if cursor.rowcount == 0:
             console.print("[red]No genre found with the provided ID.[/red]")
         else:
-            connection.commit()
+            cache_module.commit(connection, "BOOKGENRE", "GENRES")
+            text_module.genre_changed(connection, genre_id, isbns)
             console.print("[green]Genre and related records deleted successfully.[/green]")
-        cursor.close()
     except cx_Oracle.DatabaseError as e:
         error, = e.args
         console.print(f"[red]Failed to delete genre: {error.message}[/red]")
 
+# Function to delete many books, authors or borrowers, and their dependent rows, in array-bound chunks
+def batch_delete(connection):
+    console.print("[bold underline]Batch Delete[/bold underline]")
+    name = Prompt.ask("Delete", choices=list(delete_module.CASCADES), default="books")
+    table, key = delete_module.CASCADES[name][:2]
+    file_path = Prompt.ask(f"File of {key} values (leave blank to enter them here)", default="")
+    try:
+        if file_path:
+            if not os.path.isfile(file_path):
+                console.print(f"[red]File '{file_path}' not found.[/red]")
+                return
+            with open(file_path) as lines:
+                keys = delete_module.parse_keys(name, circulation_module.scanned_codes(lines, False))
+        else:
+            console.print(f"Enter or paste the {key} values; an empty line finishes.")
+            keys = delete_module.parse_keys(name, circulation_module.scanned_codes(sys.stdin))
+    except ValueError:
+        console.print(f"[red]{key} values must be numbers.[/red]")
+        return
+    if not keys:
+        return
+    confirm = Prompt.ask(f"Delete {len(keys)} {name} and every row that refers to them? (y/n)", default="n").lower()
+    if confirm != 'y':
+        return
+    batch_size = max(1, IntPrompt.ask("Keys per transaction", default=delete_module.DELETE_BATCH_SIZE))
+
+    def progress(report):
+        console.print(f"{report['deleted']} deleted in {report['seconds']:.2f}s")
+
+    try:
+        report = delete_module.batch_delete(connection, name, keys, batch_size, progress)
+        delete_module.show_delete_report(name, report)
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        console.print(f"[red]Batch delete stopped: {validation_module.describe_error(connection, error)}. "
+                      f"Earlier chunks were committed.[/red]")
+    # Author and title text indexes are brought up to date once for the whole batch
+    text_module.data_reloaded(connection)
+
+# Function to show, install or remove ON DELETE CASCADE on the foreign keys batch deletes go through
+def cascade_settings(connection):
+    console.print("[bold underline]ON DELETE CASCADE Foreign Keys[/bold underline]")
+    try:
+        delete_module.show_cascade_status(connection)
+        action = Prompt.ask("\\[i]nstall ON DELETE CASCADE, \\[r]emove it, or \\[k]eep as is", choices=['i', 'r', 'k'], default='k')
+        if action == 'k':
+            return
+        changed = delete_module.set_cascades(connection, action == 'i')
+        console.print(f"[green]{changed} foreign keys re-created.[/green]")
+        delete_module.show_cascade_status(connection)
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        console.print(f"[red]Failed to change the foreign keys: {error.message}[/red]")
+
 # Function to display messages between operations
 def pause():
     console.print("\nPress [bold cyan]Enter[/bold cyan] to continue...")
@@ -1558,16 +1541,66 @@ def show_menu():
             "17. Update Records",
             "18. Delete Records",
             "19. Relational Algebra",
-            "20. exit",
+            "20. Performance & Bulk Tools",
+            "21. exit",
             "----------------------------------------"
         ]),
         title="Main Menu",
-        subtitle="Enter your choice [1-20]",
+        subtitle="Enter your choice [1-21]",
         style="bold cyan",
         box=box.DOUBLE_EDGE
     )
     console.print(menu)
 
+# Function to dispatch a main menu choice
+def run_menu_option(connection, choice):
+    if choice == 1:
+        create_tables(connection)
+    elif choice == 2:
+        drop_tables(connection)
+    elif choice == 3:
+        populate_tables(connection)
+    elif choice == 4:
+        delete_all_data(connection)
+    elif choice == 5:
+        create_views(connection)
+    elif choice == 6:
+        drop_views(connection)
+    elif choice == 7:
+        find_top_borrowed_authors(connection)
+    elif choice == 8:
+        list_overdue_loans(connection)
+    elif choice == 9:
+        find_genres_with_most_books(connection)
+    elif choice == 10:
+        list_admins_managing_most_books(connection)
+    elif choice == 11:
+        show_total_fines(connection)
+    elif choice == 12:
+        find_authors_no_borrowed_books(connection)
+    elif choice == 13:
+        list_unique_genres(connection)
+    elif choice == 14:
+        show_books_not_borrowed_last_year(connection)
+    elif choice == 15:
+        search_module.search_records(connection)  # <--- Modified to use imported module
+    elif choice == 16:
+        add_record(connection)                   # <--- New Option
+    elif choice == 17:
+        update_record(connection)                # <--- New Option
+    elif choice == 18:
+        delete_record(connection)                # <--- New Option
+    elif choice == 19:
+        ra_module.ra_operations(connection)
+    elif choice == 20:
+        tools_module.tools_operations(connection)
+    elif choice == 21:
+        console.print("[bold magenta]Exiting the application. Goodbye![/bold magenta]")
+        connection.close()
+        sys.exit(0)
+    else:
+        console.print("[red]Invalid option. Please try again.[/red]")
+
 # Main function
 def main():
     console.print(Panel("Welcome to the Library Management System", style="bold green"))
@@ -1576,62 +1609,29 @@ def main():
     DB_USER = Prompt.ask("Enter your Oracle username")
     DB_PASS = getpass.getpass("Enter your Oracle password: ")
 
-    # Establish database connection
+    # Establish the pooled database connection
     connection = get_db_connection(DB_USER, DB_PASS)
 
+    # Prefix suggestions are answered from memory (Search Records, option 7)
+    typeahead_module.load_at_startup(connection)
+    pool_module.release_session(connection)
+
     while True:
         show_menu()
         try:
-            choice = IntPrompt.ask("Your choice", default=20)
+            choice = IntPrompt.ask("Your choice", default=21)
         except Exception:
-            console.print("[red]Invalid input. Please enter a number between 1 and 20.[/red]")
+            console.print("[red]Invalid input. Please enter a number between 1 and 21.[/red]")
             continue
 
         console.print("\n")
-        if choice == 1:
-            create_tables(connection)
-        elif choice == 2:
-            drop_tables(connection)
-        elif choice == 3:
-            populate_tables(connection)
-        elif choice == 4:
-            delete_all_data(connection)
-        elif choice == 5:
-            create_views(connection)
-        elif choice == 6:
-            drop_views(connection)
-        elif choice == 7:
-            find_top_borrowed_authors(connection)
-        elif choice == 8:
-            list_overdue_loans(connection)
-        elif choice == 9:
-            find_genres_with_most_books(connection)
-        elif choice == 10:
-            list_admins_managing_most_books(connection)
-        elif choice == 11:
-            show_total_fines(connection)
-        elif choice == 12:
-            find_authors_no_borrowed_books(connection)
-        elif choice == 13:
-            list_unique_genres(connection)
-        elif choice == 14:
-            show_books_not_borrowed_last_year(connection)
-        elif choice == 15:
-            search_module.search_records(connection)  # <--- Modified to use imported module
-        elif choice == 16:
-            add_record(connection)                   # <--- New Option
-        elif choice == 17:
-            update_record(connection)                # <--- New Option
-        elif choice == 18:
-            delete_record(connection)                # <--- New Option
-        elif choice == 19:
-            ra_module.ra_operations(connection)
-        elif choice == 20:
-            console.print("[bold magenta]Exiting the application. Goodbye![/bold magenta]")
-            connection.close()
-            sys.exit(0)
-        else:
-            console.print("[red]Invalid option. Please try again.[/red]")
+        try:
+            run_menu_option(connection, choice)
+        except (cx_Oracle.DatabaseError, pool_module.PoolExhaustedError) as e:
+            # A dropped session is discarded on release and replaced on the next acquire
+            console.print(f"[red]Database unavailable: {e}. Please try again.[/red]")
+        finally:
+            pool_module.release_session(connection)
 
         pause()
         console.clear()
@@ -36,6 +36,7 @@ EOF
 create_tables() {
     echo "Running schema creation script..."
     execute_sql_file "schema_creation.sql"
+    execute_sql_file "create_indexes.sql"
     echo "Tables have been created successfully."
 }
 
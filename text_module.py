@@ -0,0 +1,431 @@
+# text_module.py
+
+import bisect
+import math
+import re
+import sqlite3
+import threading
+import time
+import cx_Oracle
+from rich.console import Console
+from rich.table import Table
+from rich import box
+
+import executor_module
+
+# Initialize Rich Console
+console = Console()
+
+CREATE_SCRIPT = "create_text_indexes.sql"
+DROP_SCRIPT = "delete_text_indexes.sql"
+
+# Oracle Text CONTEXT index for each searchable field
+TEXT_INDEXES = {
+    "title": "TX_BOOKS_TITLE",
+    "publisher": "TX_BOOKS_PUBLISHER",
+    "author": "TX_AUTHORS_NAME",
+    "genre": "TX_GENRES_TITLE",
+}
+
+# Seconds the list of existing text indexes is trusted before it is re-read
+PRESENCE_TTL = 60
+
+# Seconds the in-process fallback index is used before it is rebuilt, to
+# pick up changes made by other sessions
+FALLBACK_TTL = 600
+
+# BM25 ranking parameters for the fallback index
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+TOKEN_PATTERN = re.compile(r"[0-9a-z]+")
+
+TEXT_INDEXES_QUERY = """
+SELECT Index_Name, Status, Domidx_Opstatus
+FROM User_Indexes
+WHERE Ityp_Owner = 'CTXSYS' AND Ityp_Name = 'CONTEXT'
+"""
+
+# Oracle Text ranking queries: each returns (key, score) for the rows whose
+# field matches :text_query
+ORACLE_RANK_QUERIES = {
+    "title": "SELECT ISBN, SCORE(1) FROM Books WHERE CONTAINS(Title, :text_query, 1) > 0",
+    "publisher": "SELECT ISBN, SCORE(1) FROM Books WHERE CONTAINS(Publisher, :text_query, 1) > 0",
+    "author": """
+        SELECT BA.ISBN, MAX(SCORE(1))
+        FROM Authors A
+        JOIN BookAuthor BA ON A.Author_ID = BA.Author_ID
+        WHERE CONTAINS(A.Name, :text_query, 1) > 0
+        GROUP BY BA.ISBN
+    """,
+    "genre": """
+        SELECT BG.ISBN, MAX(SCORE(1))
+        FROM Genres G
+        JOIN BookGenre BG ON G.Genre_ID = BG.Genre_ID
+        WHERE CONTAINS(G.Title, :text_query, 1) > 0
+        GROUP BY BG.ISBN
+    """,
+    "author_name": "SELECT Author_ID, SCORE(1) FROM Authors WHERE CONTAINS(Name, :text_query, 1) > 0",
+}
+
+# Fallback index sources: field -> (query for every document, query for one
+# key). Each returns (key, text) rows; several rows per key are joined.
+FALLBACK_SOURCES = {
+    "title": ("SELECT ISBN, Title FROM Books",
+              "SELECT ISBN, Title FROM Books WHERE ISBN = :key"),
+    "publisher": ("SELECT ISBN, Publisher FROM Books",
+                  "SELECT ISBN, Publisher FROM Books WHERE ISBN = :key"),
+    "author": ("SELECT BA.ISBN, A.Name FROM BookAuthor BA JOIN Authors A ON BA.Author_ID = A.Author_ID",
+               "SELECT BA.ISBN, A.Name FROM BookAuthor BA JOIN Authors A ON BA.Author_ID = A.Author_ID "
+               "WHERE BA.ISBN = :key"),
+    "genre": ("SELECT BG.ISBN, G.Title FROM BookGenre BG JOIN Genres G ON BG.Genre_ID = G.Genre_ID",
+              "SELECT BG.ISBN, G.Title FROM BookGenre BG JOIN Genres G ON BG.Genre_ID = G.Genre_ID "
+              "WHERE BG.ISBN = :key"),
+    "author_name": ("SELECT Author_ID, Name FROM Authors",
+                    "SELECT Author_ID, Name FROM Authors WHERE Author_ID = :key"),
+}
+
+# Books whose author or genre field mentions an author / genre
+AUTHOR_BOOKS_QUERY = "SELECT ISBN FROM BookAuthor WHERE Author_ID = :author_id"
+GENRE_BOOKS_QUERY = "SELECT ISBN FROM BookGenre WHERE Genre_ID = :genre_id"
+
+# Oracle Text operator names; a search word spelled like one is escaped in braces
+ORACLE_TEXT_RESERVED = {
+    "about", "accum", "and", "bt", "btg", "bti", "btp", "equiv", "fuzzy", "haspath", "inpath", "mdata",
+    "minus", "near", "not", "nt", "ntg", "nti", "ntp", "or", "pt", "rt", "sqe", "syn", "tr", "trsyn", "tt",
+    "within",
+}
+
+# Book fields the book-level hooks refresh
+BOOK_FIELDS = ["title", "publisher", "author", "genre"]
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+class InvertedIndex:
+    """
+    In-memory inverted index with BM25 ranking. Every query term matches
+    the indexed tokens it is a prefix of, and a document must match all
+    terms.
+    """
+
+    def __init__(self):
+        self.postings = {}      # token -> {key: term frequency}
+        self.documents = {}     # key -> (token count, set of tokens)
+        self.total_tokens = 0
+        self._vocabulary = None  # Sorted tokens, rebuilt after changes
+
+    def add(self, key, text):
+        self.remove(key)
+        tokens = tokenize(text)
+        if not tokens:
+            return
+        counts = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        for token, count in counts.items():
+            self.postings.setdefault(token, {})[key] = count
+        self.documents[key] = (len(tokens), set(counts))
+        self.total_tokens += len(tokens)
+        self._vocabulary = None
+
+    def remove(self, key):
+        document = self.documents.pop(key, None)
+        if document is None:
+            return
+        length, tokens = document
+        for token in tokens:
+            postings = self.postings[token]
+            del postings[key]
+            if not postings:
+                del self.postings[token]
+        self.total_tokens -= length
+        self._vocabulary = None
+
+    def expand(self, term):
+        """
+        Returns the indexed tokens starting with `term`.
+        """
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings)
+        start = bisect.bisect_left(self._vocabulary, term)
+        end = bisect.bisect_left(self._vocabulary, term + "\uffff")
+        return self._vocabulary[start:end]
+
+    def search(self, text):
+        """
+        Returns {key: BM25 score} for the documents matching every term of
+        `text`.
+        """
+        terms = tokenize(text)
+        if not terms or not self.documents:
+            return {}
+        count = len(self.documents)
+        average = self.total_tokens / count
+        result = None
+        for term in terms:
+            scores = {}
+            for token in self.expand(term):
+                postings = self.postings[token]
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for key, frequency in postings.items():
+                    length = self.documents[key][0]
+                    weight = idf * frequency * (BM25_K1 + 1) / (
+                        frequency + BM25_K1 * (1 - BM25_B + BM25_B * length / average))
+                    scores[key] = max(scores.get(key, 0.0), weight)
+            if result is None:
+                result = scores
+            else:
+                result = {key: score + scores[key] for key, score in result.items() if key in scores}
+            if not result:
+                return {}
+        return result
+
+
+# Existing CONTEXT indexes and when they were read
+_presence = {"names": set(), "checked": None}
+
+# Fallback indexes by field and when they were built
+_fallback = {"indexes": None, "built": None}
+_fallback_lock = threading.Lock()
+
+
+def forget_presence():
+    """
+    Makes the next search re-check which Oracle Text indexes exist.
+    """
+    _presence["checked"] = None
+
+
+def present_text_indexes(connection):
+    if isinstance(connection, sqlite3.Connection):
+        return set()  # The benchmark stand-in has no Oracle Text
+    checked = _presence["checked"]
+    if checked is None or time.monotonic() - checked > PRESENCE_TTL:
+        try:
+            rows = executor_module.fetch_all(connection, TEXT_INDEXES_QUERY)
+            _presence["names"] = {row[0] for row in rows if row[1] == "VALID" and row[2] != "FAILED"}
+        except cx_Oracle.DatabaseError:
+            _presence["names"] = set()
+        _presence["checked"] = time.monotonic()
+    return _presence["names"]
+
+
+def engine(connection):
+    """
+    Returns "oracle" when every Oracle Text index exists, otherwise "python"
+    (the in-process inverted index).
+    """
+    return "oracle" if set(TEXT_INDEXES.values()) <= present_text_indexes(connection) else "python"
+
+
+def oracle_text_query(text):
+    """
+    Turns free text into an Oracle Text query: every word as a prefix
+    (word%), all words required. Only letters and digits are kept, and a
+    word that is an operator name ("and", "not", "near", ...) is matched
+    literally as {word}, so user input cannot inject Oracle Text operators.
+    """
+    return " AND ".join(f"{{{token}}}" if token in ORACLE_TEXT_RESERVED else f"{token}%" for token in tokenize(text))
+
+
+def _read_documents(connection, sql, params=None):
+    texts = {}
+    for key, text in executor_module.fetch_all(connection, sql, params):
+        if text:
+            texts.setdefault(key, []).append(text)
+    return {key: " ".join(parts) for key, parts in texts.items()}
+
+
+def _fallback_indexes(connection):
+    """
+    Returns the fallback indexes by field, building them on first use and
+    after FALLBACK_TTL seconds.
+    """
+    with _fallback_lock:
+        built = _fallback["built"]
+        if _fallback["indexes"] is None or time.monotonic() - built > FALLBACK_TTL:
+            indexes = {}
+            for field, (all_sql, one_sql) in FALLBACK_SOURCES.items():
+                index = InvertedIndex()
+                for key, text in _read_documents(connection, all_sql).items():
+                    index.add(key, text)
+                indexes[field] = index
+            _fallback["indexes"] = indexes
+            _fallback["built"] = time.monotonic()
+        return _fallback["indexes"]
+
+
+def forget_fallback():
+    """
+    Drops the fallback indexes; the next search rebuilds them.
+    """
+    with _fallback_lock:
+        _fallback["indexes"] = None
+
+
+def rebuild_fallback(connection):
+    forget_fallback()
+    _fallback_indexes(connection)
+
+
+def _rank(connection, filters):
+    """
+    Ranks keys matching every (field, text) of `filters`. Returns
+    [(key, score)] best first, ties broken by key.
+    """
+    filters = {field: text for field, text in filters.items() if tokenize(text)}
+    if not filters:
+        return None
+    result = None
+    if engine(connection) == "oracle":
+        for field, text in filters.items():
+            rows = executor_module.fetch_all(connection, ORACLE_RANK_QUERIES[field],
+                                             text_query=oracle_text_query(text))
+            scores = {key: float(score) for key, score in rows}
+            result = scores if result is None else {k: s + scores[k] for k, s in result.items() if k in scores}
+    else:
+        indexes = _fallback_indexes(connection)
+        with _fallback_lock:
+            for field, text in filters.items():
+                scores = indexes[field].search(text)
+                result = scores if result is None else {k: s + scores[k] for k, s in result.items() if k in scores}
+    return sorted(result.items(), key=lambda item: (-item[1], item[0]))
+
+
+def rank_books(connection, title=None, author=None, genre=None, publisher=None):
+    """
+    Returns [(ISBN, relevance)] for the books matching every given text
+    filter, most relevant first, or None when no text filter was given.
+    """
+    return _rank(connection, {"title": title, "author": author, "genre": genre, "publisher": publisher})
+
+
+def rank_authors(connection, name=None):
+    """
+    Returns [(Author_ID, relevance)] for the authors whose name matches,
+    most relevant first, or None when no name was given.
+    """
+    return _rank(connection, {"author_name": name})
+
+
+def sync_oracle(connection, fields):
+    cursor = connection.cursor()
+    try:
+        for field in fields:
+            cursor.execute("BEGIN CTX_DDL.SYNC_INDEX(:name); END;", name=TEXT_INDEXES[field])
+    finally:
+        cursor.close()
+
+
+def _refresh_fallback(connection, field, keys):
+    indexes = _fallback["indexes"]
+    if indexes is None:
+        return  # Built from scratch on the next search
+    one_sql = FALLBACK_SOURCES[field][1]
+    for key in keys:
+        documents = _read_documents(connection, one_sql, {"key": key})
+        with _fallback_lock:
+            if key in documents:
+                indexes[field].add(key, documents[key])
+            else:
+                indexes[field].remove(key)
+
+
+def book_changed(connection, isbn):
+    """
+    Brings the text indexes up to date after a book, or its author or genre
+    links, was added, updated or deleted (call after the commit).
+    """
+    try:
+        if engine(connection) == "oracle":
+            sync_oracle(connection, ["title", "publisher"])
+        else:
+            for field in BOOK_FIELDS:
+                _refresh_fallback(connection, field, [isbn])
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        console.print(f"[yellow]Text index not synchronized: {error.message}[/yellow]")
+
+
+def linked_books(connection, query, **params):
+    return [row[0] for row in executor_module.fetch_all(connection, query, params)]
+
+
+def author_changed(connection, author_id, isbns=None):
+    """
+    Brings the text indexes up to date after an author was added, renamed
+    or deleted (call after the commit). A delete removes the author's
+    BookAuthor rows, so pass the ISBNs it had, read before the delete.
+    """
+    try:
+        if engine(connection) == "oracle":
+            sync_oracle(connection, ["author"])
+        else:
+            _refresh_fallback(connection, "author_name", [author_id])
+            if isbns is None:
+                isbns = linked_books(connection, AUTHOR_BOOKS_QUERY, author_id=author_id)
+            _refresh_fallback(connection, "author", isbns)
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        console.print(f"[yellow]Text index not synchronized: {error.message}[/yellow]")
+
+
+def genre_changed(connection, genre_id, isbns=None):
+    """
+    Brings the text indexes up to date after a genre was added, renamed or
+    deleted (call after the commit). As with author_changed, a delete passes
+    the ISBNs the genre had.
+    """
+    try:
+        if engine(connection) == "oracle":
+            sync_oracle(connection, ["genre"])
+        else:
+            if isbns is None:
+                isbns = linked_books(connection, GENRE_BOOKS_QUERY, genre_id=genre_id)
+            _refresh_fallback(connection, "genre", isbns)
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        console.print(f"[yellow]Text index not synchronized: {error.message}[/yellow]")
+
+
+def data_reloaded(connection):
+    """
+    Brings the text indexes up to date after a script, bulk load or reset
+    changed data outside the add/update/delete menus.
+    """
+    forget_fallback()
+    forget_presence()
+    try:
+        if engine(connection) == "oracle":
+            sync_oracle(connection, TEXT_INDEXES)
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        console.print(f"[yellow]Text index not synchronized: {error.message}[/yellow]")
+
+
+def text_index_status(connection):
+    """
+    Returns (field, index name, status) for each Oracle Text index, with
+    status None when the index does not exist.
+    """
+    rows = {row[0]: f"{row[1]} / {row[2]}" for row in executor_module.fetch_all(connection, TEXT_INDEXES_QUERY)}
+    return [(field, name, rows.get(name)) for field, name in TEXT_INDEXES.items()]
+
+
+def show_text_index_status(connection):
+    table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
+    for col in ["Field", "Oracle Text Index", "Status"]:
+        table.add_column(col)
+    for field, name, status in text_index_status(connection):
+        table.add_row(field, name, status or "[yellow]missing[/yellow]")
+    console.print(table)
+    if engine(connection) == "oracle":
+        console.print("Searches use Oracle Text.")
+    else:
+        indexes = _fallback["indexes"]
+        built = "not built yet" if indexes is None else \
+            ", ".join(f"{field}: {len(index.documents)} documents" for field, index in indexes.items())
+        console.print(f"Searches use the in-process index ({built}).")
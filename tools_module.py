@@ -0,0 +1,354 @@
+# tools_module.py
+
+import os
+import sys
+import cx_Oracle
+import pool_module
+import executor_module
+import loader_module
+import datagen_module
+import search_module
+import script_module
+import mview_module
+import cache_module
+import index_module
+import partition_module
+import text_module
+import circulation_module
+import id_module
+from rich.console import Console
+from rich.prompt import Prompt, IntPrompt
+from rich import box
+from rich.panel import Panel
+
+# Initialize Rich Console
+console = Console()
+
+
+def show_statement_cache_stats(connection):
+    """
+    Shows cursor cache hits/misses and the session's parse counts.
+    """
+    console.print("[bold underline]Statement Cache Statistics[/bold underline]")
+    executor_module.show_cache_stats(connection)
+
+
+def bulk_load_script(connection):
+    """
+    Loads a data script in foreign key order, loading the tables of each tier
+    in parallel on separate pooled sessions.
+    """
+    console.print("[bold underline]Bulk Load Data Script[/bold underline]")
+    file_path = Prompt.ask("Enter the data script to load", default="insert_sample_data.sql")
+    if not os.path.isfile(file_path):
+        console.print(f"[red]File '{file_path}' not found.[/red]")
+        return
+    batch_size = IntPrompt.ask("Rows per batch", default=loader_module.BATCH_SIZE)
+    try:
+        report, timings, seconds = loader_module.bulk_load(connection, file_path, max(1, batch_size))
+        cache_module.invalidate_all()
+        text_module.data_reloaded(connection)
+        id_module.forget_synced()
+        loader_module.show_bulk_report(report, timings, seconds)
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        console.print(f"[red]Bulk load failed: {error.message}[/red]")
+
+
+def generate_data(connection):
+    """
+    Generates a reproducible synthetic data set and streams it into the
+    database or into CSV files.
+    """
+    console.print("[bold underline]Generate Synthetic Data[/bold underline]")
+    scale = {}
+    for name, default in datagen_module.DEFAULT_SCALE.items():
+        scale[name] = IntPrompt.ask(f"Number of {name}", default=default)
+    seed = IntPrompt.ask("Random seed", default=42)
+    target = Prompt.ask("Load into the \\[d]atabase or write \\[c]SV files?", choices=['d', 'c'], default='d')
+    try:
+        if target == 'c':
+            directory = Prompt.ask("Output directory", default="generated_data")
+            counts = datagen_module.write_csv(directory, seed=seed, **scale)
+            for table, count in counts.items():
+                console.print(f"{table}: {count} rows written to {os.path.join(directory, table + '.csv')}")
+        else:
+            report = datagen_module.load(connection, seed=seed, **scale)
+            cache_module.invalidate_all()
+            text_module.data_reloaded(connection)
+            id_module.forget_synced()
+            loader_module.show_load_report(report)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        console.print(f"[red]Data generation failed: {error.message}[/red]")
+
+
+def output_settings(connection):
+    """
+    Changes how query results are fetched and rendered.
+    """
+    console.print("[bold underline]Result Output Settings[/bold underline]")
+    settings = executor_module.output_settings
+    settings["arraysize"] = max(1, IntPrompt.ask("Rows fetched per round trip (arraysize)", default=settings["arraysize"]))
+    settings["page_size"] = max(1, IntPrompt.ask("Rows per rendered page", default=settings["page_size"]))
+    settings["max_rows"] = max(0, IntPrompt.ask("Row cap (0 for no cap)", default=settings["max_rows"]))
+    settings["mode"] = Prompt.ask("Output mode", choices=["table", "tsv"], default=settings["mode"])
+    search_module.PAGE_SIZE = max(1, IntPrompt.ask("Search results per page", default=search_module.PAGE_SIZE))
+    console.print("[green]Output settings updated.[/green]")
+
+
+def report_cache_settings(connection):
+    """
+    Shows report result cache statistics and lets the user resize or clear it.
+    """
+    console.print("[bold underline]Report Cache[/bold underline]")
+    cache_module.show_cache_stats()
+    cache = cache_module.report_cache
+    cache.size = max(0, IntPrompt.ask("Cached results to keep (0 disables caching)", default=cache.size))
+    cache.ttl = max(0, IntPrompt.ask("Seconds a cached result stays valid", default=cache.ttl))
+    if Prompt.ask("Clear the cache now? (y/n)", default="n").lower() == 'y' or cache.size == 0:
+        cache_module.invalidate_all()
+    console.print("[green]Report cache settings updated.[/green]")
+
+
+def refresh_materialized_views(connection):
+    """
+    Shows how stale the reporting materialized views are and refreshes them.
+    """
+    console.print("[bold underline]Materialized View Status[/bold underline]")
+    try:
+        if not mview_module.mview_status(connection):
+            console.print("[yellow]No reporting materialized views found. Build them with option 5 (Create Views).[/yellow]")
+            return
+        mview_module.show_mview_status(connection)
+        if Prompt.ask("Refresh them now? (y/n)", default="y").lower() == 'y':
+            results = mview_module.refresh_mviews(connection)
+            cache_module.invalidate_all()
+            mview_module.show_refresh_report(results)
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        console.print(f"[red]Could not read materialized view status: {error.message}[/red]")
+
+
+def index_advisor(connection):
+    """
+    Shows which join and filter columns of the reports, searches and delete
+    paths lack an index, and compares plans and timings with and without the
+    proposed indexes on the data currently loaded (for example data from
+    option 3).
+    """
+    console.print("[bold underline]Index Advisor[/bold underline]")
+    try:
+        usage, indexes, advice = index_module.analyze(connection)
+        index_module.show_advice(advice)
+        proposed = index_module.proposals(usage, indexes)
+        if proposed:
+            for name, stmt in proposed:
+                console.print(f"Proposed: {' '.join(stmt.split())}")
+            if Prompt.ask(f"Create these {len(proposed)} indexes and compare plans and timings? (y/n)", default="n").lower() != 'y':
+                return
+            cases = index_module.timing_cases(connection)
+            index_module.gather_stats(connection, {t for t, c in usage})
+            before = index_module.measure(connection, cases)
+            index_module.show_statement_results(index_module.run_statements(connection, [stmt for name, stmt in proposed]))
+            after = index_module.measure(connection, cases)
+        else:
+            console.print("[green]Every join and filter column is covered by an index.[/green]")
+            if Prompt.ask("Compare plans and timings with the managed indexes dropped? (y/n)", default="n").lower() != 'y':
+                return
+            cases = index_module.timing_cases(connection)
+            index_module.gather_stats(connection, {t for t, c in usage})
+            after = index_module.measure(connection, cases)
+            index_module.run_statements(connection, list(script_module.read_statements(index_module.DROP_SCRIPT)))
+            try:
+                before = index_module.measure(connection, cases)
+            finally:
+                create = [stmt for name, table, columns, stmt in index_module.script_indexes()]
+                index_module.show_statement_results(index_module.run_statements(connection, create))
+        index_module.show_comparison(before, after)
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        console.print(f"[red]Index advisor failed: {error.message}[/red]")
+
+
+def partition_loans(connection):
+    """
+    Shows how Loans is partitioned and converts an unpartitioned Loans table
+    to monthly interval partitions online.
+    """
+    console.print("[bold underline]Loans Partitioning[/bold underline]")
+    try:
+        partitioning = partition_module.loans_partitioning(connection)
+        if partitioning is not None:
+            kind, interval, partitions = partitioning
+            console.print(f"Loans is {kind} partitioned (interval {interval}) with {partitions} partitions.")
+            return
+        console.print("Loans is not partitioned.")
+        if Prompt.ask("Migrate it to monthly partitions on Loan_Date now? (y/n)", default="n").lower() != 'y':
+            return
+        steps = partition_module.migrate_loans(connection)
+        cache_module.invalidate("LOANS")
+        partition_module.show_migration_report(steps)
+        if Prompt.ask(f"Drop the original table {partition_module.OLD_TABLE}? (y/n)", default="n").lower() == 'y':
+            executor_module.execute(connection, f"DROP TABLE {partition_module.OLD_TABLE} PURGE")
+            console.print(f"[green]{partition_module.OLD_TABLE} dropped.[/green]")
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        console.print(f"[red]Loans migration failed: {error.message}[/red]")
+
+
+def text_search_indexes(connection):
+    """
+    Shows which text search engine the book and author searches use and
+    creates, drops or rebuilds the text indexes.
+    """
+    console.print("[bold underline]Text Search Indexes[/bold underline]")
+    try:
+        text_module.show_text_index_status(connection)
+        action = Prompt.ask("\\[c]reate Oracle Text indexes, \\[d]rop them, \\[r]ebuild the in-process index or \\[b]ack",
+                            choices=['c', 'd', 'r', 'b'], default='b')
+        if action == 'c':
+            statements = list(script_module.read_statements(text_module.CREATE_SCRIPT))
+            index_module.show_statement_results(index_module.run_statements(connection, statements))
+        elif action == 'd':
+            statements = list(script_module.read_statements(text_module.DROP_SCRIPT))
+            index_module.show_statement_results(index_module.run_statements(connection, statements))
+        elif action == 'r':
+            text_module.rebuild_fallback(connection)
+        if action != 'b':
+            text_module.forget_presence()
+            text_module.show_text_index_status(connection)
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        console.print(f"[red]Could not read text index status: {error.message}[/red]")
+
+
+def checkout_stress_test(connection):
+    """
+    Races concurrent checkouts of a scratch book across many sessions and
+    checks that it was never oversold.
+    """
+    console.print("[bold underline]Checkout Stress Test[/bold underline]")
+    copies = max(1, IntPrompt.ask("Copies of the scratch book", default=circulation_module.STRESS_COPIES))
+    attempts = max(1, IntPrompt.ask("Checkout attempts", default=circulation_module.STRESS_ATTEMPTS))
+    workers = max(1, IntPrompt.ask("Concurrent sessions", default=circulation_module.STRESS_WORKERS))
+    try:
+        outcomes, checks, seconds = circulation_module.stress_checkout(connection, copies, attempts, workers)
+        circulation_module.show_stress_report(outcomes, checks, seconds)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        console.print(f"[red]Stress test failed: {error.message}[/red]")
+
+
+def bulk_returns(connection):
+    """
+    Returns the loans behind a stream of scanned ISBNs or loan numbers, from
+    a file or typed/scanned at the terminal, in array-bound batches.
+    """
+    console.print("[bold underline]Bulk Returns[/bold underline]")
+    kind = Prompt.ask("Scanning \\[i]SBNs or \\[l]oan numbers?", choices=['i', 'l'], default='i')
+    file_path = Prompt.ask("File of codes (leave blank to scan at the terminal)", default="")
+    batch_size = max(1, IntPrompt.ask("Returns per batch", default=circulation_module.RETURN_BATCH_SIZE))
+    kind = "isbn" if kind == 'i' else "loan"
+
+    def progress(report):
+        console.print(f"{report['returned']} returned in {report['seconds']:.2f}s "
+                      f"({report['returned'] / max(report['seconds'], 1e-9):.0f}/s)")
+
+    try:
+        if file_path:
+            if not os.path.isfile(file_path):
+                console.print(f"[red]File '{file_path}' not found.[/red]")
+                return
+            with open(file_path) as lines:
+                report = circulation_module.bulk_return(connection, circulation_module.scanned_codes(lines, False),
+                                                        kind, batch_size, progress)
+        else:
+            console.print("Scan or paste codes; an empty line finishes.")
+            report = circulation_module.bulk_return(connection, circulation_module.scanned_codes(sys.stdin),
+                                                    kind, batch_size, progress)
+        circulation_module.show_return_report(report)
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        console.print(f"[red]Bulk returns stopped: {error.message}. Earlier batches were committed.[/red]")
+
+
+def tools_operations(connection):
+    """
+    Displays the performance and bulk tools menu and handles user input.
+    """
+    while True:
+        tools_menu = Panel(
+            "\n".join([
+                "Performance & Bulk Tools",
+                "----------------------------------------",
+                "1. Statement Cache Statistics",
+                "2. Bulk Load Data Script (FK-Ordered, Parallel)",
+                "3. Generate Synthetic Data",
+                "4. Result Output Settings",
+                "5. Materialized View Status & Refresh",
+                "6. Report Cache Statistics & Settings",
+                "7. Index Advisor",
+                "8. Partition Loans by Loan_Date (Online Migration)",
+                "9. Text Search Indexes",
+                "10. Checkout Stress Test (Concurrent Desks)",
+                "11. Bulk Returns (Scanner / File)",
+                "12. Back to Main Menu",
+                "----------------------------------------"
+            ]),
+            title="Tools Menu",
+            subtitle="Choose an option [1-12]",
+            style="bold cyan",
+            box=box.DOUBLE_EDGE
+        )
+        console.print(tools_menu)
+        try:
+            choice = IntPrompt.ask("Your choice", default=12)
+        except Exception:
+            console.print("[red]Invalid input. Please enter a number between 1 and 12.[/red]")
+            continue
+
+        console.print("\n")
+        if choice == 1:
+            show_statement_cache_stats(connection)
+        elif choice == 2:
+            bulk_load_script(connection)
+        elif choice == 3:
+            generate_data(connection)
+        elif choice == 4:
+            output_settings(connection)
+        elif choice == 5:
+            refresh_materialized_views(connection)
+        elif choice == 6:
+            report_cache_settings(connection)
+        elif choice == 7:
+            index_advisor(connection)
+        elif choice == 8:
+            partition_loans(connection)
+        elif choice == 9:
+            text_search_indexes(connection)
+        elif choice == 10:
+            checkout_stress_test(connection)
+        elif choice == 11:
+            bulk_returns(connection)
+        elif choice == 12:
+            break
+        else:
+            console.print("[red]Invalid option. Please try again.[/red]")
+
+        pool_module.release_session(connection)
+        pause()
+
+
+def pause():
+    """
+    Pauses the program until the user presses Enter.
+    """
+    console.print("\nPress [bold cyan]Enter[/bold cyan] to continue...")
+    input()
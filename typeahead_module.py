@@ -0,0 +1,251 @@
+# typeahead_module.py
+
+import bisect
+import re
+import sqlite3
+import threading
+import time
+import cx_Oracle
+from rich.console import Console
+from rich.table import Table
+from rich import box
+
+import executor_module
+
+# Initialize Rich Console
+console = Console()
+
+# Suggestion sources: field -> (table, key column, text column). Publishers
+# are keyed by their own text so each one is suggested once.
+SOURCES = {
+    "title": ("Books", "ISBN", "Title"),
+    "author": ("Authors", "Author_ID", "Name"),
+    "genre": ("Genres", "Genre_ID", "Title"),
+    "publisher": ("Books", "Publisher", "Publisher"),
+}
+
+# Seconds between delta refreshes; lookups in between are served from memory only
+REFRESH_INTERVAL = 30
+
+# Suggestions returned per field
+MAX_SUGGESTIONS = 10
+
+# Change marker column: the SCN of each row's block in Oracle. The SQLite
+# benchmark stand-in has no SCN, so its rowid picks up appended rows only.
+ORACLE_MARKER = "ORA_ROWSCN"
+SQLITE_MARKER = "rowid"
+
+WORD_PATTERN = re.compile(r"[0-9a-z]+")
+
+
+def normalize(text):
+    return " ".join(WORD_PATTERN.findall(text.lower())) if text else ""
+
+
+def terms(text):
+    """
+    Returns the strings a text is found under: the normalized text from the
+    start of each of its words, so "the gl" and "glass sh" both find
+    "The Glass Shadow".
+    """
+    words = normalize(text).split()
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+
+class PrefixIndex:
+    """
+    Sorted list of (term, key) pairs answering prefix lookups with bisect.
+    """
+
+    def __init__(self):
+        self.entries = []   # Sorted (term, key)
+        self.texts = {}     # key -> display text
+
+    def load(self, rows):
+        self.texts = {key: text for key, text in rows if text}
+        self.entries = sorted((term, key) for key, text in self.texts.items() for term in terms(text))
+
+    def add(self, key, text):
+        self.remove(key)
+        if not text:
+            return
+        self.texts[key] = text
+        for term in terms(text):
+            bisect.insort(self.entries, (term, key))
+
+    def remove(self, key):
+        text = self.texts.pop(key, None)
+        if text is None:
+            return
+        for term in terms(text):
+            position = bisect.bisect_left(self.entries, (term, key))
+            if position < len(self.entries) and self.entries[position] == (term, key):
+                del self.entries[position]
+
+    def search(self, prefix, limit=MAX_SUGGESTIONS):
+        """
+        Returns up to `limit` (key, text) pairs with a term starting with
+        `prefix`, in term order.
+        """
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        found = {}
+        position = bisect.bisect_left(self.entries, (prefix,))
+        while position < len(self.entries) and len(found) < limit:
+            term, key = self.entries[position]
+            if not term.startswith(prefix):
+                break
+            found.setdefault(key, self.texts[key])
+            position += 1
+        return list(found.items())
+
+    def __len__(self):
+        return len(self.texts)
+
+
+class Typeahead:
+    """
+    One PrefixIndex per field, loaded once and then kept current from the
+    rows whose change marker moved past the highest one already read. Rows
+    are only ever added or replaced by a delta, so an index holding more
+    keys than its table has missed deletes; only then is the key list read
+    to drop them.
+    """
+
+    def __init__(self):
+        self.indexes = None
+        self.marks = {}         # field -> highest change marker read
+        self.refreshed = None
+        self.version = 0        # Bumped whenever an index changes
+        self.stats = {"loads": 0, "refreshes": 0, "changed": 0, "removed": 0}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _marker(connection):
+        return SQLITE_MARKER if isinstance(connection, sqlite3.Connection) else ORACLE_MARKER
+
+    def _rows(self, connection, field, since=None):
+        table, key, text = SOURCES[field]
+        sql = f"SELECT {key}, {text}, {self._marker(connection)} FROM {table} WHERE {text} IS NOT NULL"
+        if since is None:
+            rows = executor_module.fetch_all(connection, sql)
+        else:
+            rows = executor_module.fetch_all(connection, f"{sql} AND {self._marker(connection)} > :since",
+                                             since=since)
+        if rows:
+            self.marks[field] = max(self.marks.get(field) or 0, max(row[2] for row in rows))
+        return [(row[0], row[1]) for row in rows]
+
+    def load(self, connection):
+        """
+        Reads every field from scratch. Returns the seconds taken.
+        """
+        started = time.perf_counter()
+        with self._lock:
+            indexes = {}
+            self.marks = {}
+            for field in SOURCES:
+                index = PrefixIndex()
+                index.load(self._rows(connection, field))
+                indexes[field] = index
+            self.indexes = indexes
+            self.version += 1
+            self.refreshed = time.monotonic()
+            self.stats["loads"] += 1
+        return time.perf_counter() - started
+
+    def refresh(self, connection):
+        """
+        Applies the rows changed since the last load or refresh, and drops
+        deleted keys. Returns (rows changed, keys removed).
+        """
+        changed = removed = 0
+        with self._lock:
+            for field, index in self.indexes.items():
+                table, key, text = SOURCES[field]
+                for row_key, row_text in self._rows(connection, field, self.marks.get(field) or 0):
+                    index.add(row_key, row_text)
+                    changed += 1
+                count = executor_module.fetch_one(
+                    connection, f"SELECT COUNT(DISTINCT {key}) FROM {table} WHERE {text} IS NOT NULL")[0]
+                if count != len(index):
+                    live = {row[0] for row in executor_module.fetch_all(
+                        connection, f"SELECT DISTINCT {key} FROM {table} WHERE {text} IS NOT NULL")}
+                    for stale in [k for k in index.texts if k not in live]:
+                        index.remove(stale)
+                        removed += 1
+            if changed or removed:
+                self.version += 1
+            self.refreshed = time.monotonic()
+            self.stats["refreshes"] += 1
+            self.stats["changed"] += changed
+            self.stats["removed"] += removed
+        return changed, removed
+
+    def current(self, connection):
+        """
+        Loads the indexes on first use and refreshes them when the last
+        refresh is more than REFRESH_INTERVAL seconds old.
+        """
+        if self.indexes is None:
+            self.load(connection)
+        elif time.monotonic() - self.refreshed > REFRESH_INTERVAL:
+            self.refresh(connection)
+
+    def texts(self, field):
+        """
+        Returns a copy of {key: text} for `field`; call current() first.
+        """
+        with self._lock:
+            return dict(self.indexes[field].texts)
+
+    def suggest(self, prefix, fields=None, limit=MAX_SUGGESTIONS):
+        """
+        Returns {field: [(key, text)]} for the prefix from memory; call
+        current() first.
+        """
+        with self._lock:
+            return {field: self.indexes[field].search(prefix, limit) for field in (fields or SOURCES)}
+
+
+# Shared by every menu of this process
+typeahead = Typeahead()
+
+
+def load_at_startup(connection):
+    """
+    Loads the typeahead indexes; a failure only leaves typeahead to load on
+    first use.
+    """
+    try:
+        seconds = typeahead.load(connection)
+        entries = sum(len(index) for index in typeahead.indexes.values())
+        console.print(f"[green]Typeahead index loaded: {entries} entries in {seconds:.2f}s.[/green]")
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        console.print(f"[yellow]Typeahead index not loaded: {error.message}[/yellow]")
+
+
+def show_suggestions(suggestions, seconds):
+    table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
+    for col in ["Field", "Key", "Text"]:
+        table.add_column(col)
+    for field, matches in suggestions.items():
+        for key, text in matches:
+            table.add_row(field, "" if key == text else str(key), text)
+    console.print(table)
+    console.print(f"{sum(len(m) for m in suggestions.values())} suggestions in {seconds * 1e6:.0f} µs.")
+
+
+def show_typeahead_stats():
+    indexes = typeahead.indexes or {}
+    table = Table(show_header=True, header_style="bold magenta", box=box.MINIMAL_DOUBLE_HEAD)
+    for col in ["Field", "Keys", "Terms", "Change Marker"]:
+        table.add_column(col)
+    for field, index in indexes.items():
+        table.add_row(field, str(len(index)), str(len(index.entries)), str(typeahead.marks.get(field, "-")))
+    console.print(table)
+    stats = typeahead.stats
+    console.print(f"{stats['loads']} loads, {stats['refreshes']} delta refreshes "
+                  f"({stats['changed']} rows applied, {stats['removed']} keys removed).")
@@ -0,0 +1,117 @@
+# validation_module.py
+
+import re
+import threading
+import time
+import cx_Oracle
+
+import catalog_module
+import executor_module
+
+# Oracle error codes translated by describe_error
+UNIQUE_VIOLATED = 1          # ORA-00001
+PARENT_KEY_MISSING = 2291    # ORA-02291
+CHILD_RECORD_FOUND = 2292    # ORA-02292
+
+# "(OWNER.CONSTRAINT_NAME)" in a constraint violation message
+CONSTRAINT_PATTERN = re.compile(r"\(\s*[\w$#]+\.([\w$#]+)\s*\)")
+
+# Table names that str.title() would get wrong
+TABLE_LABELS = {"BOOKAUTHOR": "BookAuthor", "BOOKGENRE": "BookGenre"}
+
+# Column name parts kept upper case in messages
+ACRONYMS = {"ID", "ISBN", "ZIP"}
+
+# Seconds the constraint definitions are trusted before they are re-read
+CONSTRAINTS_TTL = 600
+
+# Constraint definitions and when they were read
+_constraints = {"definitions": None, "read": None}
+_constraints_lock = threading.Lock()
+
+
+def exists_column(query):
+    """
+    Returns a select-list expression that is 1 when `query` finds a row, else 0.
+    """
+    return f"CASE WHEN EXISTS ({query}) THEN 1 ELSE 0 END"
+
+
+def check(connection, rules, extra=(), **params):
+    """
+    Evaluates every rule, and selects every `extra` scalar subquery, in a
+    single query, so a form with several keys costs one round trip.
+
+    rules is a list of (message, query, should_exist): the message is
+    reported when `query` (an existence check such as "SELECT * FROM Books
+    WHERE ISBN = :isbn") finds a row and should_exist is False, or finds
+    none and should_exist is True. All subqueries share the bind variables
+    in `params`.
+
+    Returns (messages of the failed rules, [values of the extra subqueries]).
+    """
+    columns = [exists_column(query) for message, query, should_exist in rules]
+    columns.extend(extra)
+    row = executor_module.fetch_one(connection, f"SELECT {', '.join(columns)} FROM DUAL", params)
+    problems = [message for (message, query, should_exist), found in zip(rules, row) if bool(found) != should_exist]
+    return problems, list(row[len(rules):])
+
+
+def _definitions(connection):
+    with _constraints_lock:
+        read = _constraints["read"]
+        if _constraints["definitions"] is None or time.monotonic() - read > CONSTRAINTS_TTL:
+            _constraints["definitions"] = catalog_module.constraint_columns(connection)
+            _constraints["read"] = time.monotonic()
+        return _constraints["definitions"]
+
+
+def forget_constraints():
+    """
+    Makes the next describe_error re-read the constraint definitions, after
+    constraints were added, dropped or renamed.
+    """
+    with _constraints_lock:
+        _constraints["definitions"] = None
+
+
+def table_label(table):
+    return TABLE_LABELS.get(table.upper(), table.title())
+
+
+def column_label(column):
+    return " ".join(part if part in ACRONYMS else part.title() for part in column.upper().split("_"))
+
+
+def _describe_columns(columns, params):
+    lowered = {name.lower(): value for name, value in (params or {}).items()}
+    parts = []
+    for column in columns:
+        name = column_label(column)
+        value = lowered.get(column.lower())
+        parts.append(name if value is None else f"{name} {value}")
+    return ", ".join(parts)
+
+
+def describe_error(connection, error, params=None):
+    """
+    Turns a unique key or foreign key violation into a message naming the
+    table and key values involved (values are taken from `params`, the
+    statement's binds). Any other error's own message is returned.
+    """
+    match = CONSTRAINT_PATTERN.search(error.message)
+    if error.code not in (UNIQUE_VIOLATED, PARENT_KEY_MISSING, CHILD_RECORD_FOUND) or match is None:
+        return error.message
+    try:
+        definition = _definitions(connection).get(match.group(1).upper())
+    except cx_Oracle.DatabaseError:
+        definition = None
+    if definition is None:
+        return error.message
+    kind, table, parent, columns = definition
+    keys = _describe_columns(columns, params)
+    if error.code == UNIQUE_VIOLATED:
+        return f"{table_label(table)} already has a row with {keys}."
+    if error.code == PARENT_KEY_MISSING:
+        return f"{keys} does not exist in {table_label(parent)}."
+    return f"{table_label(table)} rows still refer to this record ({keys}); remove or reassign them first."